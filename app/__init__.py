@@ -30,7 +30,8 @@ app.config.from_object(Config)
 db = SQLAlchemy(app)
 migrate = Migrate(app, db)
 
-from app import routes, result_model, errors, generated_circuit_model
+from app import routes, result_model, errors, generated_circuit_model, transpiled_circuit_model, \
+    compilation_profile_model
 from app.controller import register_blueprints
 from flask_smorest import Api
 
@@ -38,6 +39,7 @@ app.app_context().push()
 app.redis = Redis.from_url(app.config['REDIS_URL'], port=5040)
 app.execute_queue = rq.Queue('pytket-service_execute', connection=app.redis, default_timeout=10000)
 app.implementation_queue = rq.Queue('pytket-service_implementation_exe', connection=app.redis, default_timeout=10000)
+app.transpile_queue = rq.Queue('pytket-service_transpile', connection=app.redis, default_timeout=10000)
 app.logger.setLevel(logging.INFO)
 
 api = Api(app)
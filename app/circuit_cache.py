@@ -0,0 +1,181 @@
+# ******************************************************************************
+#  Copyright (c) 2026 University of Stuttgart
+#
+#  See the NOTICE file(s) distributed with this work for additional
+#  information regarding copyright ownership.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# ******************************************************************************
+
+import hashlib
+import json
+import time
+
+from qiskit import QuantumCircuit
+from qiskit.qasm2 import dumps
+from redis.exceptions import RedisError
+
+from app import app
+from app.circuit_serialisation import dumps_circuit, loads_circuit
+from app.tket_handler import is_tk_circuit
+
+
+class RedisLRUCache:
+    """
+    Size-bounded cache stored in Redis, so that it is shared by all gunicorn and rq worker processes.
+    Every entry expires after the configured TTL, and the least recently used entries are evicted
+    as soon as the cache holds more than max_entries entries.
+    """
+
+    def __init__(self, namespace, max_entries, ttl):
+        self.namespace = namespace
+        self.max_entries = max_entries
+        self.ttl = ttl
+
+    @property
+    def enabled(self):
+        return self.max_entries > 0
+
+    def _entry_key(self, key):
+        return f"pytket-service:{self.namespace}:{key}"
+
+    def _index_key(self):
+        return f"pytket-service:{self.namespace}:lru"
+
+    def get(self, key):
+        if not self.enabled:
+            return None
+        try:
+            value = app.redis.get(self._entry_key(key))
+            if value is None:
+                app.redis.zrem(self._index_key(), key)
+                return None
+            pipe = app.redis.pipeline()
+            pipe.zadd(self._index_key(), {key: time.time()})
+            pipe.expire(self._entry_key(key), self.ttl)
+            pipe.execute()
+            return value
+        except RedisError as e:
+            app.logger.warning(f"Reading {self.namespace} cache failed: {str(e)}")
+            return None
+
+    def set(self, key, value):
+        if not self.enabled:
+            return
+        try:
+            pipe = app.redis.pipeline()
+            pipe.set(self._entry_key(key), value, ex=self.ttl)
+            pipe.zadd(self._index_key(), {key: time.time()})
+            pipe.execute()
+            self._evict()
+        except RedisError as e:
+            app.logger.warning(f"Writing {self.namespace} cache failed: {str(e)}")
+
+    def _evict(self):
+        excess = app.redis.zcard(self._index_key()) - self.max_entries
+        if excess <= 0:
+            return
+        victims = [v.decode() for v in app.redis.zrange(self._index_key(), 0, excess - 1)]
+        pipe = app.redis.pipeline()
+        pipe.delete(*[self._entry_key(v) for v in victims])
+        pipe.zrem(self._index_key(), *victims)
+        pipe.execute()
+
+
+compiled_circuits = RedisLRUCache('compiled-circuit',
+                                  max_entries=app.config['COMPILED_CIRCUIT_CACHE_SIZE'],
+                                  ttl=app.config['COMPILED_CIRCUIT_CACHE_TTL'])
+generated_circuits = RedisLRUCache('generated-circuit',
+                                   max_entries=app.config['GENERATED_CIRCUIT_CACHE_SIZE'],
+                                   ttl=app.config['GENERATED_CIRCUIT_CACHE_TTL'])
+
+
+def get_circuit_fingerprint(circuit):
+    """
+    Get a canonical hash of the given (not yet compiled) circuit.
+    :param circuit: a pytket, Qiskit, or pyQuil circuit
+    :return: the hex digest, or None if the circuit can not be serialised canonically
+    """
+
+    if is_tk_circuit(circuit):
+        serialised = json.dumps(circuit.to_dict(), sort_keys=True)
+    elif isinstance(circuit, QuantumCircuit):
+        try:
+            serialised = dumps(circuit)
+        except Exception:
+            return None
+    else:
+        # pyQuil programs are identified by their Quil code
+        serialised = str(circuit)
+
+    return hashlib.sha256(serialised.encode()).hexdigest()
+
+
+def get_calibration_version(backend):
+    """
+    Get a version stamp of the device characterisation the backend compiles against,
+    i.e., it changes whenever the architecture, gate set, or gate errors change.
+    :param backend:
+    :return:
+    """
+
+    backend_info = backend.backend_info
+    if backend_info is None:
+        return ""
+    serialised = json.dumps(backend_info.to_dict(), sort_keys=True, default=str)
+    return hashlib.sha256(serialised.encode()).hexdigest()
+
+
+def get_compiled_circuit_key(circuit_fingerprint, provider, qpu_name, optimisation_level, calibration_version):
+    key = f"{circuit_fingerprint}|{provider.lower()}|{qpu_name}|{optimisation_level}|{calibration_version}"
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+def get_compiled_circuit_response(key):
+    cached = compiled_circuits.get(key)
+    if cached is None:
+        return None
+    return json.loads(cached)
+
+
+def store_compiled_circuit_response(key, response):
+    compiled_circuits.set(key, json.dumps(response))
+
+
+def get_generated_circuit_key(implementation, input_params):
+    """
+    Get the key of the circuit generated by the given implementation code for the given input parameters.
+    :param implementation: the source code of the implementation
+    :param input_params: the typed input parameters
+    :return:
+    """
+
+    implementation_hash = hashlib.sha256(implementation.encode()).hexdigest()
+    canonical_input_params = json.dumps(input_params, sort_keys=True, default=str)
+    return hashlib.sha256(f"{implementation_hash}|{canonical_input_params}".encode()).hexdigest()
+
+
+def get_generated_circuit(key):
+    cached = generated_circuits.get(key)
+    if cached is None:
+        return None
+    return loads_circuit(cached)
+
+
+def store_generated_circuit(key, circuit):
+    try:
+        serialised_circuit = dumps_circuit(circuit)
+    except Exception as e:
+        app.logger.info(f"Generated circuit can not be cached: {str(e)}")
+        return
+    generated_circuits.set(key, serialised_circuit)
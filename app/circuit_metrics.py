@@ -0,0 +1,147 @@
+# ******************************************************************************
+#  Copyright (c) 2026 University of Stuttgart
+#
+#  See the NOTICE file(s) distributed with this work for additional
+#  information regarding copyright ownership.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# ******************************************************************************
+
+from collections import Counter
+
+from pytket.circuit import OpType
+
+# Operation types counted as multi-qubit gates
+MULTI_QUBIT_OP_TYPES = frozenset({OpType.CX,
+                                  OpType.CY,
+                                  OpType.CZ,
+                                  OpType.CH,
+                                  OpType.CV,
+                                  OpType.CVdg,
+                                  OpType.CRx,
+                                  OpType.CRy,
+                                  OpType.CRz,
+                                  OpType.CU1,
+                                  OpType.CU3,
+                                  OpType.CCX,
+                                  OpType.ECR,
+                                  OpType.SWAP,
+                                  OpType.CSWAP,
+                                  OpType.BRIDGE,
+                                  OpType.Unitary2qBox,
+                                  OpType.Unitary3qBox,
+                                  OpType.ExpBox,
+                                  OpType.QControlBox,
+                                  OpType.ISWAP,
+                                  OpType.PhasedISWAP,
+                                  OpType.XXPhase,
+                                  OpType.YYPhase,
+                                  OpType.CnRy,
+                                  OpType.CnX,
+                                  OpType.ZZMax,
+                                  OpType.ESWAP,
+                                  OpType.FSim,
+                                  OpType.ISWAPMax})
+
+
+class CircuitMetrics:
+    def __init__(self, width, depth, multi_qubit_gate_depth, total_number_of_operations, number_of_multi_qubit_gates,
+                 number_of_measurement_operations, number_of_gates_by_arity, gate_histogram):
+        self.width = width
+        self.depth = depth
+        self.multi_qubit_gate_depth = multi_qubit_gate_depth
+        self.total_number_of_operations = total_number_of_operations
+        self.number_of_multi_qubit_gates = number_of_multi_qubit_gates
+        self.number_of_measurement_operations = number_of_measurement_operations
+        self.number_of_gates_by_arity = number_of_gates_by_arity
+        self.gate_histogram = gate_histogram
+
+    @property
+    def number_of_single_qubit_gates(self):
+        return self.total_number_of_operations - self.number_of_multi_qubit_gates \
+               - self.number_of_measurement_operations
+
+    def to_json(self, prefix=""):
+        return {prefix + 'width': self.width,
+                prefix + 'depth': self.depth,
+                prefix + 'multi-qubit-gate-depth': self.multi_qubit_gate_depth,
+                prefix + 'total-number-of-operations': self.total_number_of_operations,
+                prefix + 'number-of-single-qubit-gates': self.number_of_single_qubit_gates,
+                prefix + 'number-of-multi-qubit-gates': self.number_of_multi_qubit_gates,
+                prefix + 'number-of-measurement-operations': self.number_of_measurement_operations,
+                prefix + 'number-of-gates-by-arity': {str(k): v for k, v in
+                                                      sorted(self.number_of_gates_by_arity.items())},
+                prefix + 'gate-histogram': dict(self.gate_histogram)}
+
+
+def analyze_circuit(circuit):
+    """
+    Get the metrics of a tket circuit with a single walk over its commands.
+    The depths are computed like circuit.depth_by_type, i.e., as the longest path through the circuit counting
+    only the operations of interest, where barriers are not counted for the depth (Qiskit style) and only the
+    multi-qubit gates are counted for the multi-qubit gate depth.
+    :param circuit:
+    :return: the CircuitMetrics of the circuit
+    """
+
+    unit_indices = {unit: index for index, unit in enumerate(circuit.qubits + circuit.bits)}
+    # depth frontier per unit after the last operation writing it, for both depths
+    written_depth = [0] * len(unit_indices)
+    written_multi_qubit_gate_depth = [0] * len(unit_indices)
+    # depth frontier per bit after the last operation only reading it as condition, for both depths
+    read_depth = [0] * len(unit_indices)
+    read_multi_qubit_gate_depth = [0] * len(unit_indices)
+
+    gate_histogram = Counter()
+    number_of_gates_by_arity = Counter()
+    number_of_multi_qubit_gates = 0
+
+    for command in circuit.get_commands():
+        op = command.op
+        op_type = op.type
+        indices = [unit_indices[unit] for unit in command.args]
+
+        # condition bits are only read, so conditional operations on the same bits may run in parallel
+        number_of_read_units = op.width if op_type == OpType.Conditional else 0
+        read_indices = indices[:number_of_read_units]
+        written_indices = indices[number_of_read_units:]
+
+        depth = max([written_depth[i] for i in indices] + [read_depth[i] for i in written_indices])
+        multi_qubit_gate_depth = max([written_multi_qubit_gate_depth[i] for i in indices]
+                                     + [read_multi_qubit_gate_depth[i] for i in written_indices])
+
+        gate_histogram[op_type.name] += 1
+        if op_type != OpType.Barrier:
+            depth += 1
+            if op_type != OpType.Measure:
+                number_of_gates_by_arity[len(command.qubits)] += 1
+        if op_type in MULTI_QUBIT_OP_TYPES:
+            multi_qubit_gate_depth += 1
+            number_of_multi_qubit_gates += 1
+
+        for i in written_indices:
+            written_depth[i] = depth
+            written_multi_qubit_gate_depth[i] = multi_qubit_gate_depth
+        for i in read_indices:
+            read_depth[i] = max(read_depth[i], depth)
+            read_multi_qubit_gate_depth[i] = max(read_multi_qubit_gate_depth[i], multi_qubit_gate_depth)
+
+    return CircuitMetrics(width=circuit.n_qubits,
+                          depth=max(written_depth + read_depth, default=0),
+                          multi_qubit_gate_depth=max(written_multi_qubit_gate_depth + read_multi_qubit_gate_depth,
+                                                     default=0),
+                          total_number_of_operations=sum(gate_histogram.values()),
+                          number_of_multi_qubit_gates=number_of_multi_qubit_gates,
+                          number_of_measurement_operations=gate_histogram[OpType.Measure.name],
+                          number_of_gates_by_arity=number_of_gates_by_arity,
+                          gate_histogram=gate_histogram)
@@ -0,0 +1,71 @@
+# ******************************************************************************
+#  Copyright (c) 2026 University of Stuttgart
+#
+#  See the NOTICE file(s) distributed with this work for additional
+#  information regarding copyright ownership.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# ******************************************************************************
+
+import base64
+import io
+import json
+
+from pyquil import Program as PyQuilProgram
+from pytket import Circuit as TKCircuit
+from qiskit import QuantumCircuit, qpy
+
+
+def serialise_circuit(circuit):
+    """
+    Serialise the circuit in the native format of its SDK, i.e., QPY for Qiskit, Quil for pyQuil, and JSON for tket.
+    :param circuit:
+    :return: a (format, data) pair that can be pickled or stored as JSON
+    """
+
+    if isinstance(circuit, QuantumCircuit):
+        buffer = io.BytesIO()
+        qpy.dump(circuit, buffer)
+        return 'qpy', buffer.getvalue()
+    if isinstance(circuit, PyQuilProgram):
+        return 'quil', str(circuit)
+    if isinstance(circuit, TKCircuit):
+        return 'tket', circuit.to_dict()
+    raise TypeError(f"Circuits of type {type(circuit).__name__} can not be serialised")
+
+
+def deserialise_circuit(serialised_circuit):
+    circuit_format, data = serialised_circuit
+    if circuit_format == 'qpy':
+        return qpy.load(io.BytesIO(data))[0]
+    if circuit_format == 'quil':
+        return PyQuilProgram(data)
+    if circuit_format == 'tket':
+        return TKCircuit.from_dict(data)
+    raise ValueError(f"Unknown circuit format {circuit_format}")
+
+
+def dumps_circuit(circuit):
+    """Serialise the circuit in the native format of its SDK into a JSON string."""
+    circuit_format, data = serialise_circuit(circuit)
+    if circuit_format == 'qpy':
+        data = base64.b64encode(data).decode()
+    return json.dumps({'format': circuit_format, 'data': data})
+
+
+def loads_circuit(serialised_circuit):
+    serialised_circuit = json.loads(serialised_circuit)
+    data = serialised_circuit['data']
+    if serialised_circuit['format'] == 'qpy':
+        data = base64.b64decode(data)
+    return deserialise_circuit((serialised_circuit['format'], data))
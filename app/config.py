@@ -18,6 +18,7 @@
 # ******************************************************************************
 
 import os
+import tempfile
 
 basedir = os.path.join(os.path.abspath(os.path.dirname(__file__)), "data")
 
@@ -28,6 +29,100 @@ class Config(object):
 
     REDIS_URL = os.environ.get('REDIS_URL') or 'redis://localhost:5040'
 
+    # Seconds after which the backends pooled per process are recreated to refresh their device characterisation,
+    # and the number of backends pooled per process
+    BACKEND_POOL_TTL = int(os.environ.get('BACKEND_POOL_TTL') or 3600)
+    BACKEND_POOL_SIZE = int(os.environ.get('BACKEND_POOL_SIZE') or 32)
+
+    # Compiled circuits are cached in Redis, bounded by the number of entries and their lifetime in seconds
+    COMPILED_CIRCUIT_CACHE_SIZE = int(os.environ.get('COMPILED_CIRCUIT_CACHE_SIZE') or 1000)
+    COMPILED_CIRCUIT_CACHE_TTL = int(os.environ.get('COMPILED_CIRCUIT_CACHE_TTL') or 86400)
+
+    # The conversion path (direct or precompiled) that succeeded for a circuit is remembered in Redis
+    CONVERSION_STRATEGY_CACHE_SIZE = int(os.environ.get('CONVERSION_STRATEGY_CACHE_SIZE') or 10000)
+    CONVERSION_STRATEGY_CACHE_TTL = int(os.environ.get('CONVERSION_STRATEGY_CACHE_TTL') or 604800)
+    # Run both conversion paths in parallel for circuits that were not converted before
+    SPECULATIVE_CONVERSION = (os.environ.get('SPECULATIVE_CONVERSION') or 'false').lower() == 'true'
+
+    # Device metadata snapshots of remote QPUs are shared in Redis, refreshed once older than the refresh interval
+    # and ignored once older than the max age (0: create every backend from the provider API)
+    DEVICE_METADATA_REFRESH_INTERVAL = int(os.environ.get('DEVICE_METADATA_REFRESH_INTERVAL') or 900)
+    DEVICE_METADATA_MAX_AGE = int(os.environ.get('DEVICE_METADATA_MAX_AGE') or 86400)
+    # Refresh the snapshots in a background thread instead of the request, only for long-lived processes
+    DEVICE_METADATA_BACKGROUND_REFRESH = (os.environ.get('DEVICE_METADATA_BACKGROUND_REFRESH') or
+                                          'false').lower() == 'true'
+
+    # User implementations are executed in a pool of pre-forked sandbox processes (0: in the calling process), each
+    # limited in CPU seconds per job and address space in bytes (0: no limit), and replaced after max jobs or
+    # once exceeding max RSS bytes
+    SANDBOX_POOL_SIZE = int(os.environ.get('SANDBOX_POOL_SIZE') or 0)
+    SANDBOX_CPU_TIME = int(os.environ.get('SANDBOX_CPU_TIME') or 300)
+    SANDBOX_MEMORY_LIMIT = int(os.environ.get('SANDBOX_MEMORY_LIMIT') or 8 * 1024 * 1024 * 1024)
+    SANDBOX_TIMEOUT = float(os.environ.get('SANDBOX_TIMEOUT') or 600)
+    SANDBOX_MAX_JOBS = int(os.environ.get('SANDBOX_MAX_JOBS') or 100)
+    SANDBOX_MAX_RSS = int(os.environ.get('SANDBOX_MAX_RSS') or 1024 * 1024 * 1024)
+
+    # Number of compiled implementations kept in memory per process
+    COMPILED_IMPLEMENTATION_CACHE_SIZE = int(os.environ.get('COMPILED_IMPLEMENTATION_CACHE_SIZE') or 256)
+
+    # Number of parsed OpenQASM circuits kept in memory per process
+    QASM_PARSE_CACHE_SIZE = int(os.environ.get('QASM_PARSE_CACHE_SIZE') or 32)
+
+    # Implementations are downloaded via a keep-alive connection pool per process, with timeouts in seconds and
+    # retries with exponential backoff
+    DOWNLOAD_POOL_SIZE = int(os.environ.get('DOWNLOAD_POOL_SIZE') or 10)
+    DOWNLOAD_CONNECT_TIMEOUT = float(os.environ.get('DOWNLOAD_CONNECT_TIMEOUT') or 5)
+    DOWNLOAD_READ_TIMEOUT = float(os.environ.get('DOWNLOAD_READ_TIMEOUT') or 30)
+    DOWNLOAD_RETRIES = int(os.environ.get('DOWNLOAD_RETRIES') or 3)
+    DOWNLOAD_BACKOFF_FACTOR = float(os.environ.get('DOWNLOAD_BACKOFF_FACTOR') or 0.5)
+
+    # Implementations downloaded via URL are cached on disk, bounded by the total size in bytes (0: no cache), and
+    # revalidated with conditional requests unless they were validated within the max age in seconds
+    DOWNLOAD_CACHE_DIR = os.environ.get('DOWNLOAD_CACHE_DIR') or os.path.join(tempfile.gettempdir(),
+                                                                              'pytket-service-downloads')
+    DOWNLOAD_CACHE_SIZE = int(os.environ.get('DOWNLOAD_CACHE_SIZE') or 100 * 1024 * 1024)
+    DOWNLOAD_CACHE_MAX_AGE = int(os.environ.get('DOWNLOAD_CACHE_MAX_AGE') or 0)
+
+    # Circuits generated by implementations are cached in Redis per implementation code and input parameters
+    GENERATED_CIRCUIT_CACHE_SIZE = int(os.environ.get('GENERATED_CIRCUIT_CACHE_SIZE') or 1000)
+    GENERATED_CIRCUIT_CACHE_TTL = int(os.environ.get('GENERATED_CIRCUIT_CACHE_TTL') or 86400)
+
+    # Seconds until the status of a job submitted to a remote backend is polled for the first time,
+    # doubling with every poll up to the maximum interval (0: block the worker until the result is available)
+    RESULT_POLL_INTERVAL = int(os.environ.get('RESULT_POLL_INTERVAL') or 15)
+    RESULT_POLL_MAX_INTERVAL = int(os.environ.get('RESULT_POLL_MAX_INTERVAL') or 600)
+
+    # Maximum number of processes simulating the shots of a circuit on a local simulator concurrently,
+    # used for circuits with at least SIMULATION_SHARD_MIN_QUBITS qubits and SIMULATION_SHARD_MIN_SHOTS shots per shard
+    SIMULATION_SHARDS = int(os.environ.get('SIMULATION_SHARDS') or os.cpu_count() or 1)
+    SIMULATION_SHARD_MIN_QUBITS = int(os.environ.get('SIMULATION_SHARD_MIN_QUBITS') or 10)
+    SIMULATION_SHARD_MIN_SHOTS = int(os.environ.get('SIMULATION_SHARD_MIN_SHOTS') or 128)
+
+    # Bytes of memory a local simulation may use (0: 80% of the memory available when it starts), and the number of
+    # qubits from which the matrix product state method is used instead of the statevector method if it needs less
+    SIMULATION_MEMORY_LIMIT = int(os.environ.get('SIMULATION_MEMORY_LIMIT') or 0)
+    SIMULATION_MPS_MIN_QUBITS = int(os.environ.get('SIMULATION_MPS_MIN_QUBITS') or 20)
+
+    # Seconds an execution accepts identical execute requests with "coalesce" set, which share its result
+    EXECUTION_COALESCING_TTL = int(os.environ.get('EXECUTION_COALESCING_TTL') or 10000)
+
+    # Weights of the execute queues per backend class and priority, multiplied to get the share of a queue
+    # that the workers of app.worker dequeue from first
+    EXECUTE_QUEUE_WEIGHTS = os.environ.get('EXECUTE_QUEUE_WEIGHTS') or 'local-simulator=6,remote-simulator=3,qpu=1'
+    EXECUTE_PRIORITY_WEIGHTS = os.environ.get('EXECUTE_PRIORITY_WEIGHTS') or 'high=4,normal=1'
+
+    # Worker processes generating the circuits of one parameter sweep in parallel
+    GENERATE_SWEEP_PROCESSES = int(os.environ.get('GENERATE_SWEEP_PROCESSES') or os.cpu_count() or 1)
+
+    # Default seconds granted to a tket compilation including its optimisation level fallbacks (0: no limit)
+    COMPILE_TIMEOUT = float(os.environ.get('COMPILE_TIMEOUT') or 0)
+
+    # Number of processes used to compile the circuits of a batch transpile request
+    TRANSPILE_BATCH_PROCESSES = int(os.environ.get('TRANSPILE_BATCH_PROCESSES') or os.cpu_count())
+
+    # Number of processes used to prepare and compile the circuits of a batch execution request
+    EXECUTE_BATCH_PROCESSES = int(os.environ.get('EXECUTE_BATCH_PROCESSES') or os.cpu_count())
+
     API_TITLE = "pytket-service"
     API_VERSION = "0.1"
     OPENAPI_VERSION = "3.0.2"
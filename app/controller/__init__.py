@@ -1,7 +1,9 @@
-from app.controller import transpile, execute, analysis_original_circuit, result, generated_circuit, generate_circuit
+from app.controller import transpile, transpile_batch, execute, analysis_original_circuit, result, generated_circuit, \
+    generate_circuit, generate_circuit_sweep, generated_circuit_sweep, result_batch, queues
 
-MODULES = (transpile, execute, analysis_original_circuit, result,
-           generated_circuit, generate_circuit)
+MODULES = (transpile, transpile_batch, execute, analysis_original_circuit, result,
+           generated_circuit, generate_circuit, generate_circuit_sweep, generated_circuit_sweep,
+           result_batch, queues)
 
 
 def register_blueprints(api):
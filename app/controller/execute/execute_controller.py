@@ -20,7 +20,10 @@ blp = Blueprint(
 @blp.route("/pytket-service/api/v1.0/execute", methods=["POST"])
 @blp.doc(description="*Note*: \"token\" should either be in \"input-params\" or extra. Both variants are combined "
                      "here for illustration purposes. *Note*: \"url\", \"hub\", \"group\", \"project\" are optional "
-                     "such that otherwise the standard values are used.")
+                     "such that otherwise the standard values are used. *Note*: with \"coalesce\": true, a request "
+                     "identical to one still executing shares its result instead of sampling again, and \"seed\" "
+                     "makes the sampling of local simulators reproducible. *Note*: \"priority\" is either \"normal\" "
+                     "(default) or \"high\".")
 @blp.arguments(
     ExecuteRequestSchema,
     description='''\
@@ -32,6 +35,8 @@ blp = Blueprint(
                     \"transpiled-qasm\":\"TRANSPILED-QASM-STRING\" 
                 for Batch Execution of multiple circuits use:
                     \"impl-url\": [\"URL-OF-IMPLEMENTATION-1\", \"URL-OF-IMPLEMENTATION-2\"]
+                or lists of \"impl-data\" or \"transpiled-qasm\" accordingly. All circuits of a batch are submitted 
+                to the QPU together, and the returned content location provides all their results.
                 the \"input-params\"are of the form:
                     \"input-params\": {
                         \"PARAM-NAME-1\": {
@@ -0,0 +1 @@
+from app.controller.generate_circuit_sweep.generate_circuit_sweep_controller import blp
@@ -0,0 +1,37 @@
+from flask_smorest import Blueprint
+
+from app import routes
+from app.model.algorithm_request import (GenerateCircuitSweepRequest, GenerateCircuitSweepRequestSchema)
+from app.model.circuit_response import (GenerateCircuitResponseSchema)
+
+blp = Blueprint("Generate Circuit Sweep", __name__, description="Send an implementation and a list of input parameter "
+                                                                "sets to the API to generate all circuit variants and "
+                                                                "get their properties.", )
+
+
+@blp.route("/pytket-service/api/v1.0/generate-circuit-sweep", methods=["POST"])
+@blp.arguments(GenerateCircuitSweepRequestSchema, description='''\
+                Generation via URL:
+                    \"impl-url\": \"URL-OF-IMPLEMENTATION\" 
+                Generation via data:
+                    \"impl-data\": \"BASE64-ENCODED-IMPLEMENTATION\"
+                the \"input-params\" are a list of input parameter sets, one per circuit to generate:
+                    \"input-params\": [
+                        {
+                            \"PARAM-NAME-1\": {
+                                \"rawValue\": \"YOUR-VALUE-1\",
+                                \"type\": \"Integer\"
+                            },
+                            ...
+                        },
+                        ...
+                    ]
+                        ''', example={
+    "impl-url": "https://raw.githubusercontent.com/UST-QuAntiL/nisq-analyzer-content/master/example-implementations"
+                "/Grover-SAT/grover-fix-sat-qiskit.py", "impl-language": "qiskit", "input-params": [{}]})
+@blp.response(200, GenerateCircuitResponseSchema,
+              description="Returns a content location for all generated circuits of the sweep and their properties. "
+                          "Access it via GET")
+def encoding(json: GenerateCircuitSweepRequest):
+    if json:
+        return routes.generate_circuit_sweep()
@@ -0,0 +1 @@
+from app.controller.generated_circuit_sweep.generated_circuit_sweep_controller import blp
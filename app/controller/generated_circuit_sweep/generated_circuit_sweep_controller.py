@@ -0,0 +1,13 @@
+from flask_smorest import Blueprint
+
+from app.model.circuit_response import (GeneratedCircuitSweepResponseSchema)
+
+blp = Blueprint("Generated Circuit Sweeps", __name__, description="Request all generated circuits of a parameter sweep "
+                                                                  "and their properties.", )
+
+
+@blp.route("/pytket-service/api/v1.0/generated-circuit-sweeps/<id>", methods=["GET"])
+@blp.response(200, GeneratedCircuitSweepResponseSchema)
+def encoding(json):
+    if json:
+        return
@@ -0,0 +1 @@
+from app.controller.queues.queues_controller import blp
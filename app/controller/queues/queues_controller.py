@@ -0,0 +1,13 @@
+from flask_smorest import Blueprint
+
+from app.model.circuit_response import (QueuesResponseSchema)
+
+blp = Blueprint("Queues", __name__, description="Get the number of waiting jobs, the wait time of the oldest one, and "
+                                                "the number of workers of every job queue.", )
+
+
+@blp.route("/pytket-service/api/v1.0/queues", methods=["GET"])
+@blp.response(200, QueuesResponseSchema)
+def encoding(json):
+    if json:
+        return
@@ -0,0 +1 @@
+from app.controller.result_batch.result_batch_controller import blp
@@ -0,0 +1,12 @@
+from flask_smorest import Blueprint
+
+from app.model.circuit_response import (ResultBatchResponseSchema)
+
+blp = Blueprint("Result Batches", __name__, description="Get execution results of all circuits of a batch execution.", )
+
+
+@blp.route("/pytket-service/api/v1.0/result-batches/<id>", methods=["GET"])
+@blp.response(200, ResultBatchResponseSchema)
+def encoding(json):
+    if json:
+        return
@@ -29,6 +29,22 @@ blp = Blueprint(
                     \"impl-data\": \"BASE64-ENCODED-IMPLEMENTATION\"
                 Transpile via OpenQASM-String
                     \"qasm-string\": \"OpenQASM String\"
+                Transpile asynchronously in the worker queue, returning a content location for the result:
+                    \"async\": true
+                Optionally choose the tket optimisation level (0-2, default 2) and the seconds granted to the
+                compilation; each level leaves half of the remaining time to the fallback to the next lower one, and
+                the used level is returned as \"optimisation-level\":
+                    \"optimisation-level\": 2,
+                    \"compile-timeout\": 60
+                Alternatively compile with a portfolio of strategies (all optimisation levels and, for devices with a
+                connectivity graph, line and graph placement) in parallel and keep the circuit with the fewest
+                multi-qubit gates or the lowest depth; the selected \"strategy\" and the metrics of every candidate
+                are returned as \"portfolio\", and \"compile-timeout\" bounds the whole portfolio:
+                    \"portfolio\": true,
+                    \"portfolio-objective\": \"multi-qubit-gates\" | \"depth\"
+                Profile the compilation pass by pass; the wall time, number of gates, and depth after each pass are
+                returned as \"compilation-profile\" and stored under /pytket-service/api/v1.0/compilation-profiles:
+                    \"profile\": true
                 the \"input-params\"are of the form:
                     \"input-params\": {
                         \"PARAM-NAME-1\": {
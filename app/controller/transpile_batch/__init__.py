@@ -0,0 +1 @@
+from app.controller.transpile_batch.transpile_batch_controller import blp
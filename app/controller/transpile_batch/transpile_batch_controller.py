@@ -0,0 +1,63 @@
+from flask_smorest import Blueprint
+
+from app import routes
+from app.model.circuit_response import (
+    TranspileBatchResponseSchema,
+)
+from app.model.algorithm_request import (
+    TranspileBatchRequestSchema,
+    TranspileBatchRequest,
+)
+
+blp = Blueprint(
+    "Transpile Batch",
+    __name__,
+    description="Send a list of implementations and a list of target QPUs to the API to get the analyzed properties "
+                "of every implementation transpiled for every QPU.",
+)
+
+
+@blp.route("/pytket-service/api/v1.0/transpile-batch", methods=["POST"])
+@blp.doc(description="*Note*: The credentials of the providers are taken from the \"input-params\" of each "
+                     "implementation. Failures, e.g., too many qubits required, are reported per result.")
+@blp.arguments(
+    TranspileBatchRequestSchema,
+    description='''\
+                Every implementation is specified like for a single transpilation:
+                    \"implementations\": [
+                        {
+                            \"impl-url\": \"URL-OF-IMPLEMENTATION\",
+                            \"impl-language\": \"qiskit\",
+                            \"input-params\": {...}
+                        },
+                        {
+                            \"impl-data\": \"BASE64-ENCODED-IMPLEMENTATION\",
+                            \"impl-language\": \"openqasm\",
+                            \"input-params\": {...}
+                        }
+                    ]
+                the targets are pairs of provider and QPU name:
+                    \"targets\": [
+                        {
+                            \"provider\": \"ibmq\",
+                            \"qpu-name\": \"aer_simulator\"
+                        },
+                        ...
+                    ]
+                \"optimisation-level\" and \"compile-timeout\" can be set like for a single transpilation.
+                The \"results\" of the response contain one row per implementation and one entry per target.''',
+    example={
+        "implementations": [{
+            "impl-url": "https://raw.githubusercontent.com/UST-QuAntiL/nisq-analyzer-content/master/"
+                        "example-implementations/Grover-SAT/grover-fix-sat-qiskit.py",
+            "impl-language": "qiskit",
+            "input-params": {"token": {"rawValue": "YOUR-IBMQ-TOKEN", "type": "Unknown"}}
+        }],
+        "targets": [{"provider": "ibmq", "qpu-name": "aer_simulator"}]
+    },
+
+)
+@blp.response(200, TranspileBatchResponseSchema)
+def encoding(json: TranspileBatchRequest):
+    if json:
+        return routes.transpile_batch()
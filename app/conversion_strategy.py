@@ -0,0 +1,105 @@
+# ******************************************************************************
+#  Copyright (c) 2026 University of Stuttgart
+#
+#  See the NOTICE file(s) distributed with this work for additional
+#  information regarding copyright ownership.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# ******************************************************************************
+
+from pytket import Circuit as TKCircuit
+
+from app import app
+from app.circuit_cache import RedisLRUCache, get_circuit_fingerprint
+from app.tket_handler import is_tk_circuit, tket_convert_circuit, start_subprocess, collect_subprocess, \
+    cancel_subprocess, UnsupportedGateException
+
+DIRECT = 'direct'
+PRECOMPILE = 'precompile'
+
+conversion_strategies = RedisLRUCache('conversion-strategy',
+                                      max_entries=app.config['CONVERSION_STRATEGY_CACHE_SIZE'],
+                                      ttl=app.config['CONVERSION_STRATEGY_CACHE_TTL'])
+
+
+def convert_circuit(circuit, impl_language, short_impl_name, logger=None):
+    """
+    Converts the circuit to a tket circuit, either directly or after precompiling it with the standard compiler of
+    its SDK. The path that succeeded is remembered per circuit content, so that circuits that need to be precompiled
+    do not pay for a failed direct conversion on every request. As the direct conversion of the same circuit fails
+    again, the result, and hence its original metrics, do not depend on whether the path was remembered.
+    For circuits converted for the first time, both paths run in parallel if SPECULATIVE_CONVERSION is set.
+    :param circuit:
+    :param impl_language:
+    :param short_impl_name:
+    :param logger:
+    :return: the tket circuit
+    """
+
+    if is_tk_circuit(circuit):
+        return circuit
+
+    # only Qiskit circuits can be precompiled, so there is no choice to remember for the other languages
+    if impl_language.lower() != 'qiskit':
+        return tket_convert_circuit(circuit, impl_language, short_impl_name, logger=logger)
+
+    circuit_fingerprint = get_circuit_fingerprint(circuit)
+    strategy = conversion_strategies.get(circuit_fingerprint) if circuit_fingerprint else None
+    strategy = strategy.decode() if strategy else None
+
+    if strategy is None and app.config['SPECULATIVE_CONVERSION']:
+        return _convert_speculatively(circuit, impl_language, short_impl_name, circuit_fingerprint, logger)
+
+    # try the remembered path first, and the other one if the circuit generated this time requires it
+    strategies = [PRECOMPILE, DIRECT] if strategy == PRECOMPILE else [DIRECT, PRECOMPILE]
+    for index, strategy in enumerate(strategies):
+        try:
+            tk_circuit = tket_convert_circuit(circuit, impl_language, short_impl_name, logger=logger,
+                                              precompile_circuit=strategy == PRECOMPILE)
+        except UnsupportedGateException as e:
+            if logger:
+                logger(f"Unsupported gate ({e.gate}) in implementation {short_impl_name}.")
+            if index == len(strategies) - 1:
+                raise e
+            continue
+
+        _remember_strategy(circuit_fingerprint, strategy)
+        return tk_circuit
+
+
+def _remember_strategy(circuit_fingerprint, strategy):
+    if circuit_fingerprint:
+        conversion_strategies.set(circuit_fingerprint, strategy)
+
+
+def _convert_speculatively(circuit, impl_language, short_impl_name, circuit_fingerprint, logger):
+    """Run the direct and the precompiled conversion in parallel processes and keep the direct result if possible."""
+    handles = {strategy: start_subprocess(
+        lambda precompile_circuit=strategy == PRECOMPILE: tket_convert_circuit(
+            circuit, impl_language, short_impl_name, precompile_circuit=precompile_circuit).to_dict())
+        for strategy in (DIRECT, PRECOMPILE)}
+
+    try:
+        try:
+            tk_circuit = TKCircuit.from_dict(collect_subprocess(handles[DIRECT], None))
+            _remember_strategy(circuit_fingerprint, DIRECT)
+            return tk_circuit
+        except UnsupportedGateException as e:
+            if logger:
+                logger(f"Unsupported gate ({e.gate}) in implementation {short_impl_name}.")
+
+        tk_circuit = TKCircuit.from_dict(collect_subprocess(handles[PRECOMPILE], None))
+        _remember_strategy(circuit_fingerprint, PRECOMPILE)
+        return tk_circuit
+    finally:
+        cancel_subprocess(handles[PRECOMPILE])
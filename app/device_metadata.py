@@ -0,0 +1,195 @@
+# ******************************************************************************
+#  Copyright (c) 2026 University of Stuttgart
+#
+#  See the NOTICE file(s) distributed with this work for additional
+#  information regarding copyright ownership.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# ******************************************************************************
+
+import hashlib
+import json
+import threading
+import time
+
+from pytket.backends.backendinfo import BackendInfo
+from pytket.extensions.qiskit import IBMQBackend
+from pytket.passes import BasePass
+from pytket.predicates import Predicate
+from redis.exceptions import RedisError
+
+from app import app
+
+COMPILATION_LEVELS = range(3)
+
+
+class SnapshotBackend:
+    """
+    Backend hydrated from a device metadata snapshot, providing everything needed to compile circuits for the device
+    without contacting the provider. The actual backend is only created when the snapshot backend is used for
+    anything else, e.g., to execute a circuit.
+    """
+
+    def __init__(self, snapshot, create_backend):
+        self.version = snapshot['version']
+        self.backend_info = BackendInfo.from_dict(snapshot['backend-info'])
+        self.required_predicates = [Predicate.from_dict(predicate) for predicate in snapshot['required-predicates']]
+        self._rebase_pass = BasePass.from_dict(snapshot['rebase-pass'])
+        if snapshot['backend-class'] == IBMQBackend.__name__:
+            # the routing of IBMQ backends can not be serialised, but pytket-qiskit derives it from the backend info
+            self._compilation_passes = {level: IBMQBackend.pass_from_info(self.backend_info, level)
+                                        for level in COMPILATION_LEVELS}
+        else:
+            self._compilation_passes = {int(level): BasePass.from_dict(compilation_pass)
+                                        for level, compilation_pass in snapshot['compilation-passes'].items()}
+        self._create_backend = create_backend
+        self._backend = None
+        self._backend_lock = threading.Lock()
+
+    def default_compilation_pass(self, optimisation_level=2):
+        return self._compilation_passes[optimisation_level]
+
+    def rebase_pass(self):
+        return self._rebase_pass
+
+    def valid_circuit(self, circuit):
+        return all(predicate.verify(circuit) for predicate in self.required_predicates)
+
+    def get_compiled_circuit(self, circuit, optimisation_level=2):
+        compiled_circuit = circuit.copy()
+        self.default_compilation_pass(optimisation_level).apply(compiled_circuit)
+        return compiled_circuit
+
+    @property
+    def backend(self):
+        with self._backend_lock:
+            if self._backend is None:
+                self._backend = self._create_backend()
+            return self._backend
+
+    def __getattr__(self, name):
+        # only called for attributes the snapshot does not provide
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self.backend, name)
+
+
+def get_snapshot_backend(provider, qpu_name, create_backend):
+    """
+    Get the backend for the given QPU hydrated from its device metadata snapshot in Redis.
+    If there is no recent enough snapshot, the backend is created and its snapshot is stored for the other processes.
+    Snapshots older than the refresh interval are still used, but refreshed in the background.
+    :param provider:
+    :param qpu_name:
+    :param create_backend: function creating the actual backend
+    :return: the snapshot backend, or the actual backend if there was no snapshot
+    """
+
+    snapshot = load_snapshot(provider, qpu_name)
+    if snapshot is not None:
+        age = time.time() - snapshot['created']
+        if age < app.config['DEVICE_METADATA_MAX_AGE']:
+            if age > app.config['DEVICE_METADATA_REFRESH_INTERVAL']:
+                refresh_snapshot(provider, qpu_name, create_backend)
+            try:
+                return SnapshotBackend(snapshot, create_backend)
+            except Exception as e:
+                app.logger.warning(f"Hydrating {qpu_name} from its device metadata snapshot failed: {str(e)}")
+
+    backend = create_backend()
+    if backend is not None:
+        store_snapshot(provider, qpu_name, backend)
+    return backend
+
+
+def get_snapshot(backend):
+    """
+    Serialise the device metadata the backend compiles against.
+    :param backend:
+    :return: the snapshot, or None if the compilation passes of the backend can not be serialised
+    """
+
+    backend_class = type(backend).__name__
+    snapshot = {'backend-class': backend_class,
+                'backend-info': backend.backend_info.to_dict(),
+                'required-predicates': [predicate.to_dict() for predicate in backend.required_predicates]}
+    try:
+        snapshot['rebase-pass'] = backend.rebase_pass().to_dict()
+        if backend_class != IBMQBackend.__name__:
+            snapshot['compilation-passes'] = {level: backend.default_compilation_pass(level).to_dict()
+                                              for level in COMPILATION_LEVELS}
+    except RuntimeError as e:
+        # e.g., custom passes without a serialisation
+        app.logger.info(f"Device metadata of {backend_class} can not be serialised: {str(e)}")
+        return None
+
+    serialised = json.dumps(snapshot, sort_keys=True, default=str)
+    snapshot['version'] = hashlib.sha256(serialised.encode()).hexdigest()
+    snapshot['created'] = time.time()
+    return snapshot
+
+
+def store_snapshot(provider, qpu_name, backend):
+    if backend.backend_info is None:
+        return
+    snapshot = get_snapshot(backend)
+    if snapshot is None:
+        return
+    try:
+        app.redis.set(_snapshot_key(provider, qpu_name), json.dumps(snapshot, default=str))
+    except RedisError as e:
+        app.logger.warning(f"Storing the device metadata of {qpu_name} failed: {str(e)}")
+
+
+def load_snapshot(provider, qpu_name):
+    try:
+        serialised = app.redis.get(_snapshot_key(provider, qpu_name))
+    except RedisError as e:
+        app.logger.warning(f"Loading the device metadata of {qpu_name} failed: {str(e)}")
+        return None
+    return json.loads(serialised) if serialised else None
+
+
+def refresh_snapshot(provider, qpu_name, create_backend):
+    """
+    Recreate the backend and store its snapshot, at most once per refresh interval across all processes.
+    The snapshot is refreshed in a background thread if enabled for long-lived processes, and in the calling process
+    otherwise, as e.g. rq work horses exit right after their job and would lose the refresh.
+    """
+
+    try:
+        acquired = app.redis.set(_snapshot_key(provider, qpu_name) + ':refresh', 1, nx=True,
+                                 ex=app.config['DEVICE_METADATA_REFRESH_INTERVAL'])
+    except RedisError:
+        return
+    if not acquired:
+        # another process is already refreshing the snapshot
+        return
+
+    if app.config['DEVICE_METADATA_BACKGROUND_REFRESH']:
+        threading.Thread(target=_refresh_snapshot, args=(provider, qpu_name, create_backend), daemon=True).start()
+    else:
+        _refresh_snapshot(provider, qpu_name, create_backend)
+
+
+def _refresh_snapshot(provider, qpu_name, create_backend):
+    try:
+        backend = create_backend()
+        if backend is not None:
+            store_snapshot(provider, qpu_name, backend)
+    except Exception as e:
+        app.logger.warning(f"Refreshing the device metadata of {qpu_name} failed: {str(e)}")
+
+
+def _snapshot_key(provider, qpu_name):
+    return f"pytket-service:device-metadata:{provider.lower()}:{qpu_name}"
@@ -0,0 +1,121 @@
+# ******************************************************************************
+#  Copyright (c) 2026 University of Stuttgart
+#
+#  See the NOTICE file(s) distributed with this work for additional
+#  information regarding copyright ownership.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# ******************************************************************************
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+from app import app
+
+
+class DownloadCache:
+    """
+    Size-bounded cache of downloaded implementations on disk, shared by all processes of a host.
+    Every entry keeps the ETag and Last-Modified header of its response, so that it can be revalidated with a
+    conditional request, and the least recently used entries are evicted once the cache exceeds max_size bytes.
+    """
+
+    def __init__(self, directory, max_size, max_age):
+        self.directory = directory
+        self.max_size = max_size
+        self.max_age = max_age
+
+    @property
+    def enabled(self):
+        return self.max_size > 0
+
+    def get_key(self, url, scope=""):
+        """Get the key of the given URL, where scope identifies the credentials the URL was downloaded with."""
+        return hashlib.sha256(f"{url}|{scope}".encode()).hexdigest()
+
+    def load(self, key):
+        """Get the cached entry, i.e., a dict with the body, etag, last-modified, and fetched time, or None."""
+        if not self.enabled:
+            return None
+        try:
+            with open(self._metadata_path(key)) as f:
+                entry = json.load(f)
+            with open(self._body_path(key), encoding="utf-8") as f:
+                entry['body'] = f.read()
+        except (OSError, ValueError):
+            return None
+        return entry
+
+    def is_fresh(self, entry):
+        """Check if the entry was validated within the max age, so that it can be used without revalidation."""
+        return self.max_age > 0 and time.time() - entry['fetched'] < self.max_age
+
+    def store(self, key, url, body, etag=None, last_modified=None):
+        if not self.enabled or len(body.encode("utf-8")) > self.max_size:
+            return
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            self._write(self._body_path(key), body)
+            self._write(self._metadata_path(key), json.dumps({'url': url, 'etag': etag,
+                                                              'last-modified': last_modified,
+                                                              'fetched': time.time()}))
+            self._evict()
+        except OSError as e:
+            app.logger.warning(f"Caching the download of {url} failed: {str(e)}")
+
+    def revalidated(self, key, entry):
+        """Mark the entry as validated by a 304 response of the server."""
+        self.store(key, entry['url'], entry['body'], entry['etag'], entry['last-modified'])
+
+    def _write(self, path, content):
+        # write to a temporary file first, so that concurrent processes never read partial entries
+        file_descriptor, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(file_descriptor, "w", encoding="utf-8") as f:
+            f.write(content)
+        os.replace(temp_path, path)
+
+    def _evict(self):
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(".body"):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.directory, name))
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, name[:-len(".body")]))
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, key in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            for path in (self._body_path(key), self._metadata_path(key)):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            total_size -= size
+
+    def _body_path(self, key):
+        return os.path.join(self.directory, f"{key}.body")
+
+    def _metadata_path(self, key):
+        return os.path.join(self.directory, f"{key}.json")
+
+
+downloads = DownloadCache(directory=app.config['DOWNLOAD_CACHE_DIR'],
+                          max_size=app.config['DOWNLOAD_CACHE_SIZE'],
+                          max_age=app.config['DOWNLOAD_CACHE_MAX_AGE'])
@@ -0,0 +1,105 @@
+# ******************************************************************************
+#  Copyright (c) 2026 University of Stuttgart
+#
+#  See the NOTICE file(s) distributed with this work for additional
+#  information regarding copyright ownership.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# ******************************************************************************
+
+
+from datetime import datetime, timezone
+
+import rq
+
+from app import app
+from app.tket_handler import is_local_simulator
+
+LOCAL_SIMULATOR = 'local-simulator'
+REMOTE_SIMULATOR = 'remote-simulator'
+QPU = 'qpu'
+BACKEND_CLASSES = [LOCAL_SIMULATOR, REMOTE_SIMULATOR, QPU]
+
+HIGH_PRIORITY = 'high'
+NORMAL_PRIORITY = 'normal'
+PRIORITIES = [HIGH_PRIORITY, NORMAL_PRIORITY]
+
+# on-demand simulators of AWS Braket
+AWS_SIMULATORS = ['SV1', 'TN1', 'DM1']
+
+
+def get_backend_class(provider, qpu_name):
+    """Get the class of the backend, which determines how long its jobs typically take"""
+    if is_local_simulator(provider, qpu_name):
+        return LOCAL_SIMULATOR
+    # Rigetti backends run on the QVM of the service
+    if provider.lower() == "rigetti" or provider.lower() == "aws" and qpu_name in AWS_SIMULATORS:
+        return REMOTE_SIMULATOR
+    return QPU
+
+
+def get_queue_name(backend_class, priority):
+    return f"pytket-service_execute_{backend_class}_{priority}"
+
+
+def get_execute_queue(provider, qpu_name, priority=NORMAL_PRIORITY):
+    """Get the queue for execute jobs of the given backend and priority"""
+    return rq.Queue(get_queue_name(get_backend_class(provider, qpu_name), priority), connection=app.redis,
+                    default_timeout=10000)
+
+
+def get_execute_queues():
+    return [rq.Queue(get_queue_name(backend_class, priority), connection=app.redis, default_timeout=10000)
+            for priority in PRIORITIES for backend_class in BACKEND_CLASSES]
+
+
+def get_service_queues():
+    """Get all queues of the service, i.e., the execute queues and the queues of the other jobs"""
+    return get_execute_queues() + [app.execute_queue, app.transpile_queue, app.implementation_queue]
+
+
+def get_queue_weights():
+    """
+    Get the weight of every execute queue, i.e., the product of the weights of its backend class and its priority.
+    Queues not listed have a weight of 1.
+    """
+
+    class_weights = _parse_weights(app.config['EXECUTE_QUEUE_WEIGHTS'])
+    priority_weights = _parse_weights(app.config['EXECUTE_PRIORITY_WEIGHTS'])
+    return {get_queue_name(backend_class, priority):
+                class_weights.get(backend_class, 1) * priority_weights.get(priority, 1)
+            for backend_class in BACKEND_CLASSES for priority in PRIORITIES}
+
+
+def _parse_weights(weights):
+    """Parse weights of the form name=weight,name=weight"""
+    parsed = {}
+    for entry in filter(None, weights.split(',')):
+        name, weight = entry.split('=')
+        parsed[name.strip()] = float(weight)
+    return parsed
+
+
+def get_queue_statistics(queue):
+    """Get the number of waiting jobs, the seconds the oldest of them waits, and the number of workers of a queue"""
+    wait = 0
+    job_ids = queue.get_job_ids(0, 0)
+    job = queue.fetch_job(job_ids[0]) if job_ids else None
+    if job is not None and job.enqueued_at is not None:
+        enqueued_at = job.enqueued_at
+        if enqueued_at.tzinfo is None:
+            enqueued_at = enqueued_at.replace(tzinfo=timezone.utc)
+        wait = max((datetime.now(timezone.utc) - enqueued_at).total_seconds(), 0)
+
+    return {'name': queue.name, 'depth': queue.count, 'wait': wait,
+            'workers': rq.Worker.count(connection=app.redis, queue=queue)}
@@ -0,0 +1,104 @@
+# ******************************************************************************
+#  Copyright (c) 2026 University of Stuttgart
+#
+#  See the NOTICE file(s) distributed with this work for additional
+#  information regarding copyright ownership.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# ******************************************************************************
+
+
+import hashlib
+import json
+
+from redis.exceptions import RedisError
+from rq.exceptions import NoSuchJobError
+from rq.job import Job, JobStatus
+
+from app import app
+from app.result_model import Result
+
+
+def get_execution_key(**request_fields):
+    """
+    Get the key identifying an execute request by everything that determines its result,
+    i.e., the circuit or implementation and its input parameters, the backend, the shots, and the seed.
+    """
+
+    canonical_request = json.dumps(request_fields, sort_keys=True, default=str)
+    return hashlib.sha256(canonical_request.encode()).hexdigest()
+
+
+def _flight_key(key):
+    return f"pytket-service:execution-flight:{key}"
+
+
+def get_in_flight_result(key, result_id):
+    """
+    Register the result as the in-flight execution of the request, unless an identical request is already in flight.
+    :param key: the key of the request, see get_execution_key
+    :param result_id: the id of the Result the request is executed for if no identical request is in flight
+    :return: the id of the Result of the identical request in flight, or None if the request has to be executed
+    """
+
+    try:
+        for _ in range(2):
+            if app.redis.set(_flight_key(key), result_id, nx=True, ex=app.config['EXECUTION_COALESCING_TTL']):
+                return None
+
+            in_flight_id = app.redis.get(_flight_key(key))
+            if in_flight_id is None:
+                continue
+            in_flight_id = in_flight_id.decode()
+            in_flight_result = Result.query.get(in_flight_id)
+            completed = in_flight_result is not None and in_flight_result.complete
+            if not completed and not _is_dead(in_flight_id, in_flight_result):
+                return in_flight_id
+
+            # the execution finished or died, so the request is executed again
+            _delete_if_unchanged(key, in_flight_id)
+    except RedisError as e:
+        app.logger.warning(f"Coalescing execute request failed: {str(e)}")
+    return None
+
+
+def release_in_flight_result(key, result_id):
+    """Remove the registration of the result if its request failed before the Result was created."""
+    try:
+        _delete_if_unchanged(key, result_id)
+    except RedisError as e:
+        app.logger.warning(f"Releasing coalesced execute request failed: {str(e)}")
+
+
+def _is_dead(result_id, result):
+    """Check whether the job of the incomplete result failed or vanished, so that it will never complete."""
+    try:
+        status = Job.fetch(result_id, connection=app.redis).get_status()
+    except NoSuchJobError:
+        # the Result is created right after the job is enqueued, so without both the request failed in between,
+        # and jobs handing their result over to the poller may expire before the result completes
+        return result is None or result.job_handle is None
+    return status in (JobStatus.FAILED, JobStatus.STOPPED, JobStatus.CANCELED)
+
+
+def _delete_if_unchanged(key, value):
+    pipe = app.redis.pipeline()
+    try:
+        pipe.watch(_flight_key(key))
+        current = pipe.get(_flight_key(key))
+        if current is not None and current.decode() == value:
+            pipe.multi()
+            pipe.delete(_flight_key(key))
+            pipe.execute()
+    finally:
+        pipe.reset()
@@ -32,6 +32,8 @@ class Generated_Circuit(db.Model):
     original_number_of_single_qubit_gates = db.Column(db.Integer)
     original_multi_qubit_gate_depth = db.Column(db.Integer)
     complete = db.Column(db.Boolean, default=False)
+    sweep_id = db.Column(db.String(36), index=True)
+    sweep_index = db.Column(db.Integer)
 
     def __repr__(self):
         return 'Generated_Circuit {}'.format(self.generated_circuit)
@@ -17,18 +17,29 @@
 #  limitations under the License.
 # ******************************************************************************
 
-import urllib
-from urllib import request, error
-import tempfile
-import os, sys, shutil, re
-from importlib import reload
-
+import builtins
+import hashlib
+import threading
+import urllib.parse
+import os, re
+from collections import OrderedDict
+
+import requests
 from flask_restful import abort
-from pytket.qasm import circuit_from_qasm_str
 from pyquil import Program as PyQuilProgram
-from urllib3 import HTTPResponse
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from app import app, circuit_cache, download_cache, qasm_ingestion, sandbox
+from app.circuit_serialisation import serialise_circuit, deserialise_circuit
 
-from app import app
+# HTTP session with a keep-alive connection pool, shared by all downloads of this process
+_http_session = None
+_http_session_pid = None
+_http_session_lock = threading.Lock()
+# code objects of the implementations executed by this process, keyed by the hash of their source code
+_compiled_implementations = OrderedDict()
+_compiled_implementations_lock = threading.Lock()
 
 
 def prepare_code(impl_url, impl_data, impl_language, input_params, bearer_token: str = ""):
@@ -79,42 +90,44 @@ def prepare_code(impl_url, impl_data, impl_language, input_params, bearer_token:
 
 def prepare_code_from_data(data, input_params):
     """Get implementation code from data. Set input parameters into implementation. Return circuit."""
-    temp_dir = tempfile.mkdtemp()
-    with open(os.path.join(temp_dir, "__init__.py"), "w") as f:
-        f.write("")
-    with open(os.path.join(temp_dir, "downloaded_code.py"), "w") as f:
-        f.write(data)
-    sys.path.append(temp_dir)
+    # identical inputs generate identical circuits, so the user code is only executed once
+    cache_key = circuit_cache.get_generated_circuit_key(data, input_params)
+    circuit = circuit_cache.get_generated_circuit(cache_key)
+    if circuit is not None:
+        return circuit
+
+    pool = sandbox.get_sandbox_pool()
+    if pool:
+        circuit = deserialise_circuit(pool.run(_generate_serialised_circuit, data, dict(input_params)))
+    else:
+        circuit = _generate_circuit(data, input_params)
+
+    circuit_cache.store_generated_circuit(cache_key, circuit)
+    return circuit
+
+
+def _generate_circuit(data, input_params):
     circuit = None
-    try:
-        import downloaded_code
-
-        # deletes every attribute from downloaded_code, except __name__, because importlib.reload
-        # doesn't reset the module's global variables
-        for attr in dir(downloaded_code):
-            if attr != "__name__":
-                delattr(downloaded_code, attr)
-
-        reload(downloaded_code)
-        if 'get_circuit' in dir(downloaded_code):
-            circuit = downloaded_code.get_circuit(**input_params)
-        elif 'qc' in dir(downloaded_code):
-            circuit = downloaded_code.qc
-        elif 'p' in dir(downloaded_code):
-            circuit = downloaded_code.p
-    finally:
-        sys.path.remove(temp_dir)
-        shutil.rmtree(temp_dir, ignore_errors=True)
+    implementation = load_implementation(data)
+    if 'get_circuit' in implementation:
+        circuit = implementation['get_circuit'](**input_params)
+    elif 'qc' in implementation:
+        circuit = implementation['qc']
+    elif 'p' in implementation:
+        circuit = implementation['p']
     if not circuit:
         raise ValueError
     return circuit
 
 
+def _generate_serialised_circuit(data, input_params):
+    return serialise_circuit(_generate_circuit(data, input_params))
+
+
 def prepare_code_from_url(url, input_params, bearer_token: str = "", post_processing=False):
     """Get implementation code from URL. Set input parameters into implementation. Return circuit."""
-    try:
-        impl = _download_code(url, bearer_token)
-    except (error.HTTPError, error.URLError):
+    impl = download_implementation(url, bearer_token)
+    if impl is None:
         return None
 
     if not post_processing:
@@ -126,7 +139,7 @@ def prepare_code_from_url(url, input_params, bearer_token: str = "", post_proces
 
 
 def prepare_code_from_qasm(qasm):
-    return circuit_from_qasm_str(qasm)
+    return qasm_ingestion.load_qasm(qasm)
 
 
 def prepare_code_from_quil(quil):
@@ -135,9 +148,8 @@ def prepare_code_from_quil(quil):
 
 def prepare_code_from_qasm_url(url, bearer_token: str = ""):
     """Get implementation code from URL. Set input parameters into implementation. Return circuit."""
-    try:
-        impl = _download_code(url, bearer_token)
-    except (error.HTTPError, error.URLError):
+    impl = download_implementation(url, bearer_token)
+    if impl is None:
         return None
 
     return prepare_code_from_qasm(impl)
@@ -145,16 +157,50 @@ def prepare_code_from_qasm_url(url, bearer_token: str = ""):
 
 def prepare_code_from_quil_url(url, bearer_token: str = ""):
     """Get implementation code from URL. Set input parameters into implementation. Return circuit."""
-    try:
-        impl = _download_code(url, bearer_token)
-    except (error.HTTPError, error.URLError):
+    impl = download_implementation(url, bearer_token)
+    if impl is None:
         return None
 
     return prepare_code_from_quil(impl)
 
 
+def download_implementation(url, bearer_token: str = ""):
+    """Get implementation code from URL. Return None if the download failed."""
+    try:
+        return _download_code(url, bearer_token)
+    except requests.RequestException:
+        return None
+
+
+def get_http_session():
+    """
+    Get the HTTP session of this process, which keeps the connections to the hosts of the implementations alive
+    and retries failed downloads with backoff.
+    The session is recreated after a fork, as its connections must not be shared between processes.
+    :return:
+    """
+
+    global _http_session, _http_session_pid
+    with _http_session_lock:
+        if _http_session is None or _http_session_pid != os.getpid():
+            retry = Retry(total=app.config['DOWNLOAD_RETRIES'],
+                          backoff_factor=app.config['DOWNLOAD_BACKOFF_FACTOR'],
+                          status_forcelist=[429, 500, 502, 503, 504],
+                          allowed_methods=["GET"])
+            adapter = HTTPAdapter(pool_connections=app.config['DOWNLOAD_POOL_SIZE'],
+                                  pool_maxsize=app.config['DOWNLOAD_POOL_SIZE'],
+                                  max_retries=retry)
+            session = requests.Session()
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _http_session = session
+            _http_session_pid = os.getpid()
+        return _http_session
+
+
 def _download_code(url: str, bearer_token: str = "") -> str:
-    req = request.Request(url)
+    headers = {}
+    scope = ""
 
     if urllib.parse.urlparse(url).netloc == "platform.planqk.de":
         if bearer_token == "":
@@ -166,48 +212,95 @@ def _download_code(url: str, bearer_token: str = "") -> str:
 
             abort(401)
 
-        req.add_header("Authorization", "Bearer " + bearer_token)
+        headers["Authorization"] = "Bearer " + bearer_token
+        # the cached download must only be served to requests with the same credentials
+        scope = hashlib.sha256(bearer_token.encode()).hexdigest()
+
+    cache_key = download_cache.downloads.get_key(url, scope)
+    cached = download_cache.downloads.load(cache_key)
+    if cached:
+        if download_cache.downloads.is_fresh(cached):
+            return cached['body']
+        if cached['etag']:
+            headers["If-None-Match"] = cached['etag']
+        if cached['last-modified']:
+            headers["If-Modified-Since"] = cached['last-modified']
 
     try:
-        res: HTTPResponse = request.urlopen(req)
-    except Exception as e:
+        res = get_http_session().get(url, headers=headers,
+                                     timeout=(app.config['DOWNLOAD_CONNECT_TIMEOUT'],
+                                              app.config['DOWNLOAD_READ_TIMEOUT']))
+    except requests.RequestException as e:
         app.logger.error("Could not open url: " + str(e))
+        raise e
 
-        if str(e).find("401") != -1:
-            abort(401)
+    if res.status_code == 304 and cached:
+        download_cache.downloads.revalidated(cache_key, cached)
+        return cached['body']
 
-    if res.getcode() == 200 and urllib.parse.urlparse(url).netloc == "platform.planqk.de":
+    if res.status_code == 200 and urllib.parse.urlparse(url).netloc == "platform.planqk.de":
         app.logger.info("Request to platform.planqk.de was executed successfully.")
 
-    if res.getcode() == 401:
+    if res.status_code == 401:
         abort(401)
 
-    return res.read().decode("utf-8")
+    try:
+        res.raise_for_status()
+    except requests.HTTPError as e:
+        app.logger.error("Could not open url: " + str(e))
+        raise e
+
+    res.encoding = "utf-8"
+    body = res.text
+    etag = res.headers.get("ETag")
+    last_modified = res.headers.get("Last-Modified")
+    if etag or last_modified or download_cache.downloads.max_age > 0:
+        download_cache.downloads.store(cache_key, url, body, etag, last_modified)
+    return body
 
 
 def prepare_post_processing_code_from_data(data, input_params):
     """Get implementation code from data. Set input parameters into implementation. Return circuit."""
-    temp_dir = tempfile.mkdtemp()
-    with open(os.path.join(temp_dir, "__init__.py"), "w") as f:
-        f.write("")
-    with open(os.path.join(temp_dir, "downloaded_code.py"), "w") as f:
-        f.write(data)
-    sys.path.append(temp_dir)
-    try:
-        import downloaded_code
-
-        # deletes every attribute from downloaded_code, except __name__, because importlib.reload
-        # doesn't reset the module's global variables
-        for attr in dir(downloaded_code):
-            if attr != "__name__":
-                delattr(downloaded_code, attr)
-
-        reload(downloaded_code)
-        if 'post_processing' in dir(downloaded_code):
-            result = downloaded_code.post_processing(**input_params)
-    finally:
-        sys.path.remove(temp_dir)
-        shutil.rmtree(temp_dir, ignore_errors=True)
+    pool = sandbox.get_sandbox_pool()
+    if pool:
+        return pool.run(_post_process, data, dict(input_params))
+    return _post_process(data, input_params)
+
+
+def _post_process(data, input_params):
+    result = None
+    implementation = load_implementation(data)
+    if 'post_processing' in implementation:
+        result = implementation['post_processing'](**input_params)
     if not result:
         raise ValueError
-    return result
\ No newline at end of file
+    return result
+
+
+def load_implementation(data):
+    """
+    Execute the implementation code in a fresh namespace, so that concurrent executions do not share any state.
+    The code is only compiled once per content and executed from the cached code object afterwards.
+    :param data: the source code of the implementation
+    :return: the namespace holding the global variables and functions of the implementation
+    """
+
+    namespace = {'__name__': 'downloaded_code', '__builtins__': builtins}
+    exec(_compile_implementation(data), namespace)
+    return namespace
+
+
+def _compile_implementation(data):
+    key = hashlib.sha256(data.encode()).hexdigest()
+    with _compiled_implementations_lock:
+        code = _compiled_implementations.get(key)
+        if code is not None:
+            _compiled_implementations.move_to_end(key)
+            return code
+
+    code = compile(data, f"<implementation {key[:12]}>", "exec")
+    with _compiled_implementations_lock:
+        _compiled_implementations[key] = code
+        while len(_compiled_implementations) > app.config['COMPILED_IMPLEMENTATION_CACHE_SIZE']:
+            _compiled_implementations.popitem(last=False)
+    return code
@@ -14,6 +14,19 @@ class GenerateCircuitRequestSchema(ma.Schema):
     input_params = ma.fields.List(ma.fields.String())
 
 
+class GenerateCircuitSweepRequest:
+    def __init__(self, impl_url, impl_language, input_params):
+        self.impl_url = impl_url
+        self.impl_language = impl_language
+        self.input_params = input_params
+
+
+class GenerateCircuitSweepRequestSchema(ma.Schema):
+    impl_url = ma.fields.String()
+    impl_language = ma.fields.String()
+    input_params = ma.fields.List(ma.fields.Dict())
+
+
 class TranspileRequest:
     def __init__(self, impl_url, impl_language, qpu_name, provider, input_params, token):
         self.impl_url = impl_url
@@ -33,6 +46,19 @@ class TranspileRequestSchema(ma.Schema):
     token = ma.fields.String()
 
 
+class TranspileBatchRequest:
+    def __init__(self, implementations, targets, bearer_token):
+        self.implementations = implementations
+        self.targets = targets
+        self.bearer_token = bearer_token
+
+
+class TranspileBatchRequestSchema(ma.Schema):
+    implementations = ma.fields.List(ma.fields.Dict())
+    targets = ma.fields.List(ma.fields.Dict())
+    bearer_token = ma.fields.String()
+
+
 class ExecuteRequest:
     def __init__(self, impl_url, impl_language, qpu_name, provider, noise_model, only_measurement_errors, input_params, token,
                  correlation_id, post_processing_result):
@@ -57,3 +83,6 @@ class ExecuteRequestSchema(ma.Schema):
     noise_model = ma.fields.Str(required=False)
     only_measurement_errors = ma.fields.Boolean(required=False)
     correlation_id = ma.fields.String()
+    coalesce = ma.fields.Boolean(required=False)
+    seed = ma.fields.Int(required=False)
+    priority = ma.fields.String(required=False)
@@ -92,6 +92,15 @@ class TranspileResponseSchema(ma.Schema):
         raise NotImplementedError
 
 
+class TranspileBatchResponseSchema(ma.Schema):
+    implementations = ma.fields.List(ma.fields.String())
+    results = ma.fields.List(ma.fields.List(ma.fields.Dict()))
+
+    @property
+    def input(self):
+        raise NotImplementedError
+
+
 class ExecuteResponseSchema(ma.Schema):
     location = ma.fields.String()
 
@@ -104,11 +113,39 @@ class GenerateCircuitResponseSchema(ma.Schema):
     location = ma.fields.String()
 
 
+class GeneratedCircuitSweepResponseSchema(ma.Schema):
+    id = ma.fields.String()
+    complete = ma.fields.Boolean()
+    generated_circuits = ma.fields.List(ma.fields.Nested(GeneratedCircuitsResponseSchema))
+
+    @property
+    def input(self):
+        raise NotImplementedError
+
+
 class ResultsResponseSchema(ma.Schema):
     result = ma.fields.List(ma.fields.String())
     post_processing_result = ma.fields.List(ma.fields.String())
 
 
+class ResultBatchResponseSchema(ma.Schema):
+    id = ma.fields.String()
+    complete = ma.fields.Boolean()
+    results = ma.fields.List(ma.fields.Nested(ResultsResponseSchema))
+
+    @property
+    def input(self):
+        raise NotImplementedError
+
+
+class QueuesResponseSchema(ma.Schema):
+    queues = ma.fields.List(ma.fields.Dict())
+
+    @property
+    def input(self):
+        raise NotImplementedError
+
+
 class AnalysisOriginalCircuitResponse:
     def __init__(self, original_depth, original_multi_qubit_gate_depth, original_number_of_measurement_operations,
                  original_number_of_multi_qubit_gates, original_number_of_single_qubit_gates,
@@ -0,0 +1,74 @@
+# ******************************************************************************
+#  Copyright (c) 2026 University of Stuttgart
+#
+#  See the NOTICE file(s) distributed with this work for additional
+#  information regarding copyright ownership.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# ******************************************************************************
+
+
+import hashlib
+import threading
+from collections import OrderedDict
+
+from pytket import Bit, Qubit
+from pytket.qasm import circuit_from_qasm_str
+
+from app import app
+
+_parsed_circuits = OrderedDict()
+_parsed_circuits_lock = threading.Lock()
+
+
+def load_qasm(qasm):
+    """
+    Parse the given OpenQASM code into a pytket circuit.
+    Parsed circuits are kept in memory by content hash, so that the same code is only parsed once per process.
+    :param qasm: the OpenQASM code
+    :return: a new pytket circuit, which the caller is free to modify
+    """
+
+    key = hashlib.sha256(qasm.encode()).hexdigest()
+    with _parsed_circuits_lock:
+        circuit = _parsed_circuits.get(key)
+        if circuit is not None:
+            _parsed_circuits.move_to_end(key)
+            return circuit.copy()
+
+    circuit = circuit_from_qasm_str(qasm)
+    if app.config['QASM_PARSE_CACHE_SIZE'] > 0:
+        with _parsed_circuits_lock:
+            _parsed_circuits[key] = circuit.copy()
+            while len(_parsed_circuits) > app.config['QASM_PARSE_CACHE_SIZE']:
+                _parsed_circuits.popitem(last=False)
+    return circuit
+
+
+def rename_registers_lowercase(circuit):
+    """
+    Rename all qubit and bit registers of the circuit to lowercase names in place,
+    because uppercase letters in register names cause the execution to fail.
+    :param circuit: the pytket circuit
+    :return: the circuit
+    """
+
+    renaming = {}
+    for unit_type, units in ((Qubit, circuit.qubits), (Bit, circuit.bits)):
+        for unit in units:
+            if unit.reg_name != unit.reg_name.lower():
+                renaming[unit] = unit_type(unit.reg_name.lower(), unit.index)
+
+    if renaming and not circuit.rename_units(renaming):
+        app.logger.warning("Register names of the circuit could not be lowercased")
+    return circuit
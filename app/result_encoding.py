@@ -0,0 +1,72 @@
+# ******************************************************************************
+#  Copyright (c) 2026 University of Stuttgart
+#
+#  See the NOTICE file(s) distributed with this work for additional
+#  information regarding copyright ownership.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# ******************************************************************************
+
+
+import struct
+import zlib
+
+import numpy as np
+
+# format version, number of bits per outcome, number of distinct outcomes
+_HEADER = struct.Struct('<BII')
+_FORMAT_VERSION = 1
+
+
+def encode_counts(counts):
+    """
+    Encode the counts of an execution into a compact binary format.
+    Each outcome is packed into little-endian bytes, i.e., bit i of the outcome is bit i of the packed integer,
+    and the outcomes and their counts are stored as arrays compressed with zlib.
+    :param counts: the counts as returned by BackendResult.get_counts, mapping tuples of bits to counts
+    :return: the encoded counts
+    """
+
+    width = len(next(iter(counts))) if counts else 0
+    outcomes = np.array(list(counts.keys()), dtype=np.uint8).reshape(len(counts), width)
+    packed_outcomes = np.packbits(outcomes, axis=1, bitorder='little')
+    frequencies = np.fromiter(counts.values(), dtype='<u8', count=len(counts))
+
+    return zlib.compress(_HEADER.pack(_FORMAT_VERSION, width, len(counts)) + packed_outcomes.tobytes()
+                         + frequencies.tobytes())
+
+
+def decode_counts(data):
+    """
+    Decode counts encoded by encode_counts.
+    :param data: the encoded counts
+    :return: dict mapping the outcomes to their counts, with the outcomes as bitstrings in the order used by
+    IBM Quantum, i.e., the first bit is the rightmost character
+    """
+
+    data = zlib.decompress(data)
+    version, width, size = _HEADER.unpack_from(data)
+    if version != _FORMAT_VERSION:
+        raise ValueError(f"Unknown result encoding version {version}")
+
+    row_bytes = (width + 7) // 8
+    offset = _HEADER.size
+    packed_outcomes = np.frombuffer(data, dtype=np.uint8, count=size * row_bytes, offset=offset)
+    frequencies = np.frombuffer(data, dtype='<u8', count=size, offset=offset + size * row_bytes)
+    if width == 0:
+        return {'': int(frequencies.sum())} if size else {}
+
+    outcomes = np.unpackbits(packed_outcomes.reshape(size, row_bytes), axis=1, count=width, bitorder='little')
+    # reverse the bits and view each row of ASCII digits as one bitstring
+    bitstrings = np.ascontiguousarray(outcomes[:, ::-1] + ord('0')).view(f'S{width}').ravel()
+    return dict(zip(np.char.decode(bitstrings, 'ascii').tolist(), frequencies.tolist()))
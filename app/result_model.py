@@ -27,7 +27,12 @@ class Result(db.Model):
     result = db.Column(db.String(1200), default="")
     complete = db.Column(db.Boolean, default=False)
     generated_circuit_id = db.Column(db.String(36), db.ForeignKey('generated__circuit.id'), nullable=True)
-    post_processing_result = db.Column(db.String(1200), default="")
+    post_processing_result = db.Column(db.Text, default="")
+    # counts of a successful execution, encoded by result_encoding.encode_counts
+    counts = db.Column(db.LargeBinary, nullable=True)
+    job_handle = db.Column(db.String(1200), nullable=True)
+    batch_id = db.Column(db.String(36), index=True)
+    batch_index = db.Column(db.Integer)
 
     def __repr__(self):
         return 'Result {}'.format(self.result)
@@ -0,0 +1,132 @@
+# ******************************************************************************
+#  Copyright (c) 2026 University of Stuttgart
+#
+#  See the NOTICE file(s) distributed with this work for additional
+#  information regarding copyright ownership.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# ******************************************************************************
+
+
+import hashlib
+import json
+import time
+from datetime import timedelta
+
+from app import app
+from app.tket_handler import get_current_credential_fingerprint
+
+
+def is_enabled():
+    return app.config['RESULT_POLL_INTERVAL'] > 0
+
+
+def get_poll_group(provider, qpu_name):
+    """
+    Get the group of pending results that can be polled together, i.e., with the same backend and credentials.
+    Expects that the setup_credentials method is called before
+    """
+
+    key = f"{provider.lower()}|{qpu_name}|{get_current_credential_fingerprint(provider)}"
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+def _results_key(group):
+    return f"pytket-service:result-poll:{group}:results"
+
+
+def _due_key(group):
+    return f"pytket-service:result-poll:{group}:due"
+
+
+def _poller_key(group):
+    return f"pytket-service:result-poll:{group}:poller"
+
+
+def _get_delay(attempt):
+    return min(app.config['RESULT_POLL_INTERVAL'] * 2 ** attempt, app.config['RESULT_POLL_MAX_INTERVAL'])
+
+
+def add_pending_result(result_id, provider, qpu_name, input_params, post_processing):
+    """
+    Register a submitted job, whose handle is stored in the Result row, to be polled until it is done.
+    :param result_id: the id of the Result row
+    :param provider:
+    :param qpu_name:
+    :param input_params: the input parameters containing the credentials for the provider
+    :param post_processing: the arguments of tasks.store_execution_result to apply to the counts once they are available
+    :return:
+    """
+
+    group = get_poll_group(provider, qpu_name)
+    pipe = app.redis.pipeline()
+    pipe.hset(_results_key(group), result_id, json.dumps({'attempt': 0, 'post-processing': post_processing}))
+    pipe.zadd(_due_key(group), {result_id: time.time() + _get_delay(0)})
+    pipe.execute()
+    _schedule_poller(group, provider, qpu_name, input_params, _get_delay(0))
+
+
+def get_due_results(group):
+    """Get the ids and polling state of all results of the group whose next poll is due"""
+    result_ids = [result_id.decode() for result_id in app.redis.zrangebyscore(_due_key(group), 0, time.time())]
+    if not result_ids:
+        return []
+    states = app.redis.hmget(_results_key(group), result_ids)
+    return [(result_id, json.loads(state)) for result_id, state in zip(result_ids, states) if state is not None]
+
+
+def reschedule_result(group, result_id, state):
+    """Poll the result again after an exponentially growing delay"""
+    state['attempt'] += 1
+    pipe = app.redis.pipeline()
+    pipe.hset(_results_key(group), result_id, json.dumps(state))
+    pipe.zadd(_due_key(group), {result_id: time.time() + _get_delay(state['attempt'])})
+    pipe.execute()
+
+
+def remove_result(group, result_id):
+    pipe = app.redis.pipeline()
+    pipe.hdel(_results_key(group), result_id)
+    pipe.zrem(_due_key(group), result_id)
+    pipe.execute()
+
+
+def finish_poll(group, provider, qpu_name, input_params):
+    """Schedule the next poll of the group for its earliest due result, or release the poller if none is left"""
+    next_due = app.redis.zrange(_due_key(group), 0, 0, withscores=True)
+    if next_due:
+        delay = max(next_due[0][1] - time.time(), 0)
+        _enqueue_poller(group, provider, qpu_name, input_params, delay)
+        return
+
+    app.redis.delete(_poller_key(group))
+    # a result may have been added after the check, while the poller was still registered
+    if app.redis.zcard(_due_key(group)):
+        _schedule_poller(group, provider, qpu_name, input_params, 0)
+
+
+def _schedule_poller(group, provider, qpu_name, input_params, delay):
+    # only one poller is scheduled per group at a time
+    if app.redis.set(_poller_key(group), 1, nx=True, ex=_get_poller_ttl(delay)):
+        _enqueue_poller(group, provider, qpu_name, input_params, delay)
+
+
+def _enqueue_poller(group, provider, qpu_name, input_params, delay):
+    app.redis.expire(_poller_key(group), _get_poller_ttl(delay))
+    app.execute_queue.enqueue_in(timedelta(seconds=delay), 'app.tasks.poll_results', group=group, provider=provider,
+                                 qpu_name=qpu_name, input_params=input_params)
+
+
+def _get_poller_ttl(delay):
+    # the registration expires if a poller is lost, so that the next submission schedules a new one
+    return int(delay + app.config['RESULT_POLL_MAX_INTERVAL']) + 60
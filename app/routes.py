@@ -17,18 +17,21 @@
 #  limitations under the License.
 # ******************************************************************************
 
-from app import app, implementation_handler, db, parameters
+from app import app, implementation_handler, db, parameters, transpile_handler, conversion_strategy, result_encoding, \
+    execution_coalescing, execute_queues
+from app.circuit_metrics import analyze_circuit
 from app.generated_circuit_model import Generated_Circuit
 from app.result_model import Result
-from app.tket_handler import get_backend, is_tk_circuit, setup_credentials, tket_analyze_original_circuit, \
-    tket_transpile_circuit, UnsupportedGateException, TooManyQubitsException, get_depth_without_barrier, \
-    prepare_transpile_response, get_number_of_multi_qubit_gates, get_multi_qubit_gate_depth, \
-    get_number_of_measurement_operations
+from app.transpiled_circuit_model import Transpiled_Circuit
+from app.compilation_profile_model import Compilation_Profile
+from app.tket_handler import UnsupportedGateException, DEFAULT_OPTIMISATION_LEVEL, \
+    PORTFOLIO_OBJECTIVE_MULTI_QUBIT_GATES, PORTFOLIO_OBJECTIVE_DEPTH
 
 from flask import jsonify, abort, request
 import logging
 import json
 import base64
+import uuid
 
 @app.route('/pytket-service/api/v1.0/generate-circuit', methods=['POST'])
 def generate_circuit():
@@ -67,23 +70,82 @@ def generate_circuit():
     return response
 
 
+@app.route('/pytket-service/api/v1.0/generate-circuit-sweep', methods=['POST'])
+def generate_circuit_sweep():
+    if not request.json:
+        abort(400)
+
+    impl_language = request.json.get('impl-language', '')
+    impl_url = request.json.get('impl-url', "")
+    input_params_list = request.json.get('input-params', [])
+    bearer_token = request.json.get("bearer-token", "")
+    impl_data = ''
+    if not isinstance(input_params_list, list) or not input_params_list:
+        abort(400)
+    input_params_list = [parameters.ParameterDictionary(input_params) if input_params else {}
+                         for input_params in input_params_list]
+
+    if impl_url is not None and impl_url != "":
+        impl_url = request.json['impl-url']
+    elif 'impl-data' in request.json:
+        impl_data = base64.b64decode(request.json.get('impl-data').encode()).decode()
+    else:
+        abort(400)
+
+    # create the rows of all variants before enqueuing, so that the job always finds them
+    sweep_id = str(uuid.uuid4())
+    for sweep_index in range(len(input_params_list)):
+        db.session.add(Generated_Circuit(id=str(uuid.uuid4()), sweep_id=sweep_id, sweep_index=sweep_index))
+    db.session.commit()
+
+    app.implementation_queue.enqueue('app.tasks.generate_sweep', impl_url=impl_url, impl_data=impl_data,
+                                     impl_language=impl_language, input_params_list=input_params_list,
+                                     bearer_token=bearer_token, job_id=sweep_id)
+
+    app.logger.info('Returning HTTP response to client...')
+    content_location = '/pytket-service/api/v1.0/generated-circuit-sweeps/' + sweep_id
+    response = jsonify({'Location': content_location})
+    response.status_code = 202
+    response.headers['Location'] = content_location
+    response.autocorrect_location_header = True
+    return response
+
+
 @app.route('/pytket-service/api/v1.0/generated-circuits/<generated_circuit_id>', methods=['GET'])
 def get_generated_circuit(generated_circuit_id):
     """Return result when it is available."""
     generated_circuit = Generated_Circuit.query.get(generated_circuit_id)
+    return jsonify(get_generated_circuit_response(generated_circuit)), 200
+
+
+@app.route('/pytket-service/api/v1.0/generated-circuit-sweeps/<sweep_id>', methods=['GET'])
+def get_generated_circuit_sweep(sweep_id):
+    """Return all generated circuits of the sweep, the sweep is complete when all of them are available."""
+    generated_circuits = Generated_Circuit.query.filter_by(sweep_id=sweep_id) \
+        .order_by(Generated_Circuit.sweep_index).all()
+    if not generated_circuits:
+        abort(404)
+
+    return jsonify({'id': sweep_id,
+                    'complete': all(generated_circuit.complete for generated_circuit in generated_circuits),
+                    'generated-circuits': [get_generated_circuit_response(generated_circuit)
+                                           for generated_circuit in generated_circuits]}), 200
+
+
+def get_generated_circuit_response(generated_circuit):
     if generated_circuit.complete:
         input_params_dict = json.loads(generated_circuit.input_params)
-        return jsonify(
-            {'id': generated_circuit.id, 'complete': generated_circuit.complete, 'input_params': input_params_dict,
-             'generated-circuit': generated_circuit.generated_circuit,
-             'original-depth': generated_circuit.original_depth, 'original-width': generated_circuit.original_width,
-             'original-total-number-of-operations': generated_circuit.original_total_number_of_operations,
-             'original-number-of-multi-qubit-gates': generated_circuit.original_number_of_multi_qubit_gates,
-             'original-number-of-measurement-operations': generated_circuit.original_number_of_measurement_operations,
-             'original-number-of-single-qubit-gates': generated_circuit.original_number_of_single_qubit_gates,
-             'original-multi-qubit-gate-depth': generated_circuit.original_multi_qubit_gate_depth}), 200
+        return {'id': generated_circuit.id, 'complete': generated_circuit.complete, 'input_params': input_params_dict,
+                'generated-circuit': generated_circuit.generated_circuit,
+                'original-depth': generated_circuit.original_depth, 'original-width': generated_circuit.original_width,
+                'original-total-number-of-operations': generated_circuit.original_total_number_of_operations,
+                'original-number-of-multi-qubit-gates': generated_circuit.original_number_of_multi_qubit_gates,
+                'original-number-of-measurement-operations':
+                    generated_circuit.original_number_of_measurement_operations,
+                'original-number-of-single-qubit-gates': generated_circuit.original_number_of_single_qubit_gates,
+                'original-multi-qubit-gate-depth': generated_circuit.original_multi_qubit_gate_depth}
     else:
-        return jsonify({'id': generated_circuit.id, 'complete': generated_circuit.complete}), 200
+        return {'id': generated_circuit.id, 'complete': generated_circuit.complete}
 
 
 @app.route('/pytket-service/api/v1.0/analyze-original-circuit', methods=['POST'])
@@ -122,40 +184,26 @@ def analyze_original_circuit():
     non_transpiled_number_of_measurement_operations = None
     non_transpiled_number_of_single_qubit_gates = None
 
-    precompiled_circuit = False
-    while not is_tk_circuit(circuit):
+    try:
+        circuit = conversion_strategy.convert_circuit(circuit,
+                                                      impl_language=impl_language,
+                                                      short_impl_name=short_impl_name,
+                                                      logger=app.logger.info)
+        metrics = analyze_circuit(circuit)
+        non_transpiled_width = metrics.width
+        non_transpiled_depth = metrics.depth
+        non_transpiled_multi_qubit_gate_depth = metrics.multi_qubit_gate_depth
+        non_transpiled_total_number_of_operations = metrics.total_number_of_operations
+        non_transpiled_number_of_multi_qubit_gates = metrics.number_of_multi_qubit_gates
+        non_transpiled_number_of_measurement_operations = metrics.number_of_measurement_operations
+        non_transpiled_number_of_single_qubit_gates = metrics.number_of_single_qubit_gates
+
+    except UnsupportedGateException:
+        app.logger.warn(f"Precompiling {short_impl_name} failed.")
 
-        try:
-            circuit, \
-            non_transpiled_width, \
-            non_transpiled_depth, \
-            non_transpiled_multi_qubit_gate_depth, \
-            non_transpiled_total_number_of_operations, \
-            non_transpiled_number_of_multi_qubit_gates, \
-            non_transpiled_number_of_measurement_operations, \
-            non_transpiled_number_of_single_qubit_gates \
-                = tket_analyze_original_circuit(circuit,
-                                                impl_language=impl_language,
-                                                short_impl_name=short_impl_name,
-                                                logger=app.logger.info,
-                                                precompile_circuit=precompiled_circuit)
-
-        except UnsupportedGateException as e:
-
-            # unsupported gate type caused circuit conversion to fail
-            app.logger.warn(f"Unsupported gate ({e.gate}) in implementation {short_impl_name}.")
-
-            # precompile the circuit and retry
-            if not precompiled_circuit:
-                precompiled_circuit = True
-                continue
-            else:
-                app.logger.warn(f"Precompiling {short_impl_name} failed.")
-                break
-
-        except Exception as e:
-            app.logger.warn(f"Circuit analysis unexpectedly failed for {short_impl_name}: {str(e)}")
-            abort(500)
+    except Exception as e:
+        app.logger.warn(f"Circuit analysis unexpectedly failed for {short_impl_name}: {str(e)}")
+        abort(500)
 
     response = {'original-width': non_transpiled_width,
                 'original-depth': non_transpiled_depth,
@@ -182,123 +230,130 @@ def transpile_circuit():
     input_params = request.json.get('input-params', "")
     input_params = parameters.ParameterDictionary(input_params)
 
-    # setup the SDK credentials first
-    setup_credentials(provider, **input_params)
-    circuit = None
-    short_impl_name = ""
-
     impl_url = request.json['impl-url'] if 'impl-url' in request.json else None
     impl_data = base64.standard_b64decode(
         request.json['impl-data'].encode()).decode() if 'impl-data' in request.json else None
 
     bearer_token = request.json.get("bearer-token", "")
-
+    optimisation_level, compile_timeout = get_compilation_options(request.json)
+    portfolio, portfolio_objective = get_portfolio_options(request.json)
+    profile = bool(request.json.get('profile', False))
+
+    if request.json.get('async', False):
+        # transpile large circuits in the worker queue instead of blocking the API
+        job = app.transpile_queue.enqueue('app.tasks.transpile', impl_url=impl_url, impl_data=impl_data,
+                                          impl_language=impl_language, input_params=input_params,
+                                          provider=provider, qpu_name=qpu_name, bearer_token=bearer_token,
+                                          optimisation_level=optimisation_level, compile_timeout=compile_timeout,
+                                          portfolio=portfolio, portfolio_objective=portfolio_objective,
+                                          profile=profile)
+        transpiled_circuit = Transpiled_Circuit(id=job.get_id(), backend=qpu_name, provider=provider)
+        db.session.add(transpiled_circuit)
+        db.session.commit()
+
+        app.logger.info('Returning HTTP response to client...')
+        content_location = '/pytket-service/api/v1.0/transpiled-circuits/' + transpiled_circuit.id
+        response = jsonify({'Location': content_location})
+        response.status_code = 202
+        response.headers['Location'] = content_location
+        response.autocorrect_location_header = True
+        return response
+
+    response, status_code = transpile_handler.transpile(impl_url, impl_data, impl_language, input_params, provider,
+                                                        qpu_name, bearer_token, optimisation_level, compile_timeout,
+                                                        portfolio, portfolio_objective, profile)
+    return jsonify(response), status_code
+
+
+def get_compilation_options(request_json):
+    """Get the requested optimisation level and the compile timeout in seconds (None for no timeout)."""
     try:
-        circuit, short_impl_name = implementation_handler.prepare_code(impl_url, impl_data, impl_language, input_params,
-                                                                       bearer_token)
-    except ValueError:
+        optimisation_level = int(request_json.get('optimisation-level', DEFAULT_OPTIMISATION_LEVEL))
+        compile_timeout = float(request_json.get('compile-timeout', app.config['COMPILE_TIMEOUT']))
+    except (TypeError, ValueError):
         abort(400)
-    except Exception as e:
-        app.logger.info(f"Transpile {short_impl_name} for {qpu_name}: {str(e)}")
-        return jsonify({'error': str(e)}), 400
 
-    if not circuit:
-        app.logger.info(f"Transpile {short_impl_name} for {qpu_name}: Failed to create circuit.")
-        return jsonify({'error': "Failed to create circuit."}), 400
+    if optimisation_level not in range(DEFAULT_OPTIMISATION_LEVEL + 1) or compile_timeout < 0:
+        abort(400)
 
-    # Identify the backend given provider and qpu name
-    backend = get_backend(provider, qpu_name)
+    return optimisation_level, compile_timeout or None
 
-    if not backend:
-        app.logger.warning(f"{qpu_name} not found.")
-        abort(404)
 
-    non_transpiled_width = circuit.n_qubits
-    non_transpiled_depth = get_depth_without_barrier(circuit)
-    non_transpiled_multi_qubit_gate_depth = get_multi_qubit_gate_depth(circuit)
-    non_transpiled_total_number_of_operations = circuit.n_gates
-    non_transpiled_number_of_multi_qubit_gates = get_number_of_multi_qubit_gates(circuit)
-    non_transpiled_number_of_measurement_operations = get_number_of_measurement_operations(circuit)
-    non_transpiled_number_of_single_qubit_gates = non_transpiled_total_number_of_operations \
-                                                  - non_transpiled_number_of_multi_qubit_gates \
-                                                  - non_transpiled_number_of_measurement_operations
+def get_portfolio_options(request_json):
+    """Get whether to compile with the strategy portfolio and the objective to select its best result by."""
+    portfolio = bool(request_json.get('portfolio', False))
+    portfolio_objective = request_json.get('portfolio-objective', PORTFOLIO_OBJECTIVE_MULTI_QUBIT_GATES)
 
-    precompiled_circuit = False
-    while not is_tk_circuit(circuit) or not backend.valid_circuit(circuit):
+    if portfolio_objective not in (PORTFOLIO_OBJECTIVE_MULTI_QUBIT_GATES, PORTFOLIO_OBJECTIVE_DEPTH):
+        abort(400)
 
-        try:
-            circuit = tket_transpile_circuit(circuit,
-                                         impl_language=impl_language,
-                                         backend=backend,
-                                         short_impl_name=short_impl_name,
-                                         logger=app.logger.info,
-                                         precompile_circuit=precompiled_circuit)
-
-        except UnsupportedGateException as e:
-
-            # unsupported gate type caused circuit conversion to fail
-            app.logger.warning(f"Unsupported gate ({e.gate}) in implementation {short_impl_name}.")
-
-            # precompile the circuit and retry
-            if not precompiled_circuit:
-                precompiled_circuit = True
-                continue
-            else:
-                app.logger.warning(f"Precompiling {short_impl_name} failed.")
-                break
-
-        except TooManyQubitsException:
-            # Too many qubits required for the provided backend
-            app.logger.info(f"Transpile {short_impl_name} for {qpu_name}: too many qubits required")
-            return jsonify({'error': 'too many qubits required'}), 200
-
-        except Exception as e:
-            app.logger.warning(f"Circuit compilation unexpectedly failed for {short_impl_name}: {str(e)}")
-            abort(500)
-
-    # After compilation the circuit should be valid
-    if not backend.valid_circuit(circuit):
-        app.logger.warning(f"Circuit compilation unexpectedly failed for {short_impl_name}.")
-        abort(500)
+    return portfolio, portfolio_objective
+
+
+@app.route('/pytket-service/api/v1.0/transpile-batch', methods=['POST'])
+def transpile_batch():
+    """Transpile a list of implementations for a list of QPUs and return the properties of all transpiled
+    circuits."""
+
+    if not request.json or not 'implementations' in request.json or not 'targets' in request.json:
+        abort(400)
+
+    implementations = request.json['implementations']
+    targets = request.json['targets']
+    if any(not 'provider' in target or not 'qpu-name' in target for target in targets):
+        abort(400)
+
+    bearer_token = request.json.get("bearer-token", "")
+    optimisation_level, compile_timeout = get_compilation_options(request.json)
 
-    response = prepare_transpile_response(circuit, provider)
-
-    # get statistics about the compiled circuit
-    width = circuit.n_qubits
-    depth = get_depth_without_barrier(circuit)
-    multi_qubit_gate_depth = get_multi_qubit_gate_depth(circuit)
-    total_number_of_operations = circuit.n_gates
-    number_of_multi_qubit_gates = get_number_of_multi_qubit_gates(circuit)
-    number_of_measurement_operations = get_number_of_measurement_operations(circuit)
-    number_of_single_qubit_gates = total_number_of_operations - number_of_multi_qubit_gates \
-                                   - number_of_measurement_operations
-
-    response['original-width'] = non_transpiled_width
-    response['original-depth'] = non_transpiled_depth
-    response['original-multi-qubit-gate-depth'] = non_transpiled_multi_qubit_gate_depth
-    response['original-total-number-of-operations'] = non_transpiled_total_number_of_operations
-    response['original-number-of-single-qubit-gates'] = non_transpiled_number_of_single_qubit_gates
-    response['original-number-of-multi-qubit-gates'] = non_transpiled_number_of_multi_qubit_gates
-    response['original-number-of-measurement-operations'] = non_transpiled_number_of_measurement_operations
-    response['width'] = width
-    response['depth'] = depth
-    response['multi-qubit-gate-depth'] = multi_qubit_gate_depth
-    response['total-number-of-operations'] = total_number_of_operations
-    response['number-of-single-qubit-gates'] = number_of_single_qubit_gates
-    response['number-of-multi-qubit-gates'] = number_of_multi_qubit_gates
-    response['number-of-measurement-operations'] = number_of_measurement_operations
-
-    app.logger.info(f"Transpiled {short_impl_name} for {qpu_name}: "
-                    f"w={width}, "
-                    f"d={depth}, "
-                    f"mutli qubit gate depth={multi_qubit_gate_depth}"
-                    f"total number of operations={total_number_of_operations}, "
-                    f"number of single qubit gates={number_of_single_qubit_gates}, "
-                    f"number of multi qubit gates={number_of_multi_qubit_gates}, "
-                    f"number of measurement operations={number_of_measurement_operations}")
+    response = transpile_handler.transpile_batch(implementations, targets, bearer_token, optimisation_level,
+                                                 compile_timeout)
     return jsonify(response), 200
 
 
+@app.route('/pytket-service/api/v1.0/transpiled-circuits/<transpiled_circuit_id>', methods=['GET'])
+def get_transpiled_circuit(transpiled_circuit_id):
+    """Return the transpiled circuit and its properties when they are available."""
+    transpiled_circuit = Transpiled_Circuit.query.get(transpiled_circuit_id)
+    if transpiled_circuit.complete:
+        response = json.loads(transpiled_circuit.response)
+        response.update({'id': transpiled_circuit.id, 'complete': transpiled_circuit.complete,
+                         'backend': transpiled_circuit.backend, 'provider': transpiled_circuit.provider})
+        return jsonify(response), 200
+    else:
+        return jsonify({'id': transpiled_circuit.id, 'complete': transpiled_circuit.complete}), 200
+
+
+@app.route('/pytket-service/api/v1.0/compilation-profiles', methods=['GET'])
+def get_compilation_profiles():
+    """Return the stored compilation profiles, optionally filtered by provider and QPU."""
+    query = Compilation_Profile.query
+    if 'provider' in request.args:
+        query = query.filter_by(provider=request.args['provider'])
+    if 'qpu-name' in request.args:
+        query = query.filter_by(backend=request.args['qpu-name'])
+
+    return jsonify([get_compilation_profile_response(compilation_profile) for compilation_profile in query.all()]), 200
+
+
+@app.route('/pytket-service/api/v1.0/compilation-profiles/<compilation_profile_id>', methods=['GET'])
+def get_compilation_profile(compilation_profile_id):
+    """Return the wall time, gate count, and depth after each pass of a profiled compilation."""
+    compilation_profile = Compilation_Profile.query.get(compilation_profile_id)
+    if not compilation_profile:
+        abort(404)
+
+    return jsonify(get_compilation_profile_response(compilation_profile)), 200
+
+
+def get_compilation_profile_response(compilation_profile):
+    passes = json.loads(compilation_profile.profile)
+    return {'id': compilation_profile.id, 'implementation': compilation_profile.implementation,
+            'backend': compilation_profile.backend, 'provider': compilation_profile.provider,
+            'optimisation-level': compilation_profile.optimisation_level, 'passes': passes,
+            'total-time': sum(compilation_pass['time'] for compilation_pass in passes)}
+
+
 @app.route('/pytket-service/api/v1.0/execute', methods=['POST'])
 def execute_circuit():
     """Put execution job in queue. Return location of the later result."""
@@ -320,17 +375,80 @@ def execute_circuit():
     input_params = parameters.ParameterDictionary(input_params)
     shots = request.json.get('shots', 1024)
 
-    job = app.execute_queue.enqueue('app.tasks.execute', correlation_id=correlation_id, impl_url=impl_url, impl_data=impl_data,
-                                    transpiled_qasm=transpiled_qasm,
-                                    transpiled_quil=transpiled_quil, qpu_name=qpu_name,
-                                    input_params=input_params, shots=shots, provider=provider,
-                                    impl_language=impl_language, bearer_token=bearer_token)
-    result = Result(id=job.get_id(), backend=qpu_name, shots=shots)
-    db.session.add(result)
+    priority = request.json.get('priority', execute_queues.NORMAL_PRIORITY)
+    if priority not in execute_queues.PRIORITIES:
+        abort(400)
+    # jobs are queued per backend class, so that short simulations do not wait for long QPU submissions
+    execute_queue = execute_queues.get_execute_queue(provider, qpu_name, priority)
+
+    # a list of implementations or transpiled circuits is executed as a batch
+    for key in ('impl-url', 'impl-data', 'transpiled-qasm'):
+        if isinstance(request.json.get(key), list):
+            return execute_batch([{key: value} for value in request.json[key]], input_params, provider, qpu_name,
+                                 impl_language, shots, bearer_token, execute_queue)
+
+    seed = request.json.get('seed')
+    job_id = str(uuid.uuid4())
+
+    # identical requests opting in share the result of the one in flight instead of being executed again
+    execution_key = None
+    if request.json.get('coalesce', False):
+        execution_key = execution_coalescing.get_execution_key(
+            correlation_id=correlation_id, impl_url=impl_url, impl_data=impl_data, transpiled_qasm=transpiled_qasm,
+            transpiled_quil=transpiled_quil, input_params=input_params, impl_language=impl_language,
+            bearer_token=bearer_token, provider=provider, qpu_name=qpu_name, shots=shots, seed=seed)
+        in_flight_id = execution_coalescing.get_in_flight_result(execution_key, job_id)
+        if in_flight_id:
+            app.logger.info(f"Attaching execute request to the identical request in flight {in_flight_id}")
+            job_id = None
+            result_id = in_flight_id
+
+    if job_id:
+        try:
+            job = execute_queue.enqueue('app.tasks.execute', correlation_id=correlation_id, impl_url=impl_url,
+                                        impl_data=impl_data, transpiled_qasm=transpiled_qasm,
+                                        transpiled_quil=transpiled_quil, qpu_name=qpu_name,
+                                        input_params=input_params, shots=shots, provider=provider,
+                                        impl_language=impl_language, bearer_token=bearer_token, seed=seed,
+                                        job_id=job_id)
+            result = Result(id=job.get_id(), backend=qpu_name, shots=shots)
+            db.session.add(result)
+            db.session.commit()
+        except Exception:
+            # identical requests must not wait for a result that is never created
+            if execution_key:
+                execution_coalescing.release_in_flight_result(execution_key, job_id)
+            raise
+        result_id = result.id
+
+    logging.info('Returning HTTP response to client...')
+    content_location = '/pytket-service/api/v1.0/results/' + result_id
+    response = jsonify({'Location': content_location})
+    response.status_code = 202
+    response.headers['Location'] = content_location
+    response.autocorrect_location_header = True
+    return response
+
+
+def execute_batch(implementations, input_params, provider, qpu_name, impl_language, shots, bearer_token,
+                  execute_queue):
+    """Put batch execution job in queue. Return location of the later results of all circuits of the batch."""
+    if not implementations:
+        abort(400)
+
+    # create the rows of all circuits before enqueuing, so that the job always finds them
+    batch_id = str(uuid.uuid4())
+    for batch_index in range(len(implementations)):
+        db.session.add(Result(id=str(uuid.uuid4()), backend=qpu_name, shots=shots, batch_id=batch_id,
+                              batch_index=batch_index))
     db.session.commit()
 
+    execute_queue.enqueue('app.tasks.execute_batch', implementations=implementations, input_params=input_params,
+                          provider=provider, qpu_name=qpu_name, impl_language=impl_language, shots=shots,
+                          bearer_token=bearer_token, job_id=batch_id)
+
     logging.info('Returning HTTP response to client...')
-    content_location = '/pytket-service/api/v1.0/results/' + result.id
+    content_location = '/pytket-service/api/v1.0/result-batches/' + batch_id
     response = jsonify({'Location': content_location})
     response.status_code = 202
     response.headers['Location'] = content_location
@@ -342,20 +460,43 @@ def execute_circuit():
 def get_result(result_id):
     """Return result when it is available."""
     result = Result.query.get(result_id)
+    return jsonify(get_result_response(result)), 200
+
+
+@app.route('/pytket-service/api/v1.0/result-batches/<batch_id>', methods=['GET'])
+def get_result_batch(batch_id):
+    """Return the results of all circuits of the batch, the batch is complete when all of them are available."""
+    results = Result.query.filter_by(batch_id=batch_id).order_by(Result.batch_index).all()
+    if not results:
+        abort(404)
+
+    return jsonify({'id': batch_id, 'complete': all(result.complete for result in results),
+                    'results': [get_result_response(result) for result in results]}), 200
+
+
+def get_result_response(result):
     if result.complete:
-        result_dict = json.loads(result.result)
+        if result.counts is not None:
+            result_dict = result_encoding.decode_counts(result.counts)
+        else:
+            result_dict = json.loads(result.result)
         if result.post_processing_result:
             post_processing_result_dict = json.loads(result.post_processing_result)
-            return jsonify(
-                {'id': result.id, 'complete': result.complete, 'result': result_dict, 'backend': result.backend,
-                 'shots': result.shots, 'generated-circuit-id': result.generated_circuit_id,
-                 'post-processing-result': post_processing_result_dict}), 200
+            return {'id': result.id, 'complete': result.complete, 'result': result_dict, 'backend': result.backend,
+                    'shots': result.shots, 'generated-circuit-id': result.generated_circuit_id,
+                    'post-processing-result': post_processing_result_dict}
         else:
-            return jsonify(
-                {'id': result.id, 'complete': result.complete, 'result': result_dict, 'backend': result.backend,
-                 'shots': result.shots}), 200
+            return {'id': result.id, 'complete': result.complete, 'result': result_dict, 'backend': result.backend,
+                    'shots': result.shots}
     else:
-        return jsonify({'id': result.id, 'complete': result.complete}), 200
+        return {'id': result.id, 'complete': result.complete}
+
+
+@app.route('/pytket-service/api/v1.0/queues', methods=['GET'])
+def get_queues():
+    """Return the number of waiting jobs, the wait time of the oldest one, and the number of workers per queue."""
+    return jsonify({'queues': [execute_queues.get_queue_statistics(queue)
+                               for queue in execute_queues.get_service_queues()]}), 200
 
 
 @app.route('/pytket-service/api/v1.0/version', methods=['GET'])
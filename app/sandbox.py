@@ -0,0 +1,160 @@
+# ******************************************************************************
+#  Copyright (c) 2026 University of Stuttgart
+#
+#  See the NOTICE file(s) distributed with this work for additional
+#  information regarding copyright ownership.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# ******************************************************************************
+
+import multiprocessing
+import os
+import queue
+import resource
+import threading
+
+import psutil
+
+from app import app
+
+
+class SandboxLimitExceededException(Exception):
+    pass
+
+
+class SandboxPool:
+    """
+    Pool of pre-forked processes executing user implementations, so that slow or memory-hungry implementations
+    can not block or bloat the API and worker processes.
+    The sandbox processes are forked from the current process and thus start with the SDKs already imported.
+    Each job is limited in CPU time, each process in address space, and processes are replaced by fresh ones
+    after max_jobs jobs or once their resident memory exceeds max_rss bytes.
+    """
+
+    def __init__(self, size, max_jobs, max_rss, cpu_time, memory_limit, timeout):
+        self.max_jobs = max_jobs
+        self.max_rss = max_rss
+        self.cpu_time = cpu_time
+        self.memory_limit = memory_limit
+        self.timeout = timeout
+        self._idle = queue.Queue()
+        for _ in range(size):
+            self._idle.put(self._start_process())
+
+    def run(self, function, *args):
+        """
+        Run the function in one of the sandbox processes.
+        :param function: a module-level function, so that it can be sent to the sandbox process
+        :param args:
+        :return: the (picklable) return value of the function
+        """
+
+        process, connection = self._idle.get()
+        replace = True
+        try:
+            connection.send((function, args))
+            if not connection.poll(self.timeout):
+                raise SandboxLimitExceededException(f"The implementation did not finish within {self.timeout}s")
+            status, payload, recycle = connection.recv()
+            replace = recycle
+        except (EOFError, OSError):
+            # the process was killed, e.g., because it exceeded its CPU time or memory limit
+            raise SandboxLimitExceededException("The implementation exceeded the resource limits of the sandbox")
+        finally:
+            if replace:
+                _stop_process(process, connection)
+                self._idle.put(self._start_process())
+            else:
+                self._idle.put((process, connection))
+
+        if status == 'error':
+            raise payload
+        return payload
+
+    def _start_process(self):
+        context = multiprocessing.get_context('fork')
+        connection, child_connection = context.Pipe()
+        process = context.Process(target=_serve, args=(child_connection, self.max_jobs, self.max_rss,
+                                                       self.cpu_time, self.memory_limit), daemon=True)
+        process.start()
+        child_connection.close()
+        return process, connection
+
+
+# the sandbox pool of this process, recreated in forked processes
+_pool = None
+_pool_pid = None
+_pool_lock = threading.Lock()
+
+
+def get_sandbox_pool():
+    """
+    Get the sandbox pool of this process.
+    :return: the pool, or None if sandboxing is disabled, i.e., SANDBOX_POOL_SIZE is 0
+    """
+
+    global _pool, _pool_pid
+    if app.config['SANDBOX_POOL_SIZE'] <= 0:
+        return None
+    with _pool_lock:
+        if _pool is None or _pool_pid != os.getpid():
+            _pool = SandboxPool(size=app.config['SANDBOX_POOL_SIZE'],
+                                max_jobs=app.config['SANDBOX_MAX_JOBS'],
+                                max_rss=app.config['SANDBOX_MAX_RSS'],
+                                cpu_time=app.config['SANDBOX_CPU_TIME'],
+                                memory_limit=app.config['SANDBOX_MEMORY_LIMIT'],
+                                timeout=app.config['SANDBOX_TIMEOUT'])
+            _pool_pid = os.getpid()
+        return _pool
+
+
+def _stop_process(process, connection):
+    if process.is_alive():
+        process.kill()
+    process.join()
+    connection.close()
+
+
+def _serve(connection, max_jobs, max_rss, cpu_time, memory_limit):
+    if memory_limit:
+        resource.setrlimit(resource.RLIMIT_AS, (memory_limit, resource.getrlimit(resource.RLIMIT_AS)[1]))
+
+    jobs = 0
+    while True:
+        try:
+            function, args = connection.recv()
+        except EOFError:
+            # the owning process exited
+            return
+
+        if cpu_time:
+            # RLIMIT_CPU counts the CPU time of the whole process, so extend the soft limit for every job
+            usage = resource.getrusage(resource.RUSAGE_SELF)
+            resource.setrlimit(resource.RLIMIT_CPU, (int(usage.ru_utime + usage.ru_stime) + cpu_time,
+                                                     resource.getrlimit(resource.RLIMIT_CPU)[1]))
+
+        try:
+            reply = ('result', function(*args))
+        except Exception as e:
+            reply = ('error', e)
+
+        jobs += 1
+        recycle = jobs >= max_jobs or psutil.Process().memory_info().rss > max_rss
+        try:
+            connection.send(reply + (recycle,))
+        except Exception as e:
+            # e.g., the result or the exception can not be pickled
+            connection.send(('error', RuntimeError(str(e)), recycle))
+
+        if recycle:
+            return
@@ -0,0 +1,269 @@
+# ******************************************************************************
+#  Copyright (c) 2026 University of Stuttgart
+#
+#  See the NOTICE file(s) distributed with this work for additional
+#  information regarding copyright ownership.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# ******************************************************************************
+
+
+import math
+import multiprocessing
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import psutil
+from pytket import Circuit as TKCircuit, OpType
+from pytket.extensions.qiskit import AerBackend
+
+from app import app
+
+STABILIZER = 'stabilizer'
+MATRIX_PRODUCT_STATE = 'matrix_product_state'
+STATEVECTOR = 'statevector'
+
+# operations supported by the stabilizer simulation of Aer
+STABILIZER_OP_TYPES = {OpType.H, OpType.X, OpType.Y, OpType.Z, OpType.S, OpType.Sdg, OpType.SX, OpType.SXdg,
+                       OpType.CX, OpType.CY, OpType.CZ, OpType.SWAP, OpType.noop, OpType.Barrier, OpType.Measure,
+                       OpType.Reset}
+
+# bytes per complex amplitude
+AMPLITUDE_SIZE = 16
+
+
+class SimulationMemoryException(Exception):
+    def __init__(self, required_memory, memory_limit):
+        self.required_memory = required_memory
+        self.memory_limit = memory_limit
+        super().__init__(f"Simulating the circuit requires an estimated {required_memory / 2 ** 30:.1f} GiB "
+                         f"of memory, but only {memory_limit / 2 ** 30:.1f} GiB are available")
+
+
+class SimulationPlan:
+    def __init__(self, method, circuit, required_memory):
+        self.method = method
+        self.circuit = circuit
+        self.required_memory = required_memory
+
+
+def run_local_simulation(circuit, shots, seed=None):
+    """
+    Simulate the compiled circuit locally with Aer, using the simulation method planned for the circuit.
+    If simulating shot by shot is required, the shots are split into shards that are simulated concurrently
+    in a process pool with independent seeds, and the counts of all shards are merged.
+    :param circuit: the pytket circuit, compiled for the AerBackend
+    :param shots:
+    :param seed: seed for the random number generators of the simulation, or None for a random seed
+    :return: the counts as returned by BackendResult.get_counts
+    :raises SimulationMemoryException: if no simulation method fits into the memory of the worker
+    """
+
+    plan = plan_simulation(circuit)
+    app.logger.info(f"Simulating circuit with {circuit.n_qubits} qubits using the {plan.method} method")
+    shards = get_shard_count(plan, shots)
+    if shards == 1:
+        return _simulate_shard(plan.circuit.to_dict(), shots, seed, plan.method)
+
+    shard_shots = [shots // shards + (1 if shard < shots % shards else 0) for shard in range(shards)]
+    shard_seeds = [int(child.generate_state(1)[0]) for child in np.random.SeedSequence(seed).spawn(shards)]
+    circuit_dict = plan.circuit.to_dict()
+
+    app.logger.info(f"Simulating {shots} shots in {shards} shards")
+    counts = Counter()
+    with ProcessPoolExecutor(max_workers=shards, mp_context=_get_shard_context()) as executor:
+        for shard_counts in executor.map(_simulate_shard, [circuit_dict] * shards, shard_shots, shard_seeds,
+                                         [plan.method] * shards):
+            counts.update(shard_counts)
+    return counts
+
+
+def plan_simulation(circuit):
+    """
+    Select the simulation method for the circuit:
+    Clifford circuits are simulated with the stabilizer method, small circuits with the statevector method,
+    and wider circuits with the method requiring less memory, which is the matrix product state method for
+    circuits with little entanglement.
+    :param circuit: the pytket circuit, compiled for the AerBackend
+    :return: the SimulationPlan
+    :raises SimulationMemoryException: if neither the statevector nor the matrix product state method fits into
+    the memory of the worker
+    """
+
+    stabilizer_circuit = get_stabilizer_circuit(circuit)
+    if stabilizer_circuit is not None:
+        return SimulationPlan(STABILIZER, stabilizer_circuit, estimate_stabilizer_memory(circuit))
+
+    memory_limit = get_memory_limit()
+    statevector_memory = estimate_statevector_memory(circuit)
+    mps_memory = estimate_mps_memory(circuit)
+
+    if statevector_memory <= memory_limit and (circuit.n_qubits < app.config['SIMULATION_MPS_MIN_QUBITS']
+                                               or statevector_memory <= mps_memory):
+        return SimulationPlan(STATEVECTOR, circuit, statevector_memory)
+    if mps_memory <= memory_limit:
+        return SimulationPlan(MATRIX_PRODUCT_STATE, circuit, mps_memory)
+    raise SimulationMemoryException(min(statevector_memory, mps_memory), memory_limit)
+
+
+def get_memory_limit():
+    """Get the memory in bytes a simulation may use, by default 80% of the memory currently available."""
+    if app.config['SIMULATION_MEMORY_LIMIT']:
+        return app.config['SIMULATION_MEMORY_LIMIT']
+    return int(psutil.virtual_memory().available * 0.8)
+
+
+def estimate_statevector_memory(circuit):
+    return AMPLITUDE_SIZE * 2 ** circuit.n_qubits
+
+
+def estimate_stabilizer_memory(circuit):
+    # the tableau holds 2n generators of 2n bits each
+    return (2 * circuit.n_qubits) ** 2 // 8 + 1
+
+
+def estimate_mps_memory(circuit):
+    """
+    Estimate an upper bound of the memory of the matrix product state simulation of the circuit.
+    The bond dimension at the cut between qubit k and k + 1 grows at most by a factor of 2 with every
+    two-qubit gate acting across the cut, and is bounded by the dimension of the smaller side of the cut.
+    """
+
+    n_qubits = circuit.n_qubits
+    if n_qubits < 2:
+        return AMPLITUDE_SIZE * 2
+    index = {qubit: position for position, qubit in enumerate(circuit.qubits)}
+    crossing_gates = [0] * (n_qubits - 1)
+    for command in circuit.get_commands():
+        positions = [index[qubit] for qubit in command.qubits]
+        if len(positions) > 1:
+            for cut in range(min(positions), max(positions)):
+                crossing_gates[cut] += 1
+
+    bond_exponents = [0] + [min(cut + 1, n_qubits - cut - 1, crossing)
+                            for cut, crossing in enumerate(crossing_gates)] + [0]
+    # every site holds two matrices of its left times its right bond dimension
+    return sum(2 * AMPLITUDE_SIZE * 2 ** (left + right) for left, right in zip(bond_exponents, bond_exponents[1:]))
+
+
+def get_stabilizer_circuit(circuit):
+    """
+    Get the circuit with all operations expressed by gates of the stabilizer simulation of Aer.
+    Single-qubit Clifford gates that the compilation produced as TK1 gates are decomposed into Z and X rotations
+    by multiples of a quarter turn, which are expressed by S, Z, Sdg, and H gates.
+    :param circuit: the pytket circuit
+    :return: the equivalent stabilizer circuit up to global phase, or None if the circuit is not a Clifford circuit
+    """
+
+    stabilizer_circuit = TKCircuit()
+    for qubit in circuit.qubits:
+        stabilizer_circuit.add_qubit(qubit)
+    for bit in circuit.bits:
+        stabilizer_circuit.add_bit(bit)
+
+    for command in circuit.get_commands():
+        op_type = command.op.type
+        if op_type == OpType.TK1:
+            quarter_turns = [_get_quarter_turns(angle) for angle in command.op.params]
+            if None in quarter_turns:
+                return None
+            # TK1(a, b, c) = Rz(a) Rx(b) Rz(c), so Rz(c) is applied first
+            qubit = command.qubits[0]
+            _add_z_quarter_turns(stabilizer_circuit, qubit, quarter_turns[2])
+            if quarter_turns[1]:
+                stabilizer_circuit.H(qubit)
+                _add_z_quarter_turns(stabilizer_circuit, qubit, quarter_turns[1])
+                stabilizer_circuit.H(qubit)
+            _add_z_quarter_turns(stabilizer_circuit, qubit, quarter_turns[0])
+        elif op_type == OpType.Measure:
+            stabilizer_circuit.Measure(command.qubits[0], command.bits[0])
+        elif op_type == OpType.Barrier:
+            stabilizer_circuit.add_barrier(command.args)
+        elif op_type in STABILIZER_OP_TYPES:
+            stabilizer_circuit.add_gate(command.op, command.args)
+        else:
+            return None
+    return stabilizer_circuit
+
+
+def _get_quarter_turns(angle):
+    """Get the number of quarter turns (mod 4) of the angle given in half turns, or None if it is no multiple"""
+    try:
+        quarter_turns = 2 * float(angle)
+    except TypeError:
+        # symbolic angle
+        return None
+    if not math.isclose(quarter_turns, round(quarter_turns), abs_tol=1e-9):
+        return None
+    return round(quarter_turns) % 4
+
+
+def _add_z_quarter_turns(circuit, qubit, quarter_turns):
+    if quarter_turns == 1:
+        circuit.S(qubit)
+    elif quarter_turns == 2:
+        circuit.Z(qubit)
+    elif quarter_turns == 3:
+        circuit.Sdg(qubit)
+
+
+def get_shard_count(plan, shots):
+    """
+    Get the number of shards to split the shots of the planned simulation into.
+    Shots are only split if Aer can not sample all of them from a single simulation of the circuit, and the
+    circuit is wide enough that simulating the shards outweighs starting their processes.
+    Every shard holds its own state, so the shards are limited by the available memory as well.
+    """
+
+    circuit = plan.circuit
+    max_shards = app.config['SIMULATION_SHARDS']
+    if max_shards <= 1 or plan.method == STABILIZER or circuit.n_qubits < app.config['SIMULATION_SHARD_MIN_QUBITS']:
+        return 1
+    if not requires_shot_by_shot_simulation(circuit):
+        return 1
+    max_shards = min(max_shards, get_memory_limit() // max(plan.required_memory, 1))
+    return max(1, min(max_shards, shots // app.config['SIMULATION_SHARD_MIN_SHOTS']))
+
+
+def requires_shot_by_shot_simulation(circuit):
+    """
+    Check if the circuit has to be simulated once per shot, i.e., if it contains resets, classically controlled
+    operations, or operations on qubits after they were measured. Otherwise, Aer samples all shots from one state.
+    """
+
+    measured_qubits = set()
+    for command in circuit.get_commands():
+        op_type = command.op.type
+        if op_type in (OpType.Reset, OpType.Conditional):
+            return True
+        if op_type == OpType.Measure:
+            measured_qubits.update(command.qubits)
+        elif op_type != OpType.Barrier and measured_qubits.intersection(command.qubits):
+            return True
+    return False
+
+
+def _get_shard_context():
+    # Aer parallelises with OpenMP, whose threads deadlock in processes forked after a simulation ran in the parent,
+    # so the shards are forked from a server process that never simulates
+    context = multiprocessing.get_context('forkserver')
+    context.set_forkserver_preload(['app.simulation'])
+    return context
+
+
+def _simulate_shard(circuit_dict, shots, seed, simulation_method):
+    backend = AerBackend(simulation_method=simulation_method)
+    job_handle = backend.process_circuit(TKCircuit.from_dict(circuit_dict), n_shots=shots, seed=seed,
+                                         valid_check=False)
+    return backend.get_result(job_handle).get_counts()
@@ -17,47 +17,26 @@
 #  limitations under the License.
 # ******************************************************************************
 import json
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 
 from pyquil import Program as PyQuilProgram
+from pytket import Circuit as TKCircuit
 from pytket.extensions.pyquil import pyquil_to_tk, tk_to_pyquil
+from pytket.backends import ResultHandle, StatusEnum
 from pytket.passes import DefaultMappingPass
 from pytket.predicates import ConnectivityPredicate
-from pytket.qasm import circuit_to_qasm_str, circuit_from_qasm_str
 from rq import get_current_job
+from werkzeug.exceptions import HTTPException
 from qiskit.qasm2 import dumps
 
-from app import implementation_handler, db, app, tket_handler
+from app import implementation_handler, db, app, tket_handler, transpile_handler, conversion_strategy, \
+    qasm_ingestion, result_polling, result_encoding, simulation
 from app.generated_circuit_model import Generated_Circuit
 from app.result_model import Result
-from app.tket_handler import tket_transpile_circuit, UnsupportedGateException, get_backend, setup_credentials, \
-    get_circuit_qasm
-
-
-def convert_counts_to_json(counts):
-    result = {}
-    for bits, count in counts.items():
-        # bitstring = np.binary_repr(bits)
-        bitstring = "".join([str(b) for b in bits])
-        # reverse the string to be uniform with IBM Quantum results
-        result[bitstring[::-1]] = int(count)
-
-    return json.dumps(result)
-
-
-def rename_qreg_lowercase(circuit, *regs):
-    """
-    Renames qubit-registers to lowercase names, because uppercase letters in register names causes the execution to fail.
-    :param circuit: the circuit
-    :param regs: list of registers
-    :return:
-    """
-
-    qasm = circuit_to_qasm_str(circuit)
-
-    for reg in regs:
-        qasm = qasm.replace(reg, reg.lower())
-
-    return circuit_from_qasm_str(qasm)
+from app.transpiled_circuit_model import Transpiled_Circuit
+from app.tket_handler import tket_compile_circuit, is_tk_circuit, get_backend, setup_credentials, get_circuit_qasm, \
+    is_local_simulator
 
 
 def generate(impl_url, impl_data, impl_language, input_params, bearer_token):
@@ -78,23 +57,116 @@ def generate(impl_url, impl_data, impl_language, input_params, bearer_token):
 
     if generated_circuit_code:
         generated_circuit_object = Generated_Circuit.query.get(job.get_id())
-        if impl_language.lower() == 'pyquil':
-            generated_circuit_object.generated_circuit = str(generated_circuit_code)
-        elif impl_language.lower() == 'qiskit':
-            # convert the circuit to QASM string
-            generated_circuit_object.generated_circuit = dumps(generated_circuit_code)
-        generated_circuit_code, generated_circuit_object.original_width, generated_circuit_object.original_depth, generated_circuit_object.original_multi_qubit_gate_depth, generated_circuit_object.original_total_number_of_operations, generated_circuit_object.original_number_of_multi_qubit_gates, generated_circuit_object.original_number_of_measurement_operations, generated_circuit_object.original_number_of_single_qubit_gates = tket_handler.tket_analyze_original_circuit(
-            generated_circuit_code, impl_language=impl_language, short_impl_name=short_impl_name,
-            logger=app.logger.info, precompile_circuit=False)
-
+        store_generated_circuit_properties(generated_circuit_object,
+                                           analyze_generated_circuit(generated_circuit_code, impl_language,
+                                                                     short_impl_name))
         generated_circuit_object.input_params = json.dumps(input_params)
         app.logger.info(f"Received input params for circuit generation: {generated_circuit_object.input_params}")
         generated_circuit_object.complete = True
         db.session.commit()
 
 
+def analyze_generated_circuit(circuit, impl_language, short_impl_name):
+    """Serialise the generated circuit and analyze its properties. Return them keyed by Generated_Circuit column."""
+    properties = {}
+    if impl_language.lower() == 'pyquil':
+        properties['generated_circuit'] = str(circuit)
+    elif impl_language.lower() == 'qiskit':
+        # convert the circuit to QASM string
+        properties['generated_circuit'] = dumps(circuit)
+
+    _, properties['original_width'], properties['original_depth'], properties['original_multi_qubit_gate_depth'], \
+        properties['original_total_number_of_operations'], properties['original_number_of_multi_qubit_gates'], \
+        properties['original_number_of_measurement_operations'], \
+        properties['original_number_of_single_qubit_gates'] = tket_handler.tket_analyze_original_circuit(
+            circuit, impl_language=impl_language, short_impl_name=short_impl_name, logger=app.logger.info,
+            precompile_circuit=False)
+    return properties
+
+
+def store_generated_circuit_properties(generated_circuit_object, properties):
+    for column, value in properties.items():
+        setattr(generated_circuit_object, column, value)
+
+
+def generate_sweep(impl_url, impl_data, impl_language, input_params_list, bearer_token):
+    """
+    Generate and analyze the circuits of one implementation for all given sets of input parameters.
+    The implementation is downloaded once, and the variants are generated in parallel worker processes.
+    Each variant is stored in the Generated_Circuit row of the sweep with the same index.
+    """
+
+    app.logger.info(f"Starting generate sweep task for {len(input_params_list)} sets of input parameters...")
+    job = get_current_job()
+    generated_circuit_objects = Generated_Circuit.query.filter_by(sweep_id=job.get_id()) \
+        .order_by(Generated_Circuit.sweep_index).all()
+
+    if impl_url:
+        impl_data = implementation_handler.download_implementation(impl_url, bearer_token)
+
+    if not impl_data:
+        for generated_circuit_object in generated_circuit_objects:
+            generated_circuit_object.generated_circuit = json.dumps({'error': 'generating circuit failed'})
+            generated_circuit_object.complete = True
+        db.session.commit()
+        return
+
+    # fork, so that the workers inherit the loaded SDKs and the compiled implementation
+    processes = min(app.config['GENERATE_SWEEP_PROCESSES'], len(input_params_list))
+    with ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context('fork')) as executor:
+        futures = [executor.submit(_generate_sweep_variant, impl_data, impl_language, input_params)
+                   for input_params in input_params_list]
+        for generated_circuit_object, input_params, future in zip(generated_circuit_objects, input_params_list,
+                                                                  futures):
+            try:
+                properties = future.result()
+            except Exception as e:
+                app.logger.info(f"Generating circuit {generated_circuit_object.sweep_index} of sweep failed: {str(e)}")
+                properties = None
+
+            if properties:
+                store_generated_circuit_properties(generated_circuit_object, properties)
+            else:
+                generated_circuit_object.generated_circuit = json.dumps({'error': 'generating circuit failed'})
+            generated_circuit_object.input_params = json.dumps(input_params)
+            generated_circuit_object.complete = True
+            db.session.commit()
+
+
+def _generate_sweep_variant(impl_data, impl_language, input_params):
+    circuit, short_impl_name = implementation_handler.prepare_code(None, impl_data, impl_language, input_params)
+    if not circuit:
+        return None
+    return analyze_generated_circuit(circuit, impl_language, short_impl_name)
+
+
+def transpile(impl_url, impl_data, impl_language, input_params, provider, qpu_name, bearer_token: str = "",
+              optimisation_level=tket_handler.DEFAULT_OPTIMISATION_LEVEL, compile_timeout=None, portfolio=False,
+              portfolio_objective=tket_handler.PORTFOLIO_OBJECTIVE_MULTI_QUBIT_GATES, profile=False):
+    """Generate and transpile the circuit. Save the transpiled circuit and its properties in db"""
+    app.logger.info("Starting transpile task...")
+    job = get_current_job()
+
+    try:
+        response, _ = transpile_handler.transpile(impl_url, impl_data, impl_language, input_params, provider,
+                                                  qpu_name, bearer_token, optimisation_level, compile_timeout,
+                                                  portfolio, portfolio_objective, profile)
+    except HTTPException as e:
+        response = {'error': e.description}
+    except Exception as e:
+        # any failure completes the transpiled circuit, so that clients polling for it do not wait forever
+        app.logger.warning(f"Transpile job {job.get_id()} failed: {str(e)}")
+        db.session.rollback()
+        response = {'error': str(e)}
+
+    transpiled_circuit = Transpiled_Circuit.query.get(job.get_id())
+    transpiled_circuit.response = json.dumps(response)
+    transpiled_circuit.complete = True
+    db.session.commit()
+
+
 def execute(correlation_id, impl_url, impl_data, transpiled_qasm, transpiled_quil, input_params, provider, qpu_name,
-            impl_language, shots, bearer_token: str = ""):
+            impl_language, shots, bearer_token: str = "", seed=None):
     """Create database entry for result. Get implementation code, prepare it, and execute it. Save result in db"""
     job = get_current_job()
 
@@ -108,20 +180,18 @@ def execute(correlation_id, impl_url, impl_data, transpiled_qasm, transpiled_qui
                                                                        bearer_token)
         # Transpile the circuit for the backend
         try:
-            circuit = tket_transpile_circuit(circuit, impl_language=impl_language, backend=backend,
-                                             short_impl_name=short_impl_name, logger=None, precompile_circuit=False)
-        except UnsupportedGateException:
-            circuit = tket_transpile_circuit(circuit, impl_language=impl_language, backend=backend,
-                                             short_impl_name=short_impl_name, logger=None, precompile_circuit=True)
+            circuit = conversion_strategy.convert_circuit(circuit, impl_language=impl_language,
+                                                          short_impl_name=short_impl_name)
+            circuit, _ = tket_compile_circuit(circuit, backend=backend, short_impl_name=short_impl_name)
         finally:
-            if not backend.valid_circuit(circuit):
+            if not is_tk_circuit(circuit) or not backend.valid_circuit(circuit):
                 result = Result.query.get(job.get_id())
                 result.result = json.dumps({'error': 'execution failed'})
                 result.complete = True
                 db.session.commit()
                 return
     elif transpiled_qasm:
-        circuit = circuit_from_qasm_str(transpiled_qasm)
+        circuit = qasm_ingestion.load_qasm(transpiled_qasm)
 
         if not backend.valid_circuit(circuit):
             result = Result.query.get(job.get_id())
@@ -146,26 +216,193 @@ def execute(correlation_id, impl_url, impl_data, transpiled_qasm, transpiled_qui
             return
 
     # Rename registers to lower case
-    register_names = set(map(lambda q: q.reg_name, circuit.qubits))
-    circuit = rename_qreg_lowercase(circuit, *register_names)
+    circuit = qasm_ingestion.rename_registers_lowercase(circuit)
+
+    result = Result.query.get(job.get_id())
+    post_processing = {'correlation_id': correlation_id, 'impl_url': impl_url, 'impl_data': impl_data,
+                       'bearer_token': bearer_token}
+
+    if is_local_simulator(provider, qpu_name):
+        # validity was checked before
+        try:
+            counts = simulation.run_local_simulation(circuit, shots, seed)
+        except simulation.SimulationMemoryException as e:
+            result.result = json.dumps({'error': str(e)})
+            result.complete = True
+            db.session.commit()
+            return
+        store_execution_result(result, counts, **post_processing)
+        return
 
     # Execute the circuit on the backend
     # validity was checked before
     job_handle = backend.process_circuit(circuit, n_shots=shots, valid_check=False)
-    job_status = backend.circuit_status(job_handle)
+
+    if result_polling.is_enabled() and backend.persistent_handles:
+        # release the worker while the job is queued at the provider, the result is polled in the background
+        result.job_handle = str(job_handle)
+        db.session.commit()
+        result_polling.add_pending_result(result.id, provider, qpu_name, input_params, post_processing)
+        return
+
     job_result = backend.get_result(job_handle)
+    # the backend instance is pooled, so drop the result from its cache
+    backend.pop_result(job_handle)
+    store_execution_result(result, job_result.get_counts(), **post_processing)
 
-    result = Result.query.get(job.get_id())
-    counts = job_result.get_counts()
-    print(counts)
-    result.result = convert_counts_to_json(counts)
+
+def execute_batch(implementations, input_params, provider, qpu_name, impl_language, shots, bearer_token: str = ""):
+    """
+    Prepare and compile all circuits of the batch in parallel and submit them to the backend in a single call,
+    or simulate them one by one on the local simulators.
+    Save the result of each circuit in the Result row of the batch with the same index.
+    :param implementations: list of dicts with either the impl-url, the impl-data, or the transpiled-qasm of a circuit
+    """
+
+    job = get_current_job()
+    results = Result.query.filter_by(batch_id=job.get_id()).order_by(Result.batch_index).all()
+
+    # setup the SDK credentials first, the worker processes inherit them together with the pooled backend
+    setup_credentials(provider, **input_params)
+    backend = get_backend(provider, qpu_name)
+
+    processes = min(app.config['EXECUTE_BATCH_PROCESSES'], len(implementations))
+    with ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context('fork')) as executor:
+        futures = [executor.submit(_prepare_batch_circuit, implementation, impl_language, input_params, provider,
+                                   qpu_name, bearer_token) for implementation in implementations]
+        circuits = []
+        for result, future in zip(results, futures):
+            try:
+                circuits.append(future.result())
+            except Exception as e:
+                app.logger.info(f"Preparing circuit {result.batch_index} of batch failed: {str(e)}")
+                circuits.append(None)
+
+    _store_batch_error([result for result, circuit in zip(results, circuits) if circuit is None], 'execution failed')
+
+    submitted = [(result, TKCircuit.from_dict(circuit)) for result, circuit in zip(results, circuits) if circuit]
+    if not submitted:
+        return
+
+    if is_local_simulator(provider, qpu_name):
+        # like single executions, each circuit is simulated with its own method, memory check, and shot shards
+        for result, circuit in submitted:
+            try:
+                counts = simulation.run_local_simulation(circuit, shots)
+            except Exception as e:
+                app.logger.info(f"Simulating circuit {result.batch_index} of batch failed: {str(e)}")
+                _store_batch_error([result], str(e))
+                continue
+            store_execution_result(result, counts, correlation_id=None, impl_url=None, impl_data=None)
+        return
+
+    try:
+        # validity was checked before
+        job_handles = backend.process_circuits([circuit for _, circuit in submitted], n_shots=shots,
+                                               valid_check=False)
+    except Exception as e:
+        app.logger.warning(f"Submitting batch {job.get_id()} failed: {str(e)}")
+        _store_batch_error([result for result, _ in submitted], f"execution failed: {str(e)}")
+        return
+
+    for (result, _), job_handle in zip(submitted, job_handles):
+        result.job_handle = str(job_handle)
+    db.session.commit()
+
+    if result_polling.is_enabled() and backend.persistent_handles:
+        for result, _ in submitted:
+            result_polling.add_pending_result(result.id, provider, qpu_name, input_params,
+                                              {'correlation_id': None, 'impl_url': None, 'impl_data': None})
+        return
+
+    try:
+        job_results = backend.get_results(job_handles)
+    except Exception as e:
+        app.logger.warning(f"Retrieving the results of batch {job.get_id()} failed: {str(e)}")
+        _store_batch_error([result for result, _ in submitted], f"execution failed: {str(e)}")
+        return
+
+    for (result, _), job_handle, job_result in zip(submitted, job_handles, job_results):
+        backend.pop_result(job_handle)
+        store_execution_result(result, job_result.get_counts(), correlation_id=None, impl_url=None, impl_data=None)
+
+
+def _store_batch_error(results, error):
+    """Complete the given results of a batch with the error, so that polling the batch finishes"""
+    for result in results:
+        result.result = json.dumps({'error': error})
+        result.complete = True
+    db.session.commit()
+
+
+def _prepare_batch_circuit(implementation, impl_language, input_params, provider, qpu_name, bearer_token):
+    """Prepare and compile one circuit of a batch. Runs in a worker process of the pool."""
+    backend = get_backend(provider, qpu_name)
+    impl_url = implementation.get('impl-url')
+    impl_data = implementation.get('impl-data')
+    transpiled_qasm = implementation.get('transpiled-qasm')
+
+    if transpiled_qasm:
+        circuit = qasm_ingestion.load_qasm(transpiled_qasm)
+    else:
+        circuit, short_impl_name = implementation_handler.prepare_code(impl_url, impl_data, impl_language,
+                                                                       input_params, bearer_token)
+        circuit = conversion_strategy.convert_circuit(circuit, impl_language=impl_language,
+                                                      short_impl_name=short_impl_name)
+        circuit, _ = tket_compile_circuit(circuit, backend=backend, short_impl_name=short_impl_name)
+
+    if not is_tk_circuit(circuit) or not backend.valid_circuit(circuit):
+        return None
+    # Rename registers to lower case
+    return qasm_ingestion.rename_registers_lowercase(circuit).to_dict()
+
+
+def poll_results(group, provider, qpu_name, input_params):
+    """Check the status of all due jobs of the poll group and store the results of the completed ones in db"""
+    try:
+        setup_credentials(provider, **input_params)
+        backend = get_backend(provider, qpu_name)
+
+        for result_id, state in result_polling.get_due_results(group):
+            result = Result.query.get(result_id)
+            if result is None or result.complete:
+                result_polling.remove_result(group, result_id)
+                continue
+
+            job_handle = ResultHandle.from_str(result.job_handle)
+            try:
+                job_status = backend.circuit_status(job_handle)
+            except Exception as e:
+                app.logger.info(f"Polling the status of result {result_id} failed: {str(e)}")
+                result_polling.reschedule_result(group, result_id, state)
+                continue
+
+            if job_status.status == StatusEnum.COMPLETED:
+                job_result = backend.get_result(job_handle)
+                backend.pop_result(job_handle)
+                store_execution_result(result, job_result.get_counts(), **state['post-processing'])
+                result_polling.remove_result(group, result_id)
+            elif job_status.status in (StatusEnum.ERROR, StatusEnum.CANCELLED):
+                result.result = json.dumps({'error': f"execution failed: {job_status.message}"})
+                result.complete = True
+                db.session.commit()
+                result_polling.remove_result(group, result_id)
+            else:
+                result_polling.reschedule_result(group, result_id, state)
+    finally:
+        result_polling.finish_poll(group, provider, qpu_name, input_params)
+
+
+def store_execution_result(result, counts, correlation_id, impl_url, impl_data, bearer_token: str = ""):
+    """Store the counts of the execution in the result, after applying the post processing of the implementation"""
+    result.counts = result_encoding.encode_counts(counts)
     # check if implementation contains post processing of execution results that has to be executed
     if correlation_id and (impl_url or impl_data):
         result.generated_circuit_id = correlation_id
         # prepare input data containing execution results and initial input params for generating the circuit
         generated_circuit = Generated_Circuit.query.get(correlation_id)
         input_params_for_post_processing = json.loads(generated_circuit.input_params)
-        input_params_for_post_processing['counts'] = json.loads(result.result)
+        input_params_for_post_processing['counts'] = result_encoding.decode_counts(result.counts)
 
         if impl_url:
             post_p_result = implementation_handler.prepare_code_from_url(url=impl_url,
@@ -19,6 +19,12 @@
 
 import re
 import os
+import time
+import hashlib
+import threading
+import multiprocessing
+from collections import OrderedDict
+from functools import partial
 
 import boto3
 from braket.aws.aws_session import AwsSession
@@ -29,12 +35,21 @@ from pytket.extensions.pyquil import pyquil_to_tk, tk_to_pyquil
 from pytket import Circuit as TKCircuit
 from pytket.circuit import OpType
 from pytket.qasm import circuit_to_qasm_str
+from pytket.passes import SequencePass, DecomposeBoxes, FullPeepholeOptimise, PlacementPass, RoutingPass, \
+    SynthesiseTket, RemoveRedundancies
+from pytket.placement import LinePlacement, GraphPlacement
+from pytket.architecture import Architecture
+from pytket.predicates import MaxNQubitsPredicate
 from flask import abort
 
 from qiskit.compiler import transpile
 import qiskit.circuit.library as qiskit_gates
 
+from app import app, device_metadata
+from app.circuit_metrics import analyze_circuit
+
 AWS_BRAKET_HOSTED_PROVIDERS = ['rigetti', 'aws']
+LOCAL_SIMULATORS = ['ibmq_qasm_simulator', 'aer_simulator']
 # Get environment variables
 qvm_hostname = os.environ.get('QVM_HOSTNAME', default='localhost')
 qvm_port = os.environ.get('QVM_PORT', default=5016)
@@ -49,6 +64,18 @@ aws_qpu_to_region = {
     'rigetti': "us-west-1"
 }
 
+DEFAULT_OPTIMISATION_LEVEL = 2
+
+PORTFOLIO_OBJECTIVE_MULTI_QUBIT_GATES = 'multi-qubit-gates'
+PORTFOLIO_OBJECTIVE_DEPTH = 'depth'
+
+# Backend instances shared by all requests and jobs of this process, keyed by (provider, qpu, credential fingerprint)
+# and evicted least recently used first
+_backend_pool = OrderedDict()
+_backend_pool_lock = threading.Lock()
+# Fingerprint of the credentials most recently configured for each provider
+_credential_fingerprints = {}
+
 def prepare_transpile_response(circuit, provider):
     if provider.lower() in ['rigetti']:
         transpiled_quil = tk_to_pyquil(circuit)
@@ -70,6 +97,15 @@ def get_depth_without_barrier(circuit):
     return circuit.depth_by_type(circuit_ops)
 
 
+def get_credential_fingerprint(*credentials):
+    return hashlib.sha256("|".join(map(str, credentials)).encode()).hexdigest()
+
+
+def get_current_credential_fingerprint(provider):
+    """Get the fingerprint of the credentials the last setup_credentials call configured for the provider"""
+    return _credential_fingerprints.get(provider.lower(), "")
+
+
 def setup_credentials(provider, **kwargs):
     if provider.lower() == "ibmq":
         if 'token' in kwargs:
@@ -77,6 +113,8 @@ def setup_credentials(provider, **kwargs):
             group = 'open'
             project = 'main'
             set_ibmq_config(ibmq_api_token=kwargs['token'], instance=f"{hub}/{group}/{project}")
+            _credential_fingerprints[provider.lower()] = get_credential_fingerprint(kwargs['token'], hub, group,
+                                                                                    project)
         else:
             abort(400)
     # Note that IonQ support is depricated, see https://pypi.org/project/pytket-ionq/ #
@@ -94,6 +132,9 @@ def setup_credentials(provider, **kwargs):
             )
             global aws_session
             aws_session = AwsSession(boto_session)
+            _credential_fingerprints[provider.lower()] = get_credential_fingerprint(kwargs['aws-access-key-id'],
+                                                                                    kwargs['aws-secret-access-key'],
+                                                                                    kwargs.get('region', 'eu-west-2'))
         else:
             abort(400)
 
@@ -126,15 +167,56 @@ def get_circuit_conversion_for(impl_language):
 def get_backend(provider, qpu):
     """
     Get the backend instance by name
-    Expects for AWS that the setup_credentials method is called before
+    Backends are pooled per process and recreated after BACKEND_POOL_TTL seconds,
+    so that the device characterisation is only fetched again when it may have changed.
+    At most BACKEND_POOL_SIZE backends are kept, e.g., for different credentials of the same QPU.
+    Backends of remote devices are hydrated from the device metadata snapshot shared by all processes if possible.
+    Expects for IBMQ and AWS that the setup_credentials method is called before
+    :param provider:
+    :param qpu:
+    :return:
+    """
+
+    key = (provider.lower(), qpu, _credential_fingerprints.get(provider.lower(), ""))
+    with _backend_pool_lock:
+        pooled = _backend_pool.get(key)
+        if pooled is not None and time.monotonic() - pooled[1] < app.config['BACKEND_POOL_TTL']:
+            _backend_pool.move_to_end(key)
+            return pooled[0]
+
+    # the snapshot backend may create the actual backend later on, so it has to use the current credentials
+    create_backend = partial(_create_backend, provider, qpu, aws_session)
+    if is_local_simulator(provider, qpu) or not app.config['DEVICE_METADATA_MAX_AGE']:
+        backend = create_backend()
+    else:
+        backend = device_metadata.get_snapshot_backend(provider, qpu, create_backend)
+
+    if backend is not None:
+        with _backend_pool_lock:
+            _backend_pool[key] = (backend, time.monotonic())
+            _backend_pool.move_to_end(key)
+            while len(_backend_pool) > app.config['BACKEND_POOL_SIZE']:
+                _backend_pool.popitem(last=False)
+    return backend
+
+
+def is_local_simulator(provider, qpu):
+    """Check if the backend simulates circuits locally, i.e., in the worker process"""
+    return provider.lower() == "ibmq" and qpu in LOCAL_SIMULATORS
+
+
+def _create_backend(provider, qpu, session=None):
+    """
+    Create a new backend instance by name
     :param provider:
     :param qpu:
+    :param session: the AWS session to access the AWS Braket service with
     :return:
     """
 
     if provider.lower() == "ibmq":
         try:
-            if (qpu == 'ibmq_qasm_simulator') or (qpu == 'aer_simulator'):
+            if qpu in LOCAL_SIMULATORS:
                 return AerBackend()
             return IBMQBackend(qpu)
         except ValueError:
@@ -150,13 +232,13 @@ def get_backend(provider, qpu):
     #         return IonQBackend(qpu)
     #     except ValueError:
     #         return None
-    if aws_session is not None and provider.lower() == "aws":
+    if session is not None and provider.lower() == "aws":
         qpu_provider_for_aws = provider
         if "Aria" in qpu or "Harmony" in qpu:
             qpu_provider_for_aws = 'ionq'
         qpu_name_for_request = qpu.replace(" ", "-")
         backend = BraketBackend(device=qpu_name_for_request, device_type='qpu', provider=qpu_provider_for_aws,
-                                region=aws_qpu_to_region[provider], aws_session=aws_session)
+                                region=aws_qpu_to_region[provider], aws_session=session)
         return backend
     if provider.lower() == "rigetti":
         # Create a connection to the forest SDK
@@ -237,6 +319,10 @@ class TooManyQubitsException(Exception):
     pass
 
 
+class CompilationTimeoutException(Exception):
+    pass
+
+
 def tket_analyze_original_circuit(circuit, impl_language, short_impl_name, logger=None, precompile_circuit=False):
     if precompile_circuit:
         if logger:
@@ -247,30 +333,33 @@ def tket_analyze_original_circuit(circuit, impl_language, short_impl_name, logge
         to_tk = get_circuit_conversion_for(impl_language)
         circuit = to_tk(circuit)
 
-        non_transpiled_width = circuit.n_qubits
-        non_transpiled_depth = get_depth_without_barrier(circuit)
-        non_transpiled_multi_qubit_gate_depth = get_multi_qubit_gate_depth(circuit)
-        non_transpiled_total_number_of_operations = circuit.n_gates
-        non_transpiled_number_of_multi_qubit_gates = get_number_of_multi_qubit_gates(circuit)
-        non_transpiled_number_of_measurement_operations = get_number_of_measurement_operations(circuit)
-        non_transpiled_number_of_single_qubit_gates = non_transpiled_total_number_of_operations \
-                                                      - non_transpiled_number_of_multi_qubit_gates \
-                                                      - non_transpiled_number_of_measurement_operations
-
-    except KeyError as e:
-        # unsupported gate type caused circuit conversion to fail
+        metrics = analyze_circuit(circuit)
+
+    except (KeyError, NotImplementedError) as e:
+        # unsupported gate type caused circuit conversion to fail (newer pytket versions raise NotImplementedError)
         raise UnsupportedGateException(str(e))
 
     return circuit, \
-           non_transpiled_width, \
-           non_transpiled_depth, \
-           non_transpiled_multi_qubit_gate_depth, \
-           non_transpiled_total_number_of_operations, \
-           non_transpiled_number_of_multi_qubit_gates, \
-           non_transpiled_number_of_measurement_operations, \
-           non_transpiled_number_of_single_qubit_gates
-
-def tket_transpile_circuit(circuit, impl_language, backend, short_impl_name, logger=None, precompile_circuit=False):
+           metrics.width, \
+           metrics.depth, \
+           metrics.multi_qubit_gate_depth, \
+           metrics.total_number_of_operations, \
+           metrics.number_of_multi_qubit_gates, \
+           metrics.number_of_measurement_operations, \
+           metrics.number_of_single_qubit_gates
+
+def tket_transpile_circuit(circuit, impl_language, backend, short_impl_name, logger=None, precompile_circuit=False,
+                           optimisation_level=DEFAULT_OPTIMISATION_LEVEL, timeout=None):
+    circuit = tket_convert_circuit(circuit, impl_language, short_impl_name, logger=logger,
+                                   precompile_circuit=precompile_circuit)
+    compiled_circuit, _ = tket_compile_circuit(circuit, backend, short_impl_name, logger=logger,
+                                               optimisation_level=optimisation_level, timeout=timeout)
+    return compiled_circuit
+
+
+def tket_convert_circuit(circuit, impl_language, short_impl_name, logger=None, precompile_circuit=False):
+    if is_tk_circuit(circuit):
+        return circuit
     if precompile_circuit:
         if logger:
             logger(f"Precompiling {short_impl_name} using {impl_language} standard compiler...")
@@ -278,95 +367,318 @@ def tket_transpile_circuit(circuit, impl_language, backend, short_impl_name, log
     try:
         # Convert the given Circuit (implemented with impl_language) to a standard TKet circuit
         to_tk = get_circuit_conversion_for(impl_language)
-        circuit = to_tk(circuit)
+        return to_tk(circuit)
 
-    except KeyError as e:
-        # unsupported gate type caused circuit conversion to fail
+    except (KeyError, NotImplementedError) as e:
+        # unsupported gate type caused circuit conversion to fail (newer pytket versions raise NotImplementedError)
         raise UnsupportedGateException(str(e))
 
+
+def tket_compile_circuit(circuit, backend, short_impl_name, logger=None, optimisation_level=DEFAULT_OPTIMISATION_LEVEL,
+                         timeout=None):
+    """
+    Compiles the tket circuit for the backend.
+    If a timeout is given, the compilation runs in a separate process that is killed once its share of the timeout
+    is exceeded, and the compilation is retried with the next lower optimisation level.
+    :param circuit:
+    :param backend:
+    :param short_impl_name:
+    :param logger:
+    :param optimisation_level: the optimisation level to start with
+    :param timeout: the seconds granted to the whole compilation including its fallbacks, or None for no limit
+    :return: the compiled circuit and the optimisation level that was used
+    """
+
+    if not timeout:
+        return _compile_circuit(circuit, backend, optimisation_level), optimisation_level
+
+    deadline = time.monotonic() + timeout
+    for level in range(optimisation_level, -1, -1):
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        # the lower levels are much cheaper, so each level leaves half of the remaining time to its fallbacks
+        level_timeout = remaining / 2 if level > 0 else remaining
+        try:
+            compiled_circuit = run_in_subprocess(lambda: _compile_circuit(circuit, backend, level).to_dict(),
+                                                 level_timeout)
+            return TKCircuit.from_dict(compiled_circuit), level
+        except CompilationTimeoutException:
+            if logger:
+                logger(f"Compiling {short_impl_name} with optimisation level {level} exceeded {level_timeout:.1f}s.")
+
+    raise CompilationTimeoutException()
+
+
+def tket_profile_compilation(circuit, backend, short_impl_name, logger=None,
+                             optimisation_level=DEFAULT_OPTIMISATION_LEVEL, timeout=None):
+    """
+    Compiles the tket circuit for the backend by applying the passes of its default compilation pass one after
+    another, and records the wall time, the number of gates, and the depth after each pass.
+    :param circuit:
+    :param backend:
+    :param short_impl_name:
+    :param logger:
+    :param optimisation_level:
+    :param timeout: the seconds granted to the compilation, or None for no limit
+    :return: the compiled circuit and the list of profiled passes
+    """
+
+    for predicate in backend.required_predicates:
+        if isinstance(predicate, MaxNQubitsPredicate) and not predicate.verify(circuit):
+            raise TooManyQubitsException()
+
+    if timeout:
+        compiled_circuit, passes = run_in_subprocess(
+            lambda: _profile_compilation(circuit, backend, optimisation_level, as_dict=True), timeout)
+        compiled_circuit = TKCircuit.from_dict(compiled_circuit)
+    else:
+        compiled_circuit, passes = _profile_compilation(circuit, backend, optimisation_level)
+
+    if logger:
+        slowest = max(passes, key=lambda compilation_pass: compilation_pass['time'], default=None)
+        if slowest:
+            logger(f"Profiled compilation of {short_impl_name}: {slowest['pass']} was the slowest pass "
+                   f"with {slowest['time']:.3f}s.")
+    return compiled_circuit, passes
+
+
+def _profile_compilation(circuit, backend, optimisation_level, as_dict=False):
+    compiled_circuit = circuit.copy()
+    passes = []
+    for compilation_pass in get_pass_sequence(backend.default_compilation_pass(optimisation_level)):
+        start = time.perf_counter()
+        compilation_pass.apply(compiled_circuit)
+        passes.append({'pass': get_pass_name(compilation_pass),
+                       'time': time.perf_counter() - start,
+                       'number-of-gates': compiled_circuit.n_gates,
+                       'depth': compiled_circuit.depth()})
+
+    if as_dict:
+        return compiled_circuit.to_dict(), passes
+    return compiled_circuit, passes
+
+
+def get_pass_sequence(compilation_pass):
+    """
+    Get the flat list of passes the given (possibly nested) sequence pass consists of.
+    :param compilation_pass:
+    :return:
+    """
+
+    if isinstance(compilation_pass, SequencePass):
+        return [p for nested_pass in compilation_pass.get_sequence() for p in get_pass_sequence(nested_pass)]
+    return [compilation_pass]
+
+
+def get_pass_name(compilation_pass):
+    serialised = compilation_pass.to_dict()
+    pass_class = serialised['pass_class']
+    return serialised.get(pass_class, {}).get('name', pass_class)
+
+
+def tket_compile_circuit_portfolio(circuit, backend, short_impl_name, logger=None,
+                                   objective=PORTFOLIO_OBJECTIVE_MULTI_QUBIT_GATES, timeout=None):
+    """
+    Compiles the tket circuit for the backend with all compilation strategies in parallel processes
+    and selects the best compiled circuit.
+    :param circuit:
+    :param backend:
+    :param short_impl_name:
+    :param logger:
+    :param objective: minimise the number of multi-qubit gates or the depth, the other one breaks ties
+    :param timeout: the seconds granted to the strategies, or None for no limit
+    :return: the best compiled circuit, the name of its strategy, and the metrics or errors of all strategies
+    """
+
+    strategies = get_compilation_strategies(backend)
+    handles = {name: start_subprocess(lambda compile_function=compile_function: compile_function(circuit).to_dict())
+               for name, compile_function in strategies.items()}
+    deadline = None if timeout is None else time.monotonic() + timeout
+
+    candidates = {}
+    portfolio = []
+    for name, handle in handles.items():
+        remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+        try:
+            compiled_circuit = TKCircuit.from_dict(collect_subprocess(handle, remaining))
+        except TooManyQubitsException:
+            portfolio.append({'strategy': name, 'error': 'too many qubits required'})
+            continue
+        except CompilationTimeoutException:
+            portfolio.append({'strategy': name, 'error': 'compilation timed out'})
+            continue
+        except RuntimeError as e:
+            portfolio.append({'strategy': name, 'error': str(e)})
+            continue
+
+        if not backend.valid_circuit(compiled_circuit):
+            portfolio.append({'strategy': name, 'error': 'compiled circuit is not valid for the backend'})
+            continue
+
+        metrics = analyze_circuit(compiled_circuit)
+        candidates[name] = (compiled_circuit, metrics)
+        portfolio.append({'strategy': name, **metrics.to_json()})
+
+    if not candidates:
+        if all(candidate['error'] == 'too many qubits required' for candidate in portfolio):
+            raise TooManyQubitsException()
+        if all(candidate['error'] == 'compilation timed out' for candidate in portfolio):
+            raise CompilationTimeoutException()
+        raise RuntimeError(f"All compilation strategies failed for {short_impl_name}")
+
+    if objective == PORTFOLIO_OBJECTIVE_DEPTH:
+        def score(name):
+            return candidates[name][1].depth, candidates[name][1].number_of_multi_qubit_gates
+    else:
+        def score(name):
+            return candidates[name][1].number_of_multi_qubit_gates, candidates[name][1].depth
+
+    best = min(candidates, key=score)
+    if logger:
+        logger(f"Compiled {short_impl_name} with {len(candidates)} of {len(strategies)} strategies, "
+               f"selected {best}.")
+    return candidates[best][0], best, portfolio
+
+
+def get_compilation_strategies(backend):
+    """
+    Get the compilation strategies of the portfolio for the backend.
+    Besides the default compilation passes of all optimisation levels, these are alternative placements followed by
+    routing if the backend has a connectivity constraint.
+    :param backend:
+    :return: dict of strategy name to a function compiling a circuit
+    """
+
+    strategies = {f"optimisation-level-{level}": partial(_compile_circuit, backend=backend, optimisation_level=level)
+                  for level in range(DEFAULT_OPTIMISATION_LEVEL, -1, -1)}
+
+    architecture = backend.backend_info.architecture if backend.backend_info else None
+    # placement only matters for devices with a connectivity graph, not for fully connected ones
+    if isinstance(architecture, Architecture) and len(architecture.nodes) > 0:
+        strategies['line-placement'] = partial(_compile_circuit_with_placement, backend=backend,
+                                               placement=LinePlacement(architecture))
+        strategies['graph-placement'] = partial(_compile_circuit_with_placement, backend=backend,
+                                                placement=GraphPlacement(architecture))
+    return strategies
+
+
+def _compile_circuit_with_placement(circuit, backend, placement):
+    compiled_circuit = circuit.copy()
+    architecture = backend.backend_info.architecture
+    try:
+        SequencePass([DecomposeBoxes(),
+                      FullPeepholeOptimise(),
+                      PlacementPass(placement),
+                      RoutingPass(architecture),
+                      SynthesiseTket(),
+                      backend.rebase_pass(),
+                      RemoveRedundancies()]).apply(compiled_circuit)
+    except RuntimeError as e:
+        if re.match(".* MaxNQubitsPredicate\\([0-9]+\\)", str(e)) or circuit.n_qubits > len(architecture.nodes):
+            raise TooManyQubitsException()
+        raise e
+    return compiled_circuit
+
+
+def _compile_circuit(circuit, backend, optimisation_level):
     try:
         # Use tket to compile the circuit
         # backend.compile_circuit(circuit, optimisation_level=2) -> Does not exist anymore for pytket backend
-        compiled_circuit = backend.get_compiled_circuit(circuit, optimisation_level=2)
+        return backend.get_compiled_circuit(circuit, optimisation_level=optimisation_level)
     except RuntimeError as e:
         if re.match(".* MaxNQubitsPredicate\\([0-9]+\\)", str(e)):
             raise TooManyQubitsException()
         else:
             raise e
 
-    return compiled_circuit
 
-def get_circuit_qasm(circuit):
-    return circuit_to_qasm_str(circuit)
+def run_in_subprocess(function, timeout):
+    """
+    Runs the function in a forked process and returns its (picklable) result.
+    The process is killed if it does not finish within timeout seconds.
+    :param function:
+    :param timeout:
+    :return:
+    """
+
+    return collect_subprocess(start_subprocess(function), timeout)
+
+
+def start_subprocess(function):
+    """
+    Starts running the function in a forked process.
+    :param function:
+    :return: the handle to collect the result with
+    """
+
+    context = multiprocessing.get_context('fork')
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(target=_run_and_send, args=(function, sender), daemon=True)
+    process.start()
+    sender.close()
+    return process, receiver
+
+
+def collect_subprocess(handle, timeout):
+    """
+    Waits for the result of a process started with start_subprocess and kills it if it does not finish in time.
+    :param handle:
+    :param timeout: seconds to wait, or None to wait until the process finishes
+    :return:
+    """
+
+    process, receiver = handle
+    try:
+        if not receiver.poll(timeout):
+            raise CompilationTimeoutException()
+        status, payload = receiver.recv()
+    except EOFError:
+        raise RuntimeError("Compilation process terminated unexpectedly")
+    finally:
+        if process.is_alive():
+            process.kill()
+        process.join()
+        receiver.close()
+
+    if status == 'too-many-qubits':
+        raise TooManyQubitsException()
+    if status == 'unsupported-gate':
+        raise UnsupportedGateException(payload)
+    if status == 'error':
+        raise RuntimeError(payload)
+    return payload
+
+
+def cancel_subprocess(handle):
+    """
+    Kills a process started with start_subprocess whose result is not needed anymore.
+    :param handle:
+    :return:
+    """
+
+    process, receiver = handle
+    if process.is_alive():
+        process.kill()
+    process.join()
+    receiver.close()
 
 
-def get_number_of_multi_qubit_gates(circuit):
-    number_of_multi_qubit_gates = circuit.n_gates_of_type(OpType.CX) + \
-                                  circuit.n_gates_of_type(OpType.CY) + \
-                                  circuit.n_gates_of_type(OpType.CZ) + \
-                                  circuit.n_gates_of_type(OpType.CH) + \
-                                  circuit.n_gates_of_type(OpType.CV) + \
-                                  circuit.n_gates_of_type(OpType.CVdg) + \
-                                  circuit.n_gates_of_type(OpType.CRx) + \
-                                  circuit.n_gates_of_type(OpType.CRy) + \
-                                  circuit.n_gates_of_type(OpType.CRz) + \
-                                  circuit.n_gates_of_type(OpType.CU1) + \
-                                  circuit.n_gates_of_type(OpType.CU3) + \
-                                  circuit.n_gates_of_type(OpType.CCX) + \
-                                  circuit.n_gates_of_type(OpType.ECR) + \
-                                  circuit.n_gates_of_type(OpType.SWAP) + \
-                                  circuit.n_gates_of_type(OpType.CSWAP) + \
-                                  circuit.n_gates_of_type(OpType.BRIDGE) + \
-                                  circuit.n_gates_of_type(OpType.Unitary2qBox) + \
-                                  circuit.n_gates_of_type(OpType.Unitary3qBox) + \
-                                  circuit.n_gates_of_type(OpType.ExpBox) + \
-                                  circuit.n_gates_of_type(OpType.QControlBox) + \
-                                  circuit.n_gates_of_type(OpType.ISWAP) + \
-                                  circuit.n_gates_of_type(OpType.PhasedISWAP) + \
-                                  circuit.n_gates_of_type(OpType.XXPhase) + \
-                                  circuit.n_gates_of_type(OpType.YYPhase) + \
-                                  circuit.n_gates_of_type(OpType.CnRy) + \
-                                  circuit.n_gates_of_type(OpType.CnX) + \
-                                  circuit.n_gates_of_type(OpType.ZZMax) + \
-                                  circuit.n_gates_of_type(OpType.ESWAP) + \
-                                  circuit.n_gates_of_type(OpType.FSim) + \
-                                  circuit.n_gates_of_type(OpType.ISWAPMax)
-
-    return number_of_multi_qubit_gates
-
-
-def get_multi_qubit_gate_depth(circuit):
-    multi_qubit_gate_depth = circuit.depth_by_type({OpType.CX,
-                                                    OpType.CY,
-                                                    OpType.CZ,
-                                                    OpType.CH,
-                                                    OpType.CV,
-                                                    OpType.CVdg,
-                                                    OpType.CRx,
-                                                    OpType.CRy,
-                                                    OpType.CRz,
-                                                    OpType.CU1,
-                                                    OpType.CU3,
-                                                    OpType.CCX,
-                                                    OpType.ECR,
-                                                    OpType.SWAP,
-                                                    OpType.CSWAP,
-                                                    OpType.BRIDGE,
-                                                    OpType.Unitary2qBox,
-                                                    OpType.Unitary3qBox,
-                                                    OpType.ExpBox,
-                                                    OpType.QControlBox,
-                                                    OpType.ISWAP,
-                                                    OpType.PhasedISWAP,
-                                                    OpType.XXPhase,
-                                                    OpType.YYPhase,
-                                                    OpType.CnRy,
-                                                    OpType.CnX,
-                                                    OpType.ZZMax,
-                                                    OpType.ESWAP,
-                                                    OpType.FSim,
-                                                    OpType.ISWAPMax})
-    return multi_qubit_gate_depth
+def _run_and_send(function, sender):
+    try:
+        sender.send(('result', function()))
+    except TooManyQubitsException:
+        sender.send(('too-many-qubits', None))
+    except UnsupportedGateException as e:
+        sender.send(('unsupported-gate', e.gate))
+    except Exception as e:
+        sender.send(('error', str(e)))
+    finally:
+        sender.close()
+
+
+def get_circuit_qasm(circuit):
+    return circuit_to_qasm_str(circuit)
 
 
 def get_number_of_measurement_operations(circuit):
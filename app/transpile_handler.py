@@ -0,0 +1,349 @@
+# ******************************************************************************
+#  Copyright (c) 2026 University of Stuttgart
+#
+#  See the NOTICE file(s) distributed with this work for additional
+#  information regarding copyright ownership.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# ******************************************************************************
+
+import base64
+import json
+import multiprocessing
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+
+from flask import abort
+from pytket import Circuit as TKCircuit
+from werkzeug.exceptions import HTTPException
+
+from app import app, db, implementation_handler, circuit_cache, conversion_strategy, parameters
+from app.circuit_metrics import analyze_circuit
+from app.compilation_profile_model import Compilation_Profile
+from app.tket_handler import get_backend, setup_credentials, tket_compile_circuit, UnsupportedGateException, \
+    TooManyQubitsException, CompilationTimeoutException, prepare_transpile_response, tket_compile_circuit_portfolio, \
+    tket_profile_compilation, DEFAULT_OPTIMISATION_LEVEL, PORTFOLIO_OBJECTIVE_MULTI_QUBIT_GATES
+
+
+def transpile(impl_url, impl_data, impl_language, input_params, provider, qpu_name, bearer_token: str = "",
+              optimisation_level=DEFAULT_OPTIMISATION_LEVEL, compile_timeout=None, portfolio=False,
+              portfolio_objective=PORTFOLIO_OBJECTIVE_MULTI_QUBIT_GATES, profile=False):
+    """
+    Generate the circuit of the given implementation and transpile it for the given QPU.
+    Used by the synchronous transpile endpoint as well as by queued transpile jobs.
+    :param optimisation_level: the tket optimisation level to compile with
+    :param compile_timeout: seconds granted to the whole compilation, including the fallbacks to lower optimisation
+    levels, or to the whole portfolio
+    :param portfolio: compile with all compilation strategies in parallel and keep the best result
+    :param portfolio_objective: the metric the best portfolio result is selected by
+    :param profile: compile pass by pass, and return and store the time, gate count, and depth after each pass
+    :return: the response containing the transpiled circuit and its properties, and the HTTP status code
+    """
+
+    # setup the SDK credentials first
+    setup_credentials(provider, **input_params)
+    circuit = None
+    short_impl_name = ""
+
+    try:
+        circuit, short_impl_name = implementation_handler.prepare_code(impl_url, impl_data, impl_language, input_params,
+                                                                       bearer_token)
+    except ValueError:
+        abort(400)
+    except Exception as e:
+        app.logger.info(f"Transpile {short_impl_name} for {qpu_name}: {str(e)}")
+        return {'error': str(e)}, 400
+
+    if not circuit:
+        app.logger.info(f"Transpile {short_impl_name} for {qpu_name}: Failed to create circuit.")
+        return {'error': "Failed to create circuit."}, 400
+
+    # Identify the backend given provider and qpu name
+    backend = get_backend(provider, qpu_name)
+
+    if not backend:
+        app.logger.warning(f"{qpu_name} not found.")
+        abort(404)
+
+    # reuse the compilation result if the same circuit was already compiled for the same device characterisation
+    cache_key = None
+    compilation_key = f"portfolio-{portfolio_objective}" if portfolio else optimisation_level
+    # profiling requires an actual compilation
+    circuit_fingerprint = circuit_cache.get_circuit_fingerprint(circuit) if not profile else None
+    if circuit_fingerprint:
+        calibration_version = circuit_cache.get_calibration_version(backend)
+        cache_key = circuit_cache.get_compiled_circuit_key(circuit_fingerprint, provider, qpu_name,
+                                                           compilation_key, calibration_version)
+        cached_response = circuit_cache.get_compiled_circuit_response(cache_key)
+        if cached_response:
+            app.logger.info(f"Transpiled {short_impl_name} for {qpu_name}: served from cache")
+            return cached_response, 200
+
+    try:
+        circuit = conversion_strategy.convert_circuit(circuit,
+                                                      impl_language=impl_language,
+                                                      short_impl_name=short_impl_name,
+                                                      logger=app.logger.info)
+    except UnsupportedGateException:
+        app.logger.warning(f"Precompiling {short_impl_name} failed.")
+        abort(500)
+    except Exception as e:
+        app.logger.warning(f"Circuit conversion unexpectedly failed for {short_impl_name}: {str(e)}")
+        abort(500)
+
+    original_circuit_properties = analyze_circuit(circuit).to_json(prefix='original-')
+
+    used_optimisation_level = None
+    strategy = None
+    portfolio_results = None
+    compilation_profile = None
+    if not backend.valid_circuit(circuit):
+        try:
+            if profile and not portfolio:
+                circuit, compilation_profile = tket_profile_compilation(circuit,
+                                                                        backend=backend,
+                                                                        short_impl_name=short_impl_name,
+                                                                        logger=app.logger.info,
+                                                                        optimisation_level=optimisation_level,
+                                                                        timeout=compile_timeout)
+                used_optimisation_level = optimisation_level
+            elif portfolio:
+                circuit, strategy, portfolio_results = tket_compile_circuit_portfolio(circuit,
+                                                                                      backend=backend,
+                                                                                      short_impl_name=short_impl_name,
+                                                                                      logger=app.logger.info,
+                                                                                      objective=portfolio_objective,
+                                                                                      timeout=compile_timeout)
+            else:
+                circuit, used_optimisation_level = tket_compile_circuit(circuit,
+                                                                        backend=backend,
+                                                                        short_impl_name=short_impl_name,
+                                                                        logger=app.logger.info,
+                                                                        optimisation_level=optimisation_level,
+                                                                        timeout=compile_timeout)
+
+        except TooManyQubitsException:
+            # Too many qubits required for the provided backend
+            app.logger.info(f"Transpile {short_impl_name} for {qpu_name}: too many qubits required")
+            return {'error': 'too many qubits required'}, 200
+
+        except CompilationTimeoutException:
+            app.logger.info(f"Transpile {short_impl_name} for {qpu_name}: compilation timed out")
+            return {'error': 'compilation timed out'}, 200
+
+        except Exception as e:
+            app.logger.warning(f"Circuit compilation unexpectedly failed for {short_impl_name}: {str(e)}")
+            abort(500)
+
+    # After compilation the circuit should be valid
+    if not backend.valid_circuit(circuit):
+        app.logger.warning(f"Circuit compilation unexpectedly failed for {short_impl_name}.")
+        abort(500)
+
+    response = prepare_transpile_response(circuit, provider)
+    response['optimisation-level'] = used_optimisation_level
+    if portfolio:
+        response['strategy'] = strategy
+        response['portfolio'] = portfolio_results
+    if compilation_profile is not None:
+        response['compilation-profile'] = store_compilation_profile(short_impl_name, provider, qpu_name,
+                                                                    used_optimisation_level, compilation_profile)
+    response.update(original_circuit_properties)
+    # get statistics about the compiled circuit
+    response.update(analyze_circuit(circuit).to_json())
+
+    if cache_key:
+        if not portfolio and used_optimisation_level is not None and used_optimisation_level != optimisation_level:
+            # a fallback result is only stored for its actual optimisation level, as requests with a longer timeout
+            # may still succeed with the requested one
+            cache_key = circuit_cache.get_compiled_circuit_key(circuit_fingerprint, provider, qpu_name,
+                                                               used_optimisation_level, calibration_version)
+        circuit_cache.store_compiled_circuit_response(cache_key, response)
+
+    log_transpiled_circuit_properties(short_impl_name, qpu_name, response)
+    return response, 200
+
+
+def store_compilation_profile(short_impl_name, provider, qpu_name, optimisation_level, passes):
+    """Store the profile of a compilation in the db, so that profiles can be compared per backend later on."""
+    compilation_profile = Compilation_Profile(id=str(uuid.uuid4()), implementation=short_impl_name, backend=qpu_name,
+                                              provider=provider, optimisation_level=optimisation_level,
+                                              profile=json.dumps(passes))
+    db.session.add(compilation_profile)
+    db.session.commit()
+
+    return {'id': compilation_profile.id,
+            'passes': passes,
+            'total-time': sum(compilation_pass['time'] for compilation_pass in passes)}
+
+
+def transpile_batch(implementations, targets, bearer_token: str = "", optimisation_level=DEFAULT_OPTIMISATION_LEVEL,
+                    compile_timeout=None):
+    """
+    Transpile every given implementation for every given target QPU.
+    Each implementation is generated and converted to a tket circuit only once, and the compilations for
+    all (implementation, target) pairs are distributed over a process pool.
+    :param implementations: list of dicts with the impl-url or impl-data, impl-language, and input-params
+    :param targets: list of dicts with the provider and qpu-name
+    :param bearer_token:
+    :param optimisation_level: the tket optimisation level to compile with
+    :param compile_timeout: seconds granted to each compilation, including the fallbacks to lower optimisation levels
+    :return: the matrix of transpile responses, one row per implementation and one column per target
+    """
+
+    prepared_implementations = [_prepare_batch_implementation(implementation, bearer_token)
+                                for implementation in implementations]
+
+    with ProcessPoolExecutor(max_workers=app.config['TRANSPILE_BATCH_PROCESSES'],
+                             mp_context=multiprocessing.get_context('fork')) as executor:
+        futures = []
+        for prepared in prepared_implementations:
+            row = []
+            for target in targets:
+                if 'error' in prepared:
+                    row.append(None)
+                else:
+                    row.append(executor.submit(_transpile_for_target, prepared['circuit'],
+                                               prepared['circuit-fingerprint'],
+                                               prepared['original-circuit-properties'], prepared['short-impl-name'],
+                                               prepared['input-params'], target['provider'], target['qpu-name'],
+                                               optimisation_level, compile_timeout))
+            futures.append(row)
+
+        results = []
+        for prepared, row in zip(prepared_implementations, futures):
+            cells = []
+            for target, future in zip(targets, row):
+                if future is None:
+                    cell = {'error': prepared['error']}
+                else:
+                    try:
+                        cell = future.result()
+                    except Exception as e:
+                        cell = {'error': str(e)}
+                cell['provider'] = target['provider']
+                cell['qpu-name'] = target['qpu-name']
+                cells.append(cell)
+            results.append(cells)
+
+    return {'implementations': [prepared['short-impl-name'] for prepared in prepared_implementations],
+            'results': results}
+
+
+def _prepare_batch_implementation(implementation, bearer_token):
+    """Generate the circuit of an implementation of a batch and convert it to a serialised tket circuit."""
+    impl_language = implementation.get('impl-language', '')
+    input_params = parameters.ParameterDictionary(implementation.get('input-params', {}))
+    impl_url = implementation.get('impl-url')
+    impl_data = base64.standard_b64decode(
+        implementation['impl-data'].encode()).decode() if 'impl-data' in implementation else None
+    short_impl_name = ""
+
+    try:
+        circuit, short_impl_name = implementation_handler.prepare_code(impl_url, impl_data, impl_language,
+                                                                       input_params, bearer_token)
+    except Exception as e:
+        app.logger.info(f"Batch transpile {short_impl_name}: {str(e)}")
+        return {'short-impl-name': short_impl_name, 'error': str(e)}
+
+    if not circuit:
+        return {'short-impl-name': short_impl_name, 'error': "Failed to create circuit."}
+
+    # fingerprinted before the conversion like in single transpilations, so that both share their cache entries
+    circuit_fingerprint = circuit_cache.get_circuit_fingerprint(circuit)
+
+    try:
+        circuit = conversion_strategy.convert_circuit(circuit, impl_language=impl_language,
+                                                      short_impl_name=short_impl_name,
+                                                      logger=app.logger.info)
+    except UnsupportedGateException as e:
+        return {'short-impl-name': short_impl_name, 'error': f"Unsupported gate ({e.gate})."}
+    except Exception as e:
+        app.logger.warning(f"Circuit conversion unexpectedly failed for {short_impl_name}: {str(e)}")
+        return {'short-impl-name': short_impl_name, 'error': str(e)}
+
+    return {'short-impl-name': short_impl_name,
+            'input-params': input_params,
+            'circuit': circuit.to_dict(),
+            'circuit-fingerprint': circuit_fingerprint,
+            'original-circuit-properties': analyze_circuit(circuit).to_json(prefix='original-')}
+
+
+def _transpile_for_target(circuit_dict, circuit_fingerprint, original_circuit_properties, short_impl_name,
+                          input_params, provider, qpu_name, optimisation_level, compile_timeout):
+    """Compile a serialised tket circuit for one target QPU of a batch. Runs in a worker process of the pool."""
+    try:
+        setup_credentials(provider, **input_params)
+    except HTTPException:
+        return {'error': f"Missing credentials for {provider}."}
+
+    backend = get_backend(provider, qpu_name)
+    if not backend:
+        return {'error': f"{qpu_name} not found."}
+
+    cache_key = None
+    if circuit_fingerprint:
+        calibration_version = circuit_cache.get_calibration_version(backend)
+        cache_key = circuit_cache.get_compiled_circuit_key(circuit_fingerprint, provider, qpu_name, optimisation_level,
+                                                           calibration_version)
+        cached_response = circuit_cache.get_compiled_circuit_response(cache_key)
+        if cached_response:
+            return cached_response
+
+    circuit = TKCircuit.from_dict(circuit_dict)
+
+    # like for single transpilations, circuits that are already valid for the backend are not compiled again
+    used_optimisation_level = None
+    if not backend.valid_circuit(circuit):
+        try:
+            circuit, used_optimisation_level = tket_compile_circuit(circuit, backend=backend,
+                                                                    short_impl_name=short_impl_name,
+                                                                    logger=app.logger.info,
+                                                                    optimisation_level=optimisation_level,
+                                                                    timeout=compile_timeout)
+        except TooManyQubitsException:
+            app.logger.info(f"Transpile {short_impl_name} for {qpu_name}: too many qubits required")
+            return {'error': 'too many qubits required'}
+        except CompilationTimeoutException:
+            app.logger.info(f"Transpile {short_impl_name} for {qpu_name}: compilation timed out")
+            return {'error': 'compilation timed out'}
+        except Exception as e:
+            app.logger.warning(f"Circuit compilation unexpectedly failed for {short_impl_name}: {str(e)}")
+            return {'error': str(e)}
+
+    if not backend.valid_circuit(circuit):
+        return {'error': "Circuit compilation failed."}
+
+    response = prepare_transpile_response(circuit, provider)
+    response['optimisation-level'] = used_optimisation_level
+    response.update(original_circuit_properties)
+    response.update(analyze_circuit(circuit).to_json())
+    if cache_key:
+        if used_optimisation_level is not None and used_optimisation_level != optimisation_level:
+            cache_key = circuit_cache.get_compiled_circuit_key(circuit_fingerprint, provider, qpu_name,
+                                                               used_optimisation_level, calibration_version)
+        circuit_cache.store_compiled_circuit_response(cache_key, response)
+
+    log_transpiled_circuit_properties(short_impl_name, qpu_name, response)
+    return response
+
+
+def log_transpiled_circuit_properties(short_impl_name, qpu_name, response):
+    app.logger.info(f"Transpiled {short_impl_name} for {qpu_name}: "
+                    f"w={response['width']}, "
+                    f"d={response['depth']}, "
+                    f"mutli qubit gate depth={response['multi-qubit-gate-depth']}"
+                    f"total number of operations={response['total-number-of-operations']}, "
+                    f"number of single qubit gates={response['number-of-single-qubit-gates']}, "
+                    f"number of multi qubit gates={response['number-of-multi-qubit-gates']}, "
+                    f"number of measurement operations={response['number-of-measurement-operations']}")
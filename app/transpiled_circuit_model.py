@@ -0,0 +1,31 @@
+# ******************************************************************************
+#  Copyright (c) 2026 University of Stuttgart
+#
+#  See the NOTICE file(s) distributed with this work for additional
+#  information regarding copyright ownership.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# ******************************************************************************
+
+from app import db
+
+
+class Transpiled_Circuit(db.Model):
+    id = db.Column(db.String(36), primary_key=True)
+    backend = db.Column(db.String(1200), default="")
+    provider = db.Column(db.String(1200), default="")
+    response = db.Column(db.Text, default="")
+    complete = db.Column(db.Boolean, default=False)
+
+    def __repr__(self):
+        return 'Transpiled_Circuit {}'.format(self.response)
@@ -0,0 +1,116 @@
+# ******************************************************************************
+#  Copyright (c) 2026 University of Stuttgart
+#
+#  See the NOTICE file(s) distributed with this work for additional
+#  information regarding copyright ownership.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# ******************************************************************************
+
+
+import argparse
+import random
+
+import rq
+
+from app import app, execute_queues
+
+WARM_UP_QASM = """OPENQASM 2.0;
+include "qelib1.inc";
+qreg q[2];
+creg c[2];
+h q[0];
+cx q[0],q[1];
+measure q -> c;
+"""
+
+
+class WeightedQueuesMixin:
+    """
+    Mixin for workers that reorder their queues randomly after each job, with the chance of a queue to come first
+    proportional to its weight. Thereby, jobs of heavily weighted queues are preferred, but no queue starves.
+    """
+
+    def reorder_queues(self, reference_queue):
+        weights = execute_queues.get_queue_weights()
+        # weighted random permutation, see Efraimidis and Spirakis
+        self._ordered_queues = sorted(self.queues,
+                                      key=lambda queue: random.random() ** (1 / weights.get(queue.name, 1)),
+                                      reverse=True)
+
+
+class WeightedWorker(WeightedQueuesMixin, rq.Worker):
+    """Weighted worker forking a work horse per job"""
+
+
+class InProcessWorker(WeightedQueuesMixin, rq.SimpleWorker):
+    """Weighted worker running the jobs in its own process instead of forking a work horse per job"""
+
+
+def preload():
+    """
+    Import the job functions and all quantum SDKs, and run the code paths of short jobs once, so that lazily
+    imported modules, the OpenQASM parser, and the backends of the local simulators are ready before the first job.
+    The jobs forked from the worker inherit all of it.
+    """
+
+    import braket.aws  # noqa: F401
+    import pyquil  # noqa: F401
+    import qiskit  # noqa: F401
+    import qiskit_aer  # noqa: F401
+    from pytket.extensions.pyquil import tk_to_pyquil
+    from pytket.extensions.qiskit import tk_to_qiskit
+    from qiskit.qasm2 import dumps
+
+    from app import tasks, qasm_ingestion  # noqa: F401
+    from app.circuit_metrics import analyze_circuit
+    from app.tket_handler import get_backend, LOCAL_SIMULATORS
+
+    circuit = qasm_ingestion.load_qasm(WARM_UP_QASM)
+    analyze_circuit(circuit)
+    dumps(tk_to_qiskit(circuit))
+    tk_to_pyquil(circuit)
+    for qpu_name in LOCAL_SIMULATORS:
+        backend = get_backend('ibmq', qpu_name)
+        # nothing is simulated, since the OpenMP threads of Aer deadlock in processes forked afterwards
+        backend.get_compiled_circuit(circuit)
+    app.logger.info("Worker preloaded the quantum SDKs")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run an rq worker for the jobs of the pytket-service.")
+    parser.add_argument('queues', nargs='*', help="names of the queues to work on, all queues of the service if omitted")
+    parser.add_argument('--burst', action='store_true', help="quit after all queues are empty")
+    parser.add_argument('--with-scheduler', action='store_true', help="run the scheduler for delayed jobs as well")
+    parser.add_argument('--in-process', action='store_true',
+                        help="run the jobs in the worker process instead of forking a process per job")
+    parser.add_argument('--max-jobs', type=int, default=None,
+                        help="quit after this number of jobs, so that the worker is recycled by its supervisor")
+    parser.add_argument('--no-preload', action='store_true', help="do not import the SDKs before the first job")
+    args = parser.parse_args()
+
+    if not args.no_preload:
+        preload()
+
+    if args.queues:
+        queues = [rq.Queue(name, connection=app.redis, default_timeout=10000) for name in args.queues]
+    else:
+        queues = execute_queues.get_service_queues()
+
+    worker_class = InProcessWorker if args.in_process else WeightedWorker
+    worker = worker_class(queues, connection=app.redis)
+    worker.work(burst=args.burst, with_scheduler=args.with_scheduler, max_jobs=args.max_jobs)
+
+
+if __name__ == '__main__':
+    main()
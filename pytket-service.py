@@ -19,4 +19,6 @@
 
 from app import app, db
 from app.result_model import Result
-from app.generated_circuit_model import Generated_Circuit
\ No newline at end of file
+from app.generated_circuit_model import Generated_Circuit
+from app.transpiled_circuit_model import Transpiled_Circuit
+from app.compilation_profile_model import Compilation_Profile
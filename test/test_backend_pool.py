@@ -0,0 +1,73 @@
+# ******************************************************************************
+#  Copyright (c) 2026 University of Stuttgart
+#
+#  See the NOTICE file(s) distributed with this work for additional
+#  information regarding copyright ownership.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# ******************************************************************************
+
+
+import unittest
+from unittest import mock
+
+from app import app, tket_handler
+
+
+@mock.patch.object(tket_handler, 'set_ibmq_config')
+@mock.patch.object(tket_handler, '_create_backend', side_effect=lambda provider, qpu, session: mock.Mock())
+class BackendPoolTestCase(unittest.TestCase):
+
+    def setUp(self):
+        app.app_context().push()
+        self.enterContext(mock.patch.dict(tket_handler._backend_pool, clear=True))
+        self.enterContext(mock.patch.dict(tket_handler._credential_fingerprints, clear=True))
+        # the backends are created directly instead of from device metadata snapshots
+        self.enterContext(mock.patch.dict(app.config, {'BACKEND_POOL_TTL': 3600, 'BACKEND_POOL_SIZE': 2,
+                                                       'DEVICE_METADATA_MAX_AGE': 0}))
+
+    def test_backend_is_reused(self, create_backend, set_ibmq_config):
+        tket_handler.setup_credentials('ibmq', token="token")
+        backend = tket_handler.get_backend('ibmq', 'ibm_kyiv')
+
+        self.assertIs(tket_handler.get_backend('ibmq', 'ibm_kyiv'), backend)
+        create_backend.assert_called_once()
+
+    def test_new_backend_for_new_credentials(self, create_backend, set_ibmq_config):
+        tket_handler.setup_credentials('ibmq', token="token")
+        backend = tket_handler.get_backend('ibmq', 'ibm_kyiv')
+        tket_handler.setup_credentials('ibmq', token="other token")
+
+        self.assertIsNot(tket_handler.get_backend('ibmq', 'ibm_kyiv'), backend)
+        tket_handler.setup_credentials('ibmq', token="token")
+        self.assertIs(tket_handler.get_backend('ibmq', 'ibm_kyiv'), backend)
+
+    def test_backend_is_recreated_after_ttl(self, create_backend, set_ibmq_config):
+        with mock.patch.object(tket_handler.time, 'monotonic', return_value=0):
+            backend = tket_handler.get_backend('ibmq', 'ibm_kyiv')
+        with mock.patch.object(tket_handler.time, 'monotonic', return_value=3600):
+            self.assertIsNot(tket_handler.get_backend('ibmq', 'ibm_kyiv'), backend)
+
+    def test_least_recently_used_backend_is_evicted(self, create_backend, set_ibmq_config):
+        kyiv = tket_handler.get_backend('ibmq', 'ibm_kyiv')
+        brisbane = tket_handler.get_backend('ibmq', 'ibm_brisbane')
+        tket_handler.get_backend('ibmq', 'ibm_kyiv')
+        tket_handler.get_backend('ibmq', 'ibm_sherbrooke')
+
+        self.assertEqual(len(tket_handler._backend_pool), 2)
+        self.assertIs(tket_handler.get_backend('ibmq', 'ibm_kyiv'), kyiv)
+        self.assertIsNot(tket_handler.get_backend('ibmq', 'ibm_brisbane'), brisbane)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+# ******************************************************************************
+#  Copyright (c) 2026 University of Stuttgart
+#
+#  See the NOTICE file(s) distributed with this work for additional
+#  information regarding copyright ownership.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# ******************************************************************************
+
+import base64
+import unittest
+from unittest import mock
+
+import qiskit
+from pyquil import Program as PyQuilProgram
+from pyquil.gates import H, MEASURE
+from pytket import Circuit as TKCircuit
+from pytket.extensions.qiskit import AerBackend
+
+from app import app, circuit_cache, implementation_handler, transpile_handler
+from app.circuit_serialisation import dumps_circuit, loads_circuit
+
+IMPLEMENTATION = """
+import qiskit
+
+def get_circuit(**kwargs):
+    circuit = qiskit.QuantumCircuit(kwargs['n'])
+    circuit.h(0)
+    circuit.measure_all()
+    return circuit
+"""
+
+
+class GeneratedCircuitCacheTestCase(unittest.TestCase):
+
+    def test_key_depends_on_code_and_input_params(self):
+        key = circuit_cache.get_generated_circuit_key(IMPLEMENTATION, {'n': 2, 'm': 1})
+
+        self.assertEqual(key, circuit_cache.get_generated_circuit_key(IMPLEMENTATION, {'m': 1, 'n': 2}))
+        self.assertNotEqual(key, circuit_cache.get_generated_circuit_key(IMPLEMENTATION, {'n': 3, 'm': 1}))
+        self.assertNotEqual(key, circuit_cache.get_generated_circuit_key(IMPLEMENTATION + "\n", {'n': 2, 'm': 1}))
+
+    def test_serialisation_round_trip(self):
+        qiskit_circuit = qiskit.QuantumCircuit(2)
+        qiskit_circuit.h(0)
+        qiskit_circuit.cx(0, 1)
+        qiskit_circuit.measure_all()
+        tket_circuit = TKCircuit(2).H(0).CX(0, 1).measure_all()
+        pyquil_program = PyQuilProgram()
+        readout = pyquil_program.declare('ro', 'BIT', 1)
+        pyquil_program += H(0)
+        pyquil_program += MEASURE(0, readout[0])
+
+        self.assertEqual(loads_circuit(dumps_circuit(qiskit_circuit)), qiskit_circuit)
+        self.assertEqual(loads_circuit(dumps_circuit(tket_circuit)), tket_circuit)
+        self.assertEqual(str(loads_circuit(dumps_circuit(pyquil_program))), str(pyquil_program))
+
+    def test_generated_circuit_is_served_from_cache(self):
+        with mock.patch.object(circuit_cache, 'get_generated_circuit', return_value=None), \
+                mock.patch.object(circuit_cache, 'store_generated_circuit') as store:
+            circuit = implementation_handler.prepare_code_from_data(IMPLEMENTATION, {'n': 2})
+        self.assertEqual(circuit.num_qubits, 2)
+        store.assert_called_once_with(circuit_cache.get_generated_circuit_key(IMPLEMENTATION, {'n': 2}), circuit)
+
+        with mock.patch.object(circuit_cache, 'get_generated_circuit', return_value=circuit), \
+                mock.patch.object(implementation_handler, 'load_implementation') as load_implementation:
+            self.assertIs(implementation_handler.prepare_code_from_data(IMPLEMENTATION, {'n': 2}), circuit)
+        load_implementation.assert_not_called()
+
+
+
+class CompiledCircuitCacheTestCase(unittest.TestCase):
+
+    def test_key_depends_on_circuit_target_and_calibration(self):
+        key = circuit_cache.get_compiled_circuit_key("fingerprint", 'ibmq', 'ibm_kyiv', 2, "calibration")
+
+        self.assertEqual(key, circuit_cache.get_compiled_circuit_key("fingerprint", 'IBMQ', 'ibm_kyiv', 2,
+                                                                     "calibration"))
+        for changed in [("other fingerprint", 'ibmq', 'ibm_kyiv', 2, "calibration"),
+                        ("fingerprint", 'aws', 'ibm_kyiv', 2, "calibration"),
+                        ("fingerprint", 'ibmq', 'ibm_brisbane', 2, "calibration"),
+                        ("fingerprint", 'ibmq', 'ibm_kyiv', 1, "calibration"),
+                        ("fingerprint", 'ibmq', 'ibm_kyiv', 2, "other calibration")]:
+            with self.subTest(changed=changed):
+                self.assertNotEqual(circuit_cache.get_compiled_circuit_key(*changed), key)
+
+    def test_circuit_fingerprint(self):
+        circuit = TKCircuit(2).H(0).CX(0, 1)
+
+        self.assertEqual(circuit_cache.get_circuit_fingerprint(circuit),
+                         circuit_cache.get_circuit_fingerprint(TKCircuit(2).H(0).CX(0, 1)))
+        self.assertNotEqual(circuit_cache.get_circuit_fingerprint(circuit),
+                            circuit_cache.get_circuit_fingerprint(TKCircuit(2).H(1).CX(0, 1)))
+
+    def test_calibration_version(self):
+        backend = AerBackend()
+        other_backend = mock.Mock(**{'backend_info.to_dict.return_value': {'gate_errors': {'CX': 0.01}}})
+
+        self.assertEqual(circuit_cache.get_calibration_version(backend), circuit_cache.get_calibration_version(
+            AerBackend()))
+        self.assertNotEqual(circuit_cache.get_calibration_version(backend),
+                            circuit_cache.get_calibration_version(other_backend))
+        self.assertEqual(circuit_cache.get_calibration_version(mock.Mock(backend_info=None)), "")
+
+    @mock.patch.object(transpile_handler, 'tket_compile_circuit')
+    @mock.patch.object(transpile_handler.conversion_strategy, 'convert_circuit')
+    @mock.patch.object(circuit_cache, 'get_compiled_circuit_response', return_value={'transpiled-qasm': "cached"})
+    def test_cache_hit_is_neither_converted_nor_compiled(self, get_compiled_circuit_response, convert_circuit,
+                                                         tket_compile_circuit):
+        app.app_context().push()
+        request = {'impl-data': base64.b64encode(IMPLEMENTATION.encode()).decode(),
+                   'impl-language': 'Qiskit',
+                   'qpu-name': 'aer_simulator',
+                   'provider': 'ibmq',
+                   'input-params': {'n': {'rawValue': "2", 'type': 'Integer'},
+                                    'token': {'rawValue': "token", 'type': 'Unknown'}}}
+
+        with mock.patch.object(circuit_cache, 'get_generated_circuit', return_value=None):
+            response = app.test_client().post('/pytket-service/api/v1.0/transpile', json=request)
+
+        self.assertEqual(response.get_json(), {'transpiled-qasm': "cached"})
+        get_compiled_circuit_response.assert_called_once()
+        convert_circuit.assert_not_called()
+        tket_compile_circuit.assert_not_called()
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+# ******************************************************************************
+#  Copyright (c) 2026 University of Stuttgart
+#
+#  See the NOTICE file(s) distributed with this work for additional
+#  information regarding copyright ownership.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# ******************************************************************************
+
+import unittest
+import os
+
+from pytket import Circuit
+from pytket.circuit import OpType
+from pytket.qasm import circuit_from_qasm
+
+from app.circuit_metrics import analyze_circuit, MULTI_QUBIT_OP_TYPES
+from app.tket_handler import get_depth_without_barrier, get_number_of_measurement_operations
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+
+
+class CircuitMetricsTestCase(unittest.TestCase):
+
+    def assertMatchesTketMetrics(self, circuit):
+        metrics = analyze_circuit(circuit)
+
+        self.assertEqual(metrics.width, circuit.n_qubits)
+        self.assertEqual(metrics.depth, get_depth_without_barrier(circuit))
+        self.assertEqual(metrics.multi_qubit_gate_depth, circuit.depth_by_type(set(MULTI_QUBIT_OP_TYPES)))
+        self.assertEqual(metrics.total_number_of_operations, circuit.n_gates)
+        self.assertEqual(metrics.number_of_multi_qubit_gates,
+                         sum(circuit.n_gates_of_type(op_type) for op_type in MULTI_QUBIT_OP_TYPES))
+        self.assertEqual(metrics.number_of_measurement_operations, get_number_of_measurement_operations(circuit))
+
+    def test_qasm_files(self):
+        for file_name in ['pattern1-2_0nCliffs10seed1.qasm', 'shor-fix-15.qasm']:
+            with self.subTest(file_name=file_name):
+                self.assertMatchesTketMetrics(circuit_from_qasm(os.path.join(DATA_DIR, file_name)))
+
+    def test_barriers_connect_qubits(self):
+        circuit = Circuit(3, 1)
+        circuit.H(0).CX(0, 1).add_barrier([0, 2]).H(2).CX(1, 2).Measure(2, 0)
+
+        self.assertMatchesTketMetrics(circuit)
+        self.assertEqual(analyze_circuit(circuit).depth, 5)
+
+    def test_conditions_are_read_in_parallel(self):
+        circuit = Circuit(3, 1)
+        circuit.Measure(0, 0)
+        circuit.CX(1, 2, condition_bits=[0], condition_value=1)
+        circuit.X(0, condition_bits=[0], condition_value=1)
+        circuit.H(1).H(1).X(2, condition_bits=[0], condition_value=0)
+        circuit.Measure(2, 0)
+
+        self.assertMatchesTketMetrics(circuit)
+
+    def test_histograms(self):
+        circuit = Circuit(3, 3)
+        circuit.H(0).CX(0, 1).CCX(0, 1, 2).add_barrier([0, 1, 2]).measure_all()
+
+        metrics = analyze_circuit(circuit)
+        self.assertEqual(metrics.gate_histogram[OpType.Measure.name], 3)
+        self.assertEqual(metrics.gate_histogram[OpType.Barrier.name], 1)
+        self.assertEqual(metrics.to_json()['number-of-gates-by-arity'], {'1': 1, '2': 1, '3': 1})
+        self.assertEqual(metrics.number_of_single_qubit_gates, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+# ******************************************************************************
+#  Copyright (c) 2026 University of Stuttgart
+#
+#  See the NOTICE file(s) distributed with this work for additional
+#  information regarding copyright ownership.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# ******************************************************************************
+
+
+import time
+import unittest
+from unittest import mock
+
+from pytket import Circuit
+from pytket.architecture import Architecture
+from pytket.extensions.qiskit import AerBackend
+
+from app import tket_handler
+from app.tket_handler import CompilationTimeoutException, PORTFOLIO_OBJECTIVE_DEPTH
+
+
+def compile_parallel(circuit):
+    # two multi-qubit gates with a depth of one
+    return Circuit(4).CX(0, 1).CX(2, 3)
+
+
+def compile_sequential(circuit):
+    # one multi-qubit gate with a depth of three
+    return Circuit(4).H(0).CX(0, 1).H(1)
+
+
+def fail(circuit):
+    raise RuntimeError("strategy failed")
+
+
+def sleep(circuit):
+    time.sleep(10)
+
+
+class CompilationPortfolioTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.circuit = Circuit(4).H(0).CX(0, 1).CX(2, 3)
+        self.backend = AerBackend()
+
+    def compile_portfolio(self, strategies, **kwargs):
+        with mock.patch.object(tket_handler, 'get_compilation_strategies', return_value=strategies):
+            return tket_handler.tket_compile_circuit_portfolio(self.circuit, self.backend, "circuit", **kwargs)
+
+    def test_compilation_strategies(self):
+        strategies = tket_handler.get_compilation_strategies(self.backend)
+        self.assertEqual(list(strategies), ['optimisation-level-2', 'optimisation-level-1', 'optimisation-level-0'])
+
+        # placements are only added for devices with a connectivity graph
+        backend = mock.Mock(**{'backend_info.architecture': Architecture([(0, 1), (1, 2)])})
+        self.assertEqual(list(tket_handler.get_compilation_strategies(backend))[3:],
+                         ['line-placement', 'graph-placement'])
+
+    def test_best_strategy_is_selected(self):
+        strategies = {'parallel': compile_parallel, 'sequential': compile_sequential, 'failing': fail}
+
+        circuit, strategy, portfolio = self.compile_portfolio(strategies)
+        self.assertEqual(strategy, 'sequential')
+        self.assertEqual(circuit, compile_sequential(self.circuit))
+        # every strategy is reported, the failed ones with their error
+        self.assertEqual([candidate['strategy'] for candidate in portfolio], ['parallel', 'sequential', 'failing'])
+        self.assertEqual(portfolio[0]['number-of-multi-qubit-gates'], 2)
+        self.assertEqual(portfolio[2], {'strategy': 'failing', 'error': "strategy failed"})
+
+        _, strategy, _ = self.compile_portfolio(strategies, objective=PORTFOLIO_OBJECTIVE_DEPTH)
+        self.assertEqual(strategy, 'parallel')
+
+    def test_all_strategies_fail(self):
+        with self.assertRaisesRegex(RuntimeError, "All compilation strategies failed"):
+            self.compile_portfolio({'first': fail, 'second': fail})
+
+    def test_all_strategies_time_out(self):
+        with self.assertRaises(CompilationTimeoutException):
+            self.compile_portfolio({'first': sleep, 'second': sleep}, timeout=0.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
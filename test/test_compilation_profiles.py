@@ -0,0 +1,105 @@
+# ******************************************************************************
+#  Copyright (c) 2026 University of Stuttgart
+#
+#  See the NOTICE file(s) distributed with this work for additional
+#  information regarding copyright ownership.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# ******************************************************************************
+
+import base64
+import importlib.util
+import os
+import unittest
+
+from app.config import basedir
+from app import app, db
+from app.compilation_profile_model import Compilation_Profile
+
+# the TK2 gate is not supported by the Aer simulator, so the circuit has to be compiled
+IMPLEMENTATION = """
+from pytket import Circuit
+
+def get_circuit(**kwargs):
+    return Circuit(2).TK2(0.1, 0.2, 0.3, 0, 1).measure_all()
+"""
+
+
+class CompilationProfilesTestCase(unittest.TestCase):
+
+    def setUp(self):
+        app.app_context().push()
+        # setup environment variables for testing
+        app.config['TESTING'] = True
+        app.config['WTF_CSRF_ENABLED'] = False
+        app.config['SQLALCHEMY_DATABASE_URI'] = "sqlite:///" + os.path.join(basedir, 'test.db')
+
+        self.client = app.test_client()
+        db.create_all()
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+
+    def test_service_module_imports_all_models(self):
+        # the module is loaded by gunicorn and flask db, which need all models to be imported
+        path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'pytket-service.py')
+        spec = importlib.util.spec_from_file_location('pytket_service', path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+
+        self.assertIs(module.app, app)
+        self.assertIs(module.Compilation_Profile, Compilation_Profile)
+
+    def transpile_with_profile(self):
+        request = {'impl-data': base64.b64encode(IMPLEMENTATION.encode()).decode(),
+                   'impl-language': 'pytket',
+                   'qpu-name': 'aer_simulator',
+                   'provider': 'ibmq',
+                   'input-params': {'token': {'rawValue': 'token', 'type': 'Unknown'}},
+                   'profile': True}
+        response = self.client.post('/pytket-service/api/v1.0/transpile', json=request)
+        self.assertEqual(response.status_code, 200)
+        return response.get_json()
+
+    def test_profiled_transpile(self):
+        json_data = self.transpile_with_profile()
+
+        compilation_profile = json_data['compilation-profile']
+        self.assertTrue(compilation_profile['passes'])
+        for compilation_pass in compilation_profile['passes']:
+            self.assertIn("pass", compilation_pass)
+            self.assertGreaterEqual(compilation_pass['time'], 0)
+        self.assertAlmostEqual(compilation_profile['total-time'],
+                               sum(compilation_pass['time'] for compilation_pass in compilation_profile['passes']))
+
+        response = self.client.get('/pytket-service/api/v1.0/compilation-profiles/%s' % compilation_profile['id'])
+        self.assertEqual(response.status_code, 200)
+        stored_profile = response.get_json()
+        self.assertEqual(stored_profile['backend'], 'aer_simulator')
+        self.assertEqual(stored_profile['provider'], 'ibmq')
+        self.assertEqual(stored_profile['passes'], compilation_profile['passes'])
+
+    def test_list_compilation_profiles(self):
+        compilation_profile_id = self.transpile_with_profile()['compilation-profile']['id']
+
+        response = self.client.get('/pytket-service/api/v1.0/compilation-profiles?qpu-name=aer_simulator')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([profile['id'] for profile in response.get_json()], [compilation_profile_id])
+
+        response = self.client.get('/pytket-service/api/v1.0/compilation-profiles?qpu-name=ibmq_qasm_simulator')
+        self.assertEqual(response.get_json(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
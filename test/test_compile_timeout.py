@@ -0,0 +1,141 @@
+# ******************************************************************************
+#  Copyright (c) 2026 University of Stuttgart
+#
+#  See the NOTICE file(s) distributed with this work for additional
+#  information regarding copyright ownership.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# ******************************************************************************
+
+
+import base64
+import os
+import unittest
+from unittest import mock
+
+from pytket import Circuit
+from pytket.extensions.qiskit import AerBackend
+
+from app.config import basedir
+from app import app, db, tket_handler, transpile_handler
+from app.tket_handler import CompilationTimeoutException
+
+# the TK2 gate is not supported by the Aer simulator, so the circuit has to be compiled
+IMPLEMENTATION = """
+from pytket import Circuit
+
+def get_circuit(**kwargs):
+    return Circuit(2).TK2(0.1, 0.2, 0.3, 0, 1).measure_all()
+"""
+
+
+class CompileTimeoutTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.circuit = Circuit(2).TK2(0.1, 0.2, 0.3, 0, 1).measure_all()
+        self.backend = AerBackend()
+
+    def test_compilation_falls_back_to_lower_levels(self):
+        clock = [0]
+        timeouts = []
+
+        def run_in_subprocess(function, timeout):
+            # the compilations with the levels 2 and 1 run into their timeouts
+            timeouts.append(timeout)
+            clock[0] += timeout
+            if len(timeouts) < 3:
+                raise CompilationTimeoutException()
+            return function()
+
+        with mock.patch.object(tket_handler, 'run_in_subprocess', side_effect=run_in_subprocess), \
+                mock.patch.object(tket_handler.time, 'monotonic', side_effect=lambda: clock[0]):
+            circuit, level = tket_handler.tket_compile_circuit(self.circuit, self.backend, "circuit",
+                                                               optimisation_level=2, timeout=60)
+
+        self.assertEqual(level, 0)
+        self.assertTrue(self.backend.valid_circuit(circuit))
+        # the levels share the timeout, leaving half of the remaining time to the lower levels
+        self.assertEqual(timeouts, [30, 15, 15])
+
+    @mock.patch.object(tket_handler, 'run_in_subprocess', side_effect=CompilationTimeoutException())
+    def test_compilation_timeout(self, run_in_subprocess):
+        with self.assertRaises(CompilationTimeoutException):
+            tket_handler.tket_compile_circuit(self.circuit, self.backend, "circuit", optimisation_level=1, timeout=60)
+
+        self.assertEqual(run_in_subprocess.call_count, 2)
+
+    def test_compilation_without_timeout(self):
+        circuit, level = tket_handler.tket_compile_circuit(self.circuit, self.backend, "circuit",
+                                                           optimisation_level=1)
+
+        self.assertEqual(level, 1)
+        self.assertTrue(self.backend.valid_circuit(circuit))
+
+
+class CompileTimeoutCacheTestCase(unittest.TestCase):
+
+    def setUp(self):
+        app.app_context().push()
+        # setup environment variables for testing
+        app.config['TESTING'] = True
+        app.config['WTF_CSRF_ENABLED'] = False
+        app.config['SQLALCHEMY_DATABASE_URI'] = "sqlite:///" + os.path.join(basedir, 'test.db')
+
+        self.client = app.test_client()
+        db.create_all()
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+
+    def transpile(self, optimisation_level):
+        request = {'impl-data': base64.b64encode(IMPLEMENTATION.encode()).decode(),
+                   'impl-language': 'pytket',
+                   'qpu-name': 'aer_simulator',
+                   'provider': 'ibmq',
+                   'input-params': {'token': {'rawValue': 'token', 'type': 'Unknown'}},
+                   'optimisation-level': optimisation_level,
+                   'compile-timeout': 60}
+        response = self.client.post('/pytket-service/api/v1.0/transpile', json=request)
+        self.assertEqual(response.status_code, 200)
+        return response.get_json()
+
+    @mock.patch.object(transpile_handler.circuit_cache, 'store_compiled_circuit_response')
+    @mock.patch.object(transpile_handler.circuit_cache, 'get_compiled_circuit_response', return_value=None)
+    @mock.patch.object(transpile_handler.circuit_cache, 'get_compiled_circuit_key',
+                       side_effect=lambda fingerprint, provider, qpu_name, level, calibration_version: level)
+    @mock.patch.object(transpile_handler, 'tket_compile_circuit')
+    def test_fallback_is_cached_for_used_level_only(self, tket_compile_circuit, get_compiled_circuit_key,
+                                                    get_compiled_circuit_response, store_compiled_circuit_response):
+        tket_compile_circuit.return_value = (Circuit(2).CX(0, 1).measure_all(), 0)
+
+        json_data = self.transpile(2)
+
+        self.assertEqual(json_data['optimisation-level'], 0)
+        get_compiled_circuit_response.assert_called_once_with(2)
+        store_compiled_circuit_response.assert_called_once_with(0, json_data)
+
+    @mock.patch.object(transpile_handler.circuit_cache, 'store_compiled_circuit_response')
+    @mock.patch.object(transpile_handler.circuit_cache, 'get_compiled_circuit_response', return_value=None)
+    @mock.patch.object(transpile_handler.circuit_cache, 'get_compiled_circuit_key',
+                       side_effect=lambda fingerprint, provider, qpu_name, level, calibration_version: level)
+    def test_compilation_is_cached_for_requested_level(self, get_compiled_circuit_key, get_compiled_circuit_response,
+                                                       store_compiled_circuit_response):
+        json_data = self.transpile(1)
+
+        self.assertEqual(json_data['optimisation-level'], 1)
+        store_compiled_circuit_response.assert_called_once_with(1, json_data)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+# ******************************************************************************
+#  Copyright (c) 2026 University of Stuttgart
+#
+#  See the NOTICE file(s) distributed with this work for additional
+#  information regarding copyright ownership.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# ******************************************************************************
+
+
+import unittest
+from unittest import mock
+
+import qiskit
+
+from app import app, circuit_cache, conversion_strategy
+from app.conversion_strategy import DIRECT, PRECOMPILE
+from app.tket_handler import UnsupportedGateException
+
+
+def get_circuit(gate, angle=0.5):
+    circuit = qiskit.QuantumCircuit(1)
+    getattr(circuit, gate)(angle, 0)
+    return circuit
+
+
+def convert(circuit, impl_language, short_impl_name, logger=None, precompile_circuit=False):
+    # circuits with an Ry gate can only be converted after precompiling them
+    if not precompile_circuit and impl_language == 'Qiskit' and 'ry' in circuit.count_ops():
+        raise UnsupportedGateException("ry")
+    return PRECOMPILE if precompile_circuit else DIRECT
+
+
+@mock.patch.object(conversion_strategy, 'tket_convert_circuit', side_effect=convert)
+class ConversionStrategyTestCase(unittest.TestCase):
+
+    def setUp(self):
+        app.app_context().push()
+        self.enterContext(mock.patch.dict(app.config, {'SPECULATIVE_CONVERSION': False}))
+        # the remembered strategies in a dict instead of Redis
+        self.strategies = {}
+        cache = self.enterContext(mock.patch.object(conversion_strategy, 'conversion_strategies'))
+        cache.get.side_effect = self.strategies.get
+        cache.set.side_effect = lambda key, strategy: self.strategies.update({key: strategy.encode()})
+
+    def test_successful_path_is_remembered_per_circuit_content(self, tket_convert_circuit):
+        circuit = get_circuit("ry")
+
+        self.assertEqual(conversion_strategy.convert_circuit(circuit, 'Qiskit', "circuit"), PRECOMPILE)
+        self.assertEqual(self.strategies, {circuit_cache.get_circuit_fingerprint(circuit): PRECOMPILE.encode()})
+        self.assertEqual(tket_convert_circuit.call_count, 2)
+
+        # the same circuit is precompiled right away
+        tket_convert_circuit.reset_mock()
+        self.assertEqual(conversion_strategy.convert_circuit(get_circuit("ry"), 'Qiskit', "circuit"),
+                         PRECOMPILE)
+        tket_convert_circuit.assert_called_once()
+
+    def test_other_circuits_of_implementation_are_converted_directly(self, tket_convert_circuit):
+        conversion_strategy.convert_circuit(get_circuit("ry"), 'Qiskit', "circuit")
+
+        # e.g., the same implementation with other input parameters, which keeps its original metrics
+        self.assertEqual(conversion_strategy.convert_circuit(get_circuit("rx"), 'Qiskit', "circuit"), DIRECT)
+        self.assertEqual(conversion_strategy.convert_circuit(get_circuit("rx", angle=0.7), 'Qiskit',
+                                                             "circuit"), DIRECT)
+        self.assertEqual(len(self.strategies), 3)
+
+    def test_other_languages_are_not_remembered(self, tket_convert_circuit):
+        conversion_strategy.convert_circuit("H 0", 'Quil', "circuit")
+
+        self.assertEqual(self.strategies, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+# ******************************************************************************
+#  Copyright (c) 2026 University of Stuttgart
+#
+#  See the NOTICE file(s) distributed with this work for additional
+#  information regarding copyright ownership.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# ******************************************************************************
+
+
+import json
+import time
+import unittest
+from unittest import mock
+
+from pytket import Circuit
+from pytket.extensions.qiskit import AerBackend
+
+from app import app, device_metadata, tket_handler
+from app.device_metadata import SnapshotBackend
+
+
+class DeviceMetadataTestCase(unittest.TestCase):
+
+    def setUp(self):
+        app.app_context().push()
+        self.redis = self.enterContext(mock.patch.object(app, 'redis'))
+        self.enterContext(mock.patch.dict(app.config, {'DEVICE_METADATA_REFRESH_INTERVAL': 900,
+                                                       'DEVICE_METADATA_MAX_AGE': 86400,
+                                                       'DEVICE_METADATA_BACKGROUND_REFRESH': False}))
+        self.backend = AerBackend()
+        self.create_backend = mock.Mock(return_value=self.backend)
+
+    def store_snapshot(self, age):
+        snapshot = device_metadata.get_snapshot(self.backend)
+        snapshot['created'] = time.time() - age
+        self.redis.get.return_value = json.dumps(snapshot)
+
+    def test_snapshot_backend(self):
+        backend = SnapshotBackend(device_metadata.get_snapshot(self.backend), self.create_backend)
+        circuit = Circuit(2).TK2(0.1, 0.2, 0.3, 0, 1).measure_all()
+
+        self.assertFalse(backend.valid_circuit(circuit))
+        self.assertTrue(backend.valid_circuit(backend.get_compiled_circuit(circuit)))
+        self.create_backend.assert_not_called()
+
+        # anything besides compiling is delegated to the actual backend
+        self.assertIs(backend.backend, self.backend)
+        self.assertTrue(backend.supports_shots)
+        self.create_backend.assert_called_once()
+
+    def test_backend_is_hydrated_from_snapshot(self):
+        self.store_snapshot(age=60)
+
+        backend = device_metadata.get_snapshot_backend('ibmq', 'ibm_kyiv', self.create_backend)
+
+        self.assertIsInstance(backend, SnapshotBackend)
+        self.create_backend.assert_not_called()
+        self.redis.set.assert_not_called()
+
+    def test_snapshot_is_stored_if_missing(self):
+        self.redis.get.return_value = None
+
+        self.assertIs(device_metadata.get_snapshot_backend('ibmq', 'ibm_kyiv', self.create_backend), self.backend)
+        self.assertEqual(self.redis.set.call_args.args[0], "pytket-service:device-metadata:ibmq:ibm_kyiv")
+
+    def test_expired_snapshot_is_ignored(self):
+        self.store_snapshot(age=90000)
+
+        self.assertIs(device_metadata.get_snapshot_backend('ibmq', 'ibm_kyiv', self.create_backend), self.backend)
+
+    def test_old_snapshot_is_refreshed(self):
+        self.store_snapshot(age=1000)
+        self.redis.set.return_value = True
+
+        backend = device_metadata.get_snapshot_backend('ibmq', 'ibm_kyiv', self.create_backend)
+
+        self.assertIsInstance(backend, SnapshotBackend)
+        self.create_backend.assert_called_once()
+        lock_call, store_call = self.redis.set.call_args_list
+        self.assertEqual(lock_call, mock.call("pytket-service:device-metadata:ibmq:ibm_kyiv:refresh", 1, nx=True,
+                                              ex=900))
+        self.assertEqual(store_call.args[0], "pytket-service:device-metadata:ibmq:ibm_kyiv")
+
+    def test_snapshot_is_refreshed_by_one_process(self):
+        self.store_snapshot(age=1000)
+        # another process holds the refresh lock
+        self.redis.set.return_value = False
+
+        device_metadata.get_snapshot_backend('ibmq', 'ibm_kyiv', self.create_backend)
+
+        self.create_backend.assert_not_called()
+        self.redis.set.assert_called_once()
+
+    @mock.patch.object(device_metadata.threading, 'Thread')
+    def test_background_refresh(self, thread):
+        self.store_snapshot(age=1000)
+        self.redis.set.return_value = True
+
+        with mock.patch.dict(app.config, {'DEVICE_METADATA_BACKGROUND_REFRESH': True}):
+            device_metadata.get_snapshot_backend('ibmq', 'ibm_kyiv', self.create_backend)
+
+        self.create_backend.assert_not_called()
+        thread.return_value.start.assert_called_once()
+        self.assertEqual(thread.call_args.kwargs['args'], ('ibmq', 'ibm_kyiv', self.create_backend))
+
+    @mock.patch.dict(tket_handler._backend_pool, clear=True)
+    @mock.patch.object(tket_handler, 'BraketBackend')
+    @mock.patch.object(device_metadata, 'get_snapshot_backend')
+    def test_snapshot_backend_keeps_aws_session(self, get_snapshot_backend, braket_backend):
+        with mock.patch.object(tket_handler, 'aws_session', "first session"):
+            tket_handler.get_backend('aws', 'Aspen-M-3')
+        create_backend = get_snapshot_backend.call_args.args[2]
+
+        # the actual backend is created after another request set up other credentials
+        with mock.patch.object(tket_handler, 'aws_session', "second session"):
+            create_backend()
+
+        self.assertEqual(braket_backend.call_args.kwargs['aws_session'], "first session")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+# ******************************************************************************
+#  Copyright (c) 2026 University of Stuttgart
+#
+#  See the NOTICE file(s) distributed with this work for additional
+#  information regarding copyright ownership.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# ******************************************************************************
+
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from app import implementation_handler
+from app.download_cache import DownloadCache
+
+URL = "https://example.org/implementations/hadamard.py"
+
+
+class DownloadCacheTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = DownloadCache(self.directory.name, max_size=1024, max_age=0)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_store_and_load(self):
+        key = self.cache.get_key(URL)
+        self.cache.store(key, URL, "print('hadamard')", etag='"v1"', last_modified="Mon, 01 Jan 2024 00:00:00 GMT")
+
+        entry = self.cache.load(key)
+        self.assertEqual(entry['body'], "print('hadamard')")
+        self.assertEqual(entry['etag'], '"v1"')
+        self.assertEqual(entry['last-modified'], "Mon, 01 Jan 2024 00:00:00 GMT")
+        self.assertIsNone(self.cache.load(self.cache.get_key(URL, scope="other credentials")))
+
+    def test_least_recently_stored_entries_are_evicted(self):
+        keys = [self.cache.get_key(f"{URL}?version={version}") for version in range(3)]
+        for version, key in enumerate(keys):
+            self.cache.store(key, URL, "x" * 400)
+            # the eviction order is based on the modification time of the entries
+            os.utime(os.path.join(self.directory.name, f"{key}.body"), (version, version))
+
+        self.assertIsNone(self.cache.load(keys[0]))
+        self.assertIsNotNone(self.cache.load(keys[1]))
+        self.assertIsNotNone(self.cache.load(keys[2]))
+
+    def test_freshness(self):
+        entry = {'fetched': time.time()}
+        self.assertFalse(self.cache.is_fresh(entry))
+        self.assertTrue(DownloadCache(self.directory.name, max_size=1024, max_age=60).is_fresh(entry))
+
+    def test_disabled_cache(self):
+        cache = DownloadCache(self.directory.name, max_size=0, max_age=0)
+        cache.store(cache.get_key(URL), URL, "print('hadamard')", etag='"v1"')
+
+        self.assertIsNone(cache.load(cache.get_key(URL)))
+
+    def test_download_is_revalidated(self):
+        session = mock.Mock()
+        session.get.return_value = mock.Mock(status_code=200, text="print('hadamard')", headers={'ETag': '"v1"'})
+        with mock.patch.object(implementation_handler.download_cache, 'downloads', self.cache), \
+                mock.patch.object(implementation_handler, 'get_http_session', return_value=session):
+            self.assertEqual(implementation_handler._download_code(URL), "print('hadamard')")
+
+            session.get.return_value = mock.Mock(status_code=304, text="", headers={})
+            self.assertEqual(implementation_handler._download_code(URL), "print('hadamard')")
+
+        self.assertEqual(session.get.call_args.kwargs['headers'], {'If-None-Match': '"v1"'})
+
+
+if __name__ == "__main__":
+    unittest.main()
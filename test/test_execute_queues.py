@@ -0,0 +1,101 @@
+# ******************************************************************************
+#  Copyright (c) 2026 University of Stuttgart
+#
+#  See the NOTICE file(s) distributed with this work for additional
+#  information regarding copyright ownership.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# ******************************************************************************
+
+import os
+import unittest
+from unittest import mock
+
+import rq
+
+from app.config import basedir
+from app import app, db, execute_queues
+
+QASM = """OPENQASM 2.0;
+include "qelib1.inc";
+qreg q[1];
+creg c[1];
+h q[0];
+measure q -> c;
+"""
+
+
+class ExecuteQueuesTestCase(unittest.TestCase):
+
+    def setUp(self):
+        app.app_context().push()
+        # setup environment variables for testing
+        app.config['TESTING'] = True
+        app.config['WTF_CSRF_ENABLED'] = False
+        app.config['SQLALCHEMY_DATABASE_URI'] = "sqlite:///" + os.path.join(basedir, 'test.db')
+
+        self.client = app.test_client()
+        db.create_all()
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+
+    def test_backend_classes(self):
+        self.assertEqual(execute_queues.get_backend_class('ibmq', 'aer_simulator'), execute_queues.LOCAL_SIMULATOR)
+        self.assertEqual(execute_queues.get_backend_class('rigetti', '9q-square-qvm'), execute_queues.REMOTE_SIMULATOR)
+        self.assertEqual(execute_queues.get_backend_class('aws', 'SV1'), execute_queues.REMOTE_SIMULATOR)
+        self.assertEqual(execute_queues.get_backend_class('aws', 'Aspen-M-3'), execute_queues.QPU)
+        self.assertEqual(execute_queues.get_backend_class('ibmq', 'ibm_kyiv'), execute_queues.QPU)
+
+    def test_queue_weights(self):
+        with mock.patch.dict(app.config, {'EXECUTE_QUEUE_WEIGHTS': 'local-simulator=6, qpu=0.5',
+                                          'EXECUTE_PRIORITY_WEIGHTS': 'high=4'}):
+            weights = execute_queues.get_queue_weights()
+
+        self.assertEqual(len(weights), len(execute_queues.BACKEND_CLASSES) * len(execute_queues.PRIORITIES))
+        self.assertEqual(weights['pytket-service_execute_local-simulator_high'], 24)
+        self.assertEqual(weights['pytket-service_execute_local-simulator_normal'], 6)
+        # unlisted classes and priorities have a weight of 1
+        self.assertEqual(weights['pytket-service_execute_remote-simulator_high'], 4)
+        self.assertEqual(weights['pytket-service_execute_qpu_normal'], 0.5)
+
+    def test_execute_with_priority(self):
+        request = {'transpiled-qasm': QASM, 'provider': 'ibmq', 'qpu-name': 'aer_simulator', 'priority': 'high',
+                   'input-params': {'token': {'rawValue': 'token', 'type': 'Unknown'}}}
+        with mock.patch.object(rq.Queue, 'enqueue', autospec=True,
+                               side_effect=lambda queue, function, job_id, **kwargs: mock.Mock(
+                                   **{'get_id.return_value': job_id})) as enqueue:
+            response = self.client.post('/pytket-service/api/v1.0/execute', json=request)
+            del request['priority']
+            self.client.post('/pytket-service/api/v1.0/execute', json=request)
+
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual([call.args[0].name for call in enqueue.call_args_list],
+                         ['pytket-service_execute_local-simulator_high',
+                          'pytket-service_execute_local-simulator_normal'])
+
+    def test_get_queues(self):
+        with mock.patch.object(execute_queues, 'get_queue_statistics',
+                               side_effect=lambda queue: {'name': queue.name, 'depth': 0, 'wait': 0, 'workers': 1}):
+            response = self.client.get('/pytket-service/api/v1.0/queues')
+
+        self.assertEqual(response.status_code, 200)
+        names = [queue['name'] for queue in response.get_json()['queues']]
+        self.assertIn('pytket-service_execute_qpu_high', names)
+        self.assertIn('pytket-service_transpile', names)
+        self.assertEqual(len(names), len(execute_queues.get_service_queues()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,150 @@
+# ******************************************************************************
+#  Copyright (c) 2026 University of Stuttgart
+#
+#  See the NOTICE file(s) distributed with this work for additional
+#  information regarding copyright ownership.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# ******************************************************************************
+
+
+import os
+import unittest
+from unittest import mock
+
+from rq.exceptions import NoSuchJobError
+from rq.job import JobStatus
+
+from app.config import basedir
+from app import app, db, execute_queues, execution_coalescing
+from app.result_model import Result
+
+QASM = """OPENQASM 2.0;
+include "qelib1.inc";
+qreg q[1];
+creg c[1];
+h q[0];
+measure q -> c;
+"""
+
+
+class ExecutionCoalescingTestCase(unittest.TestCase):
+
+    def setUp(self):
+        app.app_context().push()
+        # setup environment variables for testing
+        app.config['TESTING'] = True
+        app.config['WTF_CSRF_ENABLED'] = False
+        app.config['SQLALCHEMY_DATABASE_URI'] = "sqlite:///" + os.path.join(basedir, 'test.db')
+
+        self.client = app.test_client()
+        db.create_all()
+
+        # the in-flight executions are registered in a dict instead of Redis
+        self.flights = {}
+        redis = self.enterContext(mock.patch.object(app, 'redis'))
+        redis.set.side_effect = self.register_flight
+        redis.get.side_effect = self.flights.get
+        redis.pipeline.return_value.get.side_effect = self.flights.get
+        redis.pipeline.return_value.delete.side_effect = self.flights.pop
+        execute_queue = self.enterContext(mock.patch.object(execute_queues, 'get_execute_queue')).return_value
+        self.enqueue = execute_queue.enqueue
+        self.enqueue.side_effect = lambda function, job_id, **kwargs: mock.Mock(**{'get_id.return_value': job_id})
+        self.job_status = JobStatus.STARTED
+        self.enterContext(mock.patch.object(execution_coalescing.Job, 'fetch', side_effect=self.fetch_job))
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+
+    def register_flight(self, key, value, nx, ex):
+        return self.flights.setdefault(key, value.encode()) == value.encode()
+
+    def fetch_job(self, job_id, connection):
+        if self.job_status is None:
+            raise NoSuchJobError(job_id)
+        return mock.Mock(**{'get_status.return_value': self.job_status})
+
+    def execute(self, **options):
+        request = {'transpiled-qasm': QASM, 'provider': 'ibmq', 'qpu-name': 'aer_simulator', 'shots': 100,
+                   'input-params': {'token': {'rawValue': 'token', 'type': 'Unknown'}}}
+        request.update(options)
+        response = self.client.post('/pytket-service/api/v1.0/execute', json=request)
+        self.assertEqual(response.status_code, 202)
+        return response.get_json()['Location']
+
+    def test_identical_requests_share_result(self):
+        location = self.execute(coalesce=True, seed=1)
+
+        self.assertEqual(self.execute(coalesce=True, seed=1), location)
+        self.assertNotEqual(self.execute(coalesce=True, seed=2), location)
+        self.assertNotEqual(self.execute(seed=1), location)
+        self.assertEqual(self.enqueue.call_count, 3)
+
+    def test_completed_result_is_not_shared(self):
+        location = self.execute(coalesce=True)
+        result = Result.query.get(location.split('/')[-1])
+        result.complete = True
+        db.session.commit()
+
+        self.assertNotEqual(self.execute(coalesce=True), location)
+
+
+    def test_result_of_failed_job_is_not_shared(self):
+        location = self.execute(coalesce=True)
+        self.job_status = JobStatus.FAILED
+
+        self.assertNotEqual(self.execute(coalesce=True), location)
+
+    def test_result_of_vanished_job_is_not_shared(self):
+        location = self.execute(coalesce=True)
+        self.job_status = None
+
+        self.assertNotEqual(self.execute(coalesce=True), location)
+
+    def test_result_polled_in_background_is_shared(self):
+        location = self.execute(coalesce=True)
+        result = Result.query.get(location.split('/')[-1])
+        result.job_handle = "['job-at-provider']"
+        db.session.commit()
+        # the job finished after handing over its result to the poller and expired
+        self.job_status = None
+
+        self.assertEqual(self.execute(coalesce=True), location)
+
+    def test_result_of_failed_enqueue_is_not_shared(self):
+        # the job is neither enqueued nor is its Result created
+        self.enqueue.side_effect = RuntimeError("Redis unavailable")
+        with self.assertRaises(RuntimeError):
+            self.execute(coalesce=True)
+
+        self.assertEqual(self.flights, {})
+
+    def test_result_without_job_is_not_shared(self):
+        location = self.execute(coalesce=True)
+        db.session.delete(Result.query.get(location.split('/')[-1]))
+        db.session.commit()
+        self.job_status = None
+
+        self.assertNotEqual(self.execute(coalesce=True), location)
+
+    def test_queued_job_without_result_is_shared(self):
+        location = self.execute(coalesce=True)
+        # the Result of the job in flight is not committed yet
+        db.session.delete(Result.query.get(location.split('/')[-1]))
+        db.session.commit()
+
+        self.assertEqual(self.execute(coalesce=True), location)
+
+if __name__ == "__main__":
+    unittest.main()
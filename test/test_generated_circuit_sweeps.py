@@ -0,0 +1,107 @@
+# ******************************************************************************
+#  Copyright (c) 2026 University of Stuttgart
+#
+#  See the NOTICE file(s) distributed with this work for additional
+#  information regarding copyright ownership.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# ******************************************************************************
+
+import base64
+import os
+import unittest
+from unittest import mock
+
+from app.config import basedir
+from app import app, db, tasks
+from app.generated_circuit_model import Generated_Circuit
+
+IMPLEMENTATION = """
+import qiskit
+
+def get_circuit(**kwargs):
+    circuit = qiskit.QuantumCircuit(kwargs['n'])
+    circuit.h(range(kwargs['n']))
+    circuit.measure_all()
+    return circuit
+"""
+
+
+class GeneratedCircuitSweepsTestCase(unittest.TestCase):
+
+    def setUp(self):
+        app.app_context().push()
+        # setup environment variables for testing
+        app.config['TESTING'] = True
+        app.config['WTF_CSRF_ENABLED'] = False
+        app.config['SQLALCHEMY_DATABASE_URI'] = "sqlite:///" + os.path.join(basedir, 'test.db')
+
+        self.client = app.test_client()
+        db.create_all()
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+
+    def test_generate_circuit_sweep(self):
+        request = {'impl-data': base64.b64encode(IMPLEMENTATION.encode()).decode(),
+                   'impl-language': 'Qiskit',
+                   'input-params': [{'n': {'rawValue': str(n), 'type': 'Integer'}} for n in (1, 2, 3)]}
+        with mock.patch.object(app.implementation_queue, 'enqueue') as enqueue:
+            response = self.client.post('/pytket-service/api/v1.0/generate-circuit-sweep', json=request)
+
+        self.assertEqual(response.status_code, 202)
+        location = response.get_json()['Location']
+        sweep_id = location.split('/')[-1]
+        self.assertEqual(location, '/pytket-service/api/v1.0/generated-circuit-sweeps/' + sweep_id)
+        self.assertEqual(enqueue.call_args.args[0], 'app.tasks.generate_sweep')
+        self.assertEqual(enqueue.call_args.kwargs['job_id'], sweep_id)
+
+        json_data = self.client.get(location).get_json()
+        self.assertFalse(json_data['complete'])
+        self.assertEqual(len(json_data['generated-circuits']), 3)
+
+        job = mock.Mock()
+        job.get_id.return_value = sweep_id
+        job_kwargs = dict(enqueue.call_args.kwargs)
+        del job_kwargs['job_id']
+        with mock.patch.object(tasks, 'get_current_job', return_value=job):
+            tasks.generate_sweep(**job_kwargs)
+
+        json_data = self.client.get(location).get_json()
+        self.assertTrue(json_data['complete'])
+        generated_circuits = json_data['generated-circuits']
+        self.assertEqual([generated_circuit['original-width'] for generated_circuit in generated_circuits], [1, 2, 3])
+        self.assertEqual([generated_circuit['input_params'] for generated_circuit in generated_circuits],
+                         [{'n': 1}, {'n': 2}, {'n': 3}])
+
+        # every variant can be fetched as a generated circuit as well
+        response = self.client.get('/pytket-service/api/v1.0/generated-circuits/' + generated_circuits[1]['id'])
+        self.assertIn("qreg q[2];", response.get_json()['generated-circuit'])
+
+    def test_failed_variants_complete_with_error(self):
+        db.session.add(Generated_Circuit(id="variant", sweep_id="sweep", sweep_index=0))
+        db.session.commit()
+
+        job = mock.Mock()
+        job.get_id.return_value = "sweep"
+        with mock.patch.object(tasks, 'get_current_job', return_value=job):
+            tasks.generate_sweep(None, "raise ValueError()", 'Qiskit', [{}], "")
+
+        json_data = self.client.get('/pytket-service/api/v1.0/generated-circuit-sweeps/sweep').get_json()
+        self.assertTrue(json_data['complete'])
+        self.assertIn("error", json_data['generated-circuits'][0]['generated-circuit'])
+
+
+if __name__ == "__main__":
+    unittest.main()
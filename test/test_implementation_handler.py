@@ -0,0 +1,69 @@
+# ******************************************************************************
+#  Copyright (c) 2026 University of Stuttgart
+#
+#  See the NOTICE file(s) distributed with this work for additional
+#  information regarding copyright ownership.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# ******************************************************************************
+
+import unittest
+from unittest import mock
+
+from app import app, implementation_handler
+
+IMPLEMENTATION = """
+calls = []
+
+def get_circuit(**kwargs):
+    calls.append(kwargs)
+    return len(calls)
+"""
+
+
+class ImplementationHandlerTestCase(unittest.TestCase):
+
+    def test_http_session_is_reused(self):
+        session = implementation_handler.get_http_session()
+
+        self.assertIs(implementation_handler.get_http_session(), session)
+        adapter = session.get_adapter("https://example.org")
+        self.assertEqual(adapter.max_retries.total, app.config['DOWNLOAD_RETRIES'])
+        self.assertIn(503, adapter.max_retries.status_forcelist)
+        self.assertIs(session.get_adapter("http://example.org"), adapter)
+
+    def test_http_session_is_recreated_after_fork(self):
+        session = implementation_handler.get_http_session()
+
+        with mock.patch.object(implementation_handler.os, 'getpid', return_value=-1):
+            self.assertIsNot(implementation_handler.get_http_session(), session)
+
+    def test_implementations_run_in_fresh_namespaces(self):
+        first = implementation_handler.load_implementation(IMPLEMENTATION)
+        second = implementation_handler.load_implementation(IMPLEMENTATION)
+
+        # the global state of one execution is not visible to the next one
+        self.assertEqual(first['get_circuit'](n=1), 1)
+        self.assertEqual(second['get_circuit'](n=2), 1)
+        self.assertEqual(first['__name__'], 'downloaded_code')
+
+    def test_implementations_are_compiled_once(self):
+        with mock.patch.object(implementation_handler, 'compile', wraps=compile, create=True) as compile_mock:
+            implementation_handler.load_implementation(IMPLEMENTATION + "# compiled once")
+            implementation_handler.load_implementation(IMPLEMENTATION + "# compiled once")
+
+        self.assertEqual(compile_mock.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+# ******************************************************************************
+#  Copyright (c) 2026 University of Stuttgart
+#
+#  See the NOTICE file(s) distributed with this work for additional
+#  information regarding copyright ownership.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# ******************************************************************************
+
+import unittest
+from unittest import mock
+
+from pytket import Bit, Qubit
+
+from app import qasm_ingestion
+
+QASM = """OPENQASM 2.0;
+include "qelib1.inc";
+qreg qReg[2];
+creg mEas[2];
+h qReg[0];
+cx qReg[0],qReg[1];
+measure qReg -> mEas;
+"""
+
+
+class QasmIngestionTestCase(unittest.TestCase):
+
+    def test_qasm_is_parsed_once(self):
+        qasm = QASM + "// parsed once\n"
+        with mock.patch.object(qasm_ingestion, 'circuit_from_qasm_str',
+                               wraps=qasm_ingestion.circuit_from_qasm_str) as parse:
+            first = qasm_ingestion.load_qasm(qasm)
+            second = qasm_ingestion.load_qasm(qasm)
+
+        self.assertEqual(parse.call_count, 1)
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+
+    def test_loaded_circuits_can_be_modified(self):
+        circuit = qasm_ingestion.load_qasm(QASM)
+        circuit.X(circuit.qubits[0])
+
+        self.assertEqual(qasm_ingestion.load_qasm(QASM).n_gates, circuit.n_gates - 1)
+
+    def test_rename_registers_lowercase(self):
+        circuit = qasm_ingestion.rename_registers_lowercase(qasm_ingestion.load_qasm(QASM))
+
+        self.assertEqual(circuit.qubits, [Qubit('qreg', 0), Qubit('qreg', 1)])
+        self.assertEqual(circuit.bits, [Bit('meas', 0), Bit('meas', 1)])
+        self.assertEqual(circuit.n_gates, 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+# ******************************************************************************
+#  Copyright (c) 2026 University of Stuttgart
+#
+#  See the NOTICE file(s) distributed with this work for additional
+#  information regarding copyright ownership.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# ******************************************************************************
+
+
+import os
+import unittest
+from unittest import mock
+
+from app.config import basedir
+from app import app, db, execute_queues, tasks
+
+QASM = """OPENQASM 2.0;
+include "qelib1.inc";
+qreg q[2];
+creg c[2];
+h q[0];
+cx q[0],q[1];
+measure q -> c;
+"""
+
+
+class ResultBatchesTestCase(unittest.TestCase):
+
+    def setUp(self):
+        app.app_context().push()
+        # setup environment variables for testing
+        app.config['TESTING'] = True
+        app.config['WTF_CSRF_ENABLED'] = False
+        app.config['SQLALCHEMY_DATABASE_URI'] = "sqlite:///" + os.path.join(basedir, 'test.db')
+
+        self.client = app.test_client()
+        db.create_all()
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+
+    def submit_batch(self, transpiled_qasm, qpu_name):
+        request = {'transpiled-qasm': transpiled_qasm, 'provider': 'ibmq', 'qpu-name': qpu_name, 'shots': 100,
+                   'input-params': {'token': {'rawValue': 'token', 'type': 'Unknown'}}}
+        with mock.patch.object(execute_queues, 'get_execute_queue') as get_execute_queue:
+            response = self.client.post('/pytket-service/api/v1.0/execute', json=request)
+        enqueue = get_execute_queue.return_value.enqueue
+
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(enqueue.call_args.args[0], 'app.tasks.execute_batch')
+        return response.get_json()['Location'], enqueue.call_args.kwargs
+
+    def test_execute_batch(self):
+        location, job_kwargs = self.submit_batch([QASM, QASM], 'aer_simulator')
+
+        self.assertEqual(location, '/pytket-service/api/v1.0/result-batches/' + job_kwargs['job_id'])
+        json_data = self.client.get(location).get_json()
+        self.assertFalse(json_data['complete'])
+        self.assertEqual(len(json_data['results']), 2)
+
+    @mock.patch.object(tasks, 'get_current_job')
+    def test_execute_batch_job(self, get_current_job):
+        location, job_kwargs = self.submit_batch([QASM, QASM.replace("cx q[0],q[1];", "x q[1];"), "invalid"],
+                                                 'aer_simulator')
+        get_current_job.return_value.get_id.return_value = job_kwargs.pop('job_id')
+
+        tasks.execute_batch(**job_kwargs)
+
+        json_data = self.client.get(location).get_json()
+        self.assertTrue(json_data['complete'])
+        bell, flipped, invalid = json_data['results']
+        self.assertEqual(sum(bell['result'].values()), 100)
+        self.assertLessEqual(set(bell['result']), {'00', '11'})
+        self.assertEqual(sum(flipped['result'].values()), 100)
+        self.assertLessEqual(set(flipped['result']), {'10', '11'})
+        self.assertIn("error", invalid['result'])
+
+    @mock.patch.object(tasks, 'setup_credentials')
+    @mock.patch.object(tasks, 'get_backend')
+    @mock.patch.object(tasks, 'get_current_job')
+    def test_failed_submission_completes_batch(self, get_current_job, get_backend, setup_credentials):
+        get_backend.return_value.valid_circuit.return_value = True
+        get_backend.return_value.process_circuits.side_effect = RuntimeError("device offline")
+        location, job_kwargs = self.submit_batch([QASM, QASM], 'ibm_kyiv')
+        get_current_job.return_value.get_id.return_value = job_kwargs.pop('job_id')
+
+        tasks.execute_batch(**job_kwargs)
+
+        json_data = self.client.get(location).get_json()
+        self.assertTrue(json_data['complete'])
+        self.assertEqual([result['result'] for result in json_data['results']],
+                         [{'error': "execution failed: device offline"}] * 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+# ******************************************************************************
+#  Copyright (c) 2026 University of Stuttgart
+#
+#  See the NOTICE file(s) distributed with this work for additional
+#  information regarding copyright ownership.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# ******************************************************************************
+
+
+import json
+import unittest
+from collections import Counter
+
+from app.result_encoding import encode_counts, decode_counts
+
+
+class ResultEncodingTestCase(unittest.TestCase):
+
+    def test_decoded_bitstrings_are_reversed(self):
+        counts = Counter({(1, 0, 0): 3, (0, 0, 1): 2, (1, 1, 0): 1})
+
+        self.assertEqual(decode_counts(encode_counts(counts)), {'001': 3, '100': 2, '011': 1})
+
+    def test_wide_outcomes(self):
+        # more bits than fit into a single machine integer
+        outcome = tuple([1] + [0] * 70 + [1])
+        counts = Counter({outcome: 8192})
+
+        self.assertEqual(decode_counts(encode_counts(counts)), {'1' + '0' * 70 + '1': 8192})
+
+    def test_empty_counts(self):
+        self.assertEqual(decode_counts(encode_counts(Counter())), {})
+
+    def test_encoding_is_compact(self):
+        counts = Counter({tuple((i >> bit) & 1 for bit in range(20)): 1 for i in range(8192)})
+        decoded = decode_counts(encode_counts(counts))
+
+        self.assertEqual(len(decoded), 8192)
+        self.assertLess(len(encode_counts(counts)), len(json.dumps(decoded)) / 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
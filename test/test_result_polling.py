@@ -0,0 +1,129 @@
+# ******************************************************************************
+#  Copyright (c) 2026 University of Stuttgart
+#
+#  See the NOTICE file(s) distributed with this work for additional
+#  information regarding copyright ownership.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# ******************************************************************************
+
+import json
+import os
+import unittest
+from collections import Counter
+from datetime import timedelta
+from unittest import mock
+
+from pytket.backends import ResultHandle, StatusEnum
+from pytket.backends.status import CircuitStatus
+
+from app.config import basedir
+from app import app, db, result_polling, result_encoding, tasks
+from app.result_model import Result
+
+NOW = 1000.0
+POST_PROCESSING = {'correlation_id': None, 'impl_url': None, 'impl_data': None}
+
+
+class ResultPollingTestCase(unittest.TestCase):
+
+    def setUp(self):
+        app.app_context().push()
+        # setup environment variables for testing
+        app.config['TESTING'] = True
+        app.config['WTF_CSRF_ENABLED'] = False
+        app.config['SQLALCHEMY_DATABASE_URI'] = "sqlite:///" + os.path.join(basedir, 'test.db')
+        db.create_all()
+
+        self.redis = self.enterContext(mock.patch.object(app, 'redis'))
+        self.execute_queue = self.enterContext(mock.patch.object(app, 'execute_queue'))
+        self.enterContext(mock.patch.object(result_polling.time, 'time', return_value=NOW))
+        self.enterContext(mock.patch.dict(app.config, {'RESULT_POLL_INTERVAL': 15, 'RESULT_POLL_MAX_INTERVAL': 600}))
+        self.group = result_polling.get_poll_group('aws', 'Aspen-M-3')
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+
+    def test_delay_grows_exponentially_up_to_max_interval(self):
+        self.assertEqual([result_polling._get_delay(attempt) for attempt in range(7)], [15, 30, 60, 120, 240, 480, 600])
+
+    def test_add_pending_result_schedules_one_poller_per_group(self):
+        self.redis.set.side_effect = [True, False]
+
+        result_polling.add_pending_result("r1", 'aws', 'Aspen-M-3', {}, POST_PROCESSING)
+        result_polling.add_pending_result("r2", 'aws', 'Aspen-M-3', {}, POST_PROCESSING)
+
+        pipe = self.redis.pipeline.return_value
+        pipe.zadd.assert_called_with(result_polling._due_key(self.group), {"r2": NOW + 15})
+        self.assertEqual(json.loads(pipe.hset.call_args.args[2]), {'attempt': 0, 'post-processing': POST_PROCESSING})
+        self.execute_queue.enqueue_in.assert_called_once_with(timedelta(seconds=15), 'app.tasks.poll_results',
+                                                              group=self.group, provider='aws',
+                                                              qpu_name='Aspen-M-3', input_params={})
+
+    def test_reschedule_result(self):
+        state = {'attempt': 2, 'post-processing': POST_PROCESSING}
+        result_polling.reschedule_result(self.group, "r1", state)
+
+        self.assertEqual(state['attempt'], 3)
+        self.redis.pipeline.return_value.zadd.assert_called_with(result_polling._due_key(self.group),
+                                                                 {"r1": NOW + 120})
+
+    def test_finish_poll_schedules_earliest_due_result(self):
+        self.redis.zrange.return_value = [(b"r1", NOW + 40)]
+        result_polling.finish_poll(self.group, 'aws', 'Aspen-M-3', {})
+
+        self.assertEqual(self.execute_queue.enqueue_in.call_args.args[0], timedelta(seconds=40))
+        self.redis.delete.assert_not_called()
+
+    def test_finish_poll_releases_poller(self):
+        self.redis.zrange.return_value = []
+        self.redis.zcard.return_value = 0
+        result_polling.finish_poll(self.group, 'aws', 'Aspen-M-3', {})
+
+        self.redis.delete.assert_called_once_with(result_polling._poller_key(self.group))
+        self.execute_queue.enqueue_in.assert_not_called()
+
+    def test_poll_results(self):
+        handles = {result_id: ResultHandle(result_id) for result_id in ("done", "running", "failed")}
+        for result_id, handle in handles.items():
+            db.session.add(Result(id=result_id, job_handle=str(handle)))
+        db.session.commit()
+        states = {result_id: {'attempt': 0, 'post-processing': POST_PROCESSING} for result_id in handles}
+
+        backend = mock.Mock()
+        backend.circuit_status.side_effect = lambda handle: {
+            handles["done"]: CircuitStatus(StatusEnum.COMPLETED),
+            handles["running"]: CircuitStatus(StatusEnum.RUNNING),
+            handles["failed"]: CircuitStatus(StatusEnum.ERROR, "calibration"),
+        }[handle]
+        backend.get_result.return_value.get_counts.return_value = Counter({(0, 1): 10})
+
+        with mock.patch.object(tasks, 'setup_credentials'), \
+                mock.patch.object(tasks, 'get_backend', return_value=backend), \
+                mock.patch.object(result_polling, 'get_due_results', return_value=list(states.items())), \
+                mock.patch.object(result_polling, 'reschedule_result') as reschedule_result, \
+                mock.patch.object(result_polling, 'remove_result') as remove_result, \
+                mock.patch.object(result_polling, 'finish_poll') as finish_poll:
+            tasks.poll_results(self.group, 'aws', 'Aspen-M-3', {})
+
+        self.assertEqual(result_encoding.decode_counts(Result.query.get("done").counts), {'10': 10})
+        self.assertEqual(json.loads(Result.query.get("failed").result), {'error': "execution failed: calibration"})
+        self.assertFalse(Result.query.get("running").complete)
+        reschedule_result.assert_called_once_with(self.group, "running", states["running"])
+        self.assertEqual(sorted(call.args[1] for call in remove_result.call_args_list), ["done", "failed"])
+        finish_poll.assert_called_once_with(self.group, 'aws', 'Aspen-M-3', {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+# ******************************************************************************
+#  Copyright (c) 2026 University of Stuttgart
+#
+#  See the NOTICE file(s) distributed with this work for additional
+#  information regarding copyright ownership.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# ******************************************************************************
+
+import os
+import time
+import unittest
+
+from app.sandbox import SandboxPool, SandboxLimitExceededException
+
+
+def get_pid():
+    return os.getpid()
+
+
+def fail():
+    raise ValueError("implementation failed")
+
+
+def sleep(seconds):
+    time.sleep(seconds)
+
+
+class SandboxTestCase(unittest.TestCase):
+
+    def create_pool(self, **kwargs):
+        options = {'size': 1, 'max_jobs': 100, 'max_rss': 2 ** 40, 'cpu_time': 0, 'memory_limit': 0, 'timeout': 30}
+        options.update(kwargs)
+        return SandboxPool(**options)
+
+    def test_jobs_run_in_sandbox_process(self):
+        pool = self.create_pool()
+        pid = pool.run(get_pid)
+
+        self.assertNotEqual(pid, os.getpid())
+        self.assertEqual(pool.run(get_pid), pid)
+
+    def test_processes_are_recycled_after_max_jobs(self):
+        pool = self.create_pool(max_jobs=2)
+        pids = [pool.run(get_pid) for _ in range(4)]
+
+        self.assertEqual(pids[0], pids[1])
+        self.assertNotEqual(pids[1], pids[2])
+        self.assertEqual(pids[2], pids[3])
+
+    def test_exceptions_are_raised_in_caller(self):
+        pool = self.create_pool()
+
+        with self.assertRaisesRegex(ValueError, "implementation failed"):
+            pool.run(fail)
+        # the process survives failing implementations
+        self.assertIsNotNone(pool.run(get_pid))
+
+    def test_timeout(self):
+        pool = self.create_pool(timeout=0.5)
+        pid = pool.run(get_pid)
+
+        with self.assertRaises(SandboxLimitExceededException):
+            pool.run(sleep, 10)
+        self.assertNotEqual(pool.run(get_pid), pid)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+# ******************************************************************************
+#  Copyright (c) 2026 University of Stuttgart
+#
+#  See the NOTICE file(s) distributed with this work for additional
+#  information regarding copyright ownership.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# ******************************************************************************
+
+import itertools
+import unittest
+from unittest import mock
+
+import numpy as np
+from pytket import Circuit, OpType
+from sympy import Symbol
+
+from app import app, simulation
+
+
+def get_repeated_measurement_circuit():
+    # measuring a qubit in superposition, resetting, and measuring it again requires a simulation per shot
+    circuit = Circuit(2, 2)
+    circuit.Rx(0.3, 0).CX(0, 1).Measure(0, 0).Reset(0).Rx(0.7, 0).Measure(0, 1)
+    return circuit
+
+
+class SimulationShardingTestCase(unittest.TestCase):
+
+    def test_requires_shot_by_shot_simulation(self):
+        self.assertFalse(simulation.requires_shot_by_shot_simulation(Circuit(2).H(0).CX(0, 1).measure_all()))
+        self.assertTrue(simulation.requires_shot_by_shot_simulation(get_repeated_measurement_circuit()))
+        self.assertTrue(simulation.requires_shot_by_shot_simulation(Circuit(1, 1).Measure(0, 0).H(0)))
+
+    def test_shard_count(self):
+        plan = simulation.SimulationPlan(simulation.STATEVECTOR, get_repeated_measurement_circuit(), 1)
+        with mock.patch.dict(app.config, {'SIMULATION_SHARDS': 4, 'SIMULATION_SHARD_MIN_QUBITS': 2,
+                                          'SIMULATION_SHARD_MIN_SHOTS': 128}):
+            self.assertEqual(simulation.get_shard_count(plan, 1024), 4)
+            self.assertEqual(simulation.get_shard_count(plan, 256), 2)
+            self.assertEqual(simulation.get_shard_count(plan, 100), 1)
+
+            sampled_plan = simulation.SimulationPlan(simulation.STATEVECTOR, Circuit(2).H(0).measure_all(), 1)
+            self.assertEqual(simulation.get_shard_count(sampled_plan, 1024), 1)
+
+        with mock.patch.dict(app.config, {'SIMULATION_SHARDS': 4, 'SIMULATION_SHARD_MIN_QUBITS': 10}):
+            self.assertEqual(simulation.get_shard_count(plan, 1024), 1)
+
+    def test_sharded_simulation_is_reproducible(self):
+        circuit = get_repeated_measurement_circuit()
+        with mock.patch.dict(app.config, {'SIMULATION_SHARDS': 2, 'SIMULATION_SHARD_MIN_QUBITS': 2,
+                                          'SIMULATION_SHARD_MIN_SHOTS': 128}):
+            counts = simulation.run_local_simulation(circuit, 1000, seed=42)
+
+            self.assertEqual(sum(counts.values()), 1000)
+            self.assertEqual(simulation.run_local_simulation(circuit, 1000, seed=42), counts)
+
+
+class SimulationPlanTestCase(unittest.TestCase):
+
+    def assertEqualUpToGlobalPhase(self, first, second):
+        unitary, expected = first.get_unitary(), second.get_unitary()
+        index = np.unravel_index(np.argmax(np.abs(expected)), expected.shape)
+        np.testing.assert_allclose(unitary * (expected[index] / unitary[index]), expected, atol=1e-9)
+
+    def test_clifford_tk1_gates_are_rewritten(self):
+        for angles in itertools.product([0, 0.5, 1, 1.5, -0.5], repeat=3):
+            with self.subTest(angles=angles):
+                circuit = Circuit(2).add_gate(OpType.TK1, list(angles), [0]).CX(0, 1)
+                stabilizer_circuit = simulation.get_stabilizer_circuit(circuit)
+
+                self.assertTrue(all(command.op.type in simulation.STABILIZER_OP_TYPES
+                                    for command in stabilizer_circuit.get_commands()))
+                self.assertEqualUpToGlobalPhase(stabilizer_circuit, circuit)
+
+    def test_non_clifford_circuits_have_no_stabilizer_circuit(self):
+        self.assertIsNone(simulation.get_stabilizer_circuit(Circuit(1).T(0)))
+        self.assertIsNone(simulation.get_stabilizer_circuit(Circuit(1).add_gate(OpType.TK1, [0.25, 0, 0], [0])))
+        self.assertIsNone(simulation.get_stabilizer_circuit(
+            Circuit(1).add_gate(OpType.TK1, [Symbol('a'), 0, 0], [0])))
+
+    def test_plan_simulation(self):
+        with mock.patch.dict(app.config, {'SIMULATION_MEMORY_LIMIT': 2 ** 30, 'SIMULATION_MPS_MIN_QUBITS': 20}):
+            clifford = Circuit(40).H(0)
+            for qubit in range(39):
+                clifford.CX(qubit, qubit + 1)
+            self.assertEqual(simulation.plan_simulation(clifford.measure_all()).method, simulation.STABILIZER)
+
+            small = Circuit(3).T(0).CX(0, 1).CX(1, 2).measure_all()
+            self.assertEqual(simulation.plan_simulation(small).method, simulation.STATEVECTOR)
+
+            # a chain of nearest-neighbour gates keeps the bond dimensions small
+            chain = Circuit(40).T(0)
+            for qubit in range(39):
+                chain.CX(qubit, qubit + 1)
+            self.assertEqual(simulation.plan_simulation(chain.measure_all()).method,
+                             simulation.MATRIX_PRODUCT_STATE)
+
+            entangled = Circuit(40)
+            for layer in range(10):
+                for qubit in range(40):
+                    entangled.T(qubit).CX(qubit, (qubit + 20) % 40)
+            with self.assertRaises(simulation.SimulationMemoryException):
+                simulation.plan_simulation(entangled.measure_all())
+
+
+if __name__ == "__main__":
+    unittest.main()
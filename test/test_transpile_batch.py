@@ -0,0 +1,106 @@
+# ******************************************************************************
+#  Copyright (c) 2026 University of Stuttgart
+#
+#  See the NOTICE file(s) distributed with this work for additional
+#  information regarding copyright ownership.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# ******************************************************************************
+
+
+import base64
+import os
+import unittest
+from unittest import mock
+
+from app.config import basedir
+from app import app, db, transpile_handler
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+TOKEN = {'token': {'rawValue': 'token', 'type': 'Unknown'}}
+TARGETS = [{'provider': 'ibmq', 'qpu-name': 'aer_simulator'}]
+PYTKET_IMPLEMENTATION = base64.b64encode(b"""
+from pytket import Circuit
+
+def get_circuit(**kwargs):
+    return Circuit(1).H(0).measure_all()
+""").decode()
+
+
+class TranspileBatchTestCase(unittest.TestCase):
+
+    def setUp(self):
+        app.app_context().push()
+        # setup environment variables for testing
+        app.config['TESTING'] = True
+        app.config['WTF_CSRF_ENABLED'] = False
+        app.config['SQLALCHEMY_DATABASE_URI'] = "sqlite:///" + os.path.join(basedir, 'test.db')
+
+        self.client = app.test_client()
+        db.create_all()
+
+        with open(os.path.join(DATA_DIR, 'hadamard.py'), 'rb') as f:
+            self.hadamard = base64.b64encode(f.read()).decode()
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+
+    def transpile_batch(self, implementations):
+        response = self.client.post('/pytket-service/api/v1.0/transpile-batch',
+                                    json={'implementations': implementations, 'targets': TARGETS})
+        self.assertEqual(response.status_code, 200)
+        return response.get_json()
+
+    def test_transpile_batch(self):
+        broken = base64.b64encode(b"def get_circuit(**kwargs):\n    raise ValueError('broken')\n").decode()
+        json_data = self.transpile_batch([
+            {'impl-data': self.hadamard, 'impl-language': 'Qiskit', 'input-params': TOKEN},
+            {'impl-data': broken, 'impl-language': 'Qiskit', 'input-params': TOKEN}])
+
+        self.assertEqual(len(json_data['implementations']), 2)
+        hadamard_cell, broken_cell = [row[0] for row in json_data['results']]
+        self.assertEqual(hadamard_cell['qpu-name'], 'aer_simulator')
+        self.assertEqual(hadamard_cell['width'], 1)
+        self.assertEqual(hadamard_cell['original-width'], 1)
+        self.assertIn("transpiled-qasm", hadamard_cell)
+        self.assertIn("error", broken_cell)
+        self.assertEqual(broken_cell['qpu-name'], 'aer_simulator')
+
+    def test_conversion_failure_is_reported_per_cell(self):
+        with mock.patch.object(transpile_handler.conversion_strategy, 'convert_circuit',
+                               side_effect=RuntimeError("conversion failed")):
+            json_data = self.transpile_batch([{'impl-data': self.hadamard, 'impl-language': 'Qiskit',
+                                               'input-params': TOKEN}])
+
+        self.assertEqual(json_data['results'][0][0]['error'], "conversion failed")
+
+    def test_batch_shares_cache_entries_with_transpile(self):
+        request = {'impl-data': PYTKET_IMPLEMENTATION, 'impl-language': 'pytket', 'input-params': TOKEN,
+                   'provider': 'ibmq', 'qpu-name': 'aer_simulator'}
+        with mock.patch.object(transpile_handler.circuit_cache, 'store_compiled_circuit_response') as store:
+            response = self.client.post('/pytket-service/api/v1.0/transpile', json=request)
+        self.assertEqual(response.status_code, 200)
+        cache_key = store.call_args.args[0]
+
+        # the batch is compiled in forked processes, which inherit the patched cache lookup
+        with mock.patch.object(transpile_handler.circuit_cache, 'get_compiled_circuit_response',
+                               side_effect=lambda key: {'cached': True} if key == cache_key else None):
+            json_data = self.transpile_batch([{'impl-data': PYTKET_IMPLEMENTATION, 'impl-language': 'pytket',
+                                               'input-params': TOKEN}])
+
+        self.assertTrue(json_data['results'][0][0].get('cached'))
+
+
+if __name__ == "__main__":
+    unittest.main()
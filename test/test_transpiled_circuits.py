@@ -0,0 +1,107 @@
+# ******************************************************************************
+#  Copyright (c) 2026 University of Stuttgart
+#
+#  See the NOTICE file(s) distributed with this work for additional
+#  information regarding copyright ownership.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# ******************************************************************************
+
+import json
+import os
+import unittest
+from unittest import mock
+
+from app.config import basedir
+from app import app, db, tasks
+from app.transpiled_circuit_model import Transpiled_Circuit
+
+IMPLEMENTATION = """
+from pytket import Circuit
+
+def get_circuit(**kwargs):
+    return Circuit(1).H(0).measure_all()
+"""
+
+
+class TranspiledCircuitsTestCase(unittest.TestCase):
+
+    def setUp(self):
+        app.app_context().push()
+        # setup environment variables for testing
+        app.config['TESTING'] = True
+        app.config['WTF_CSRF_ENABLED'] = False
+        app.config['SQLALCHEMY_DATABASE_URI'] = "sqlite:///" + os.path.join(basedir, 'test.db')
+
+        self.client = app.test_client()
+        db.create_all()
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+
+    def test_transpile_async(self):
+        # prepare the request
+        request = {
+            'impl-url': "https://raw.githubusercontent.com/PlanQK/qiskit-service/master/test/data/hadamard.py",
+            'impl-language': 'Qiskit',
+            'qpu-name': "aer_simulator",
+            'provider': "ibmq",
+            'input-params': {'token': {'rawValue': "token", 'type': "Unknown"}},
+            'async': True
+        }
+
+        # send the request
+        with mock.patch.object(app.transpile_queue, 'enqueue') as enqueue:
+            enqueue.return_value.get_id.return_value = "job-1"
+            response = self.client.post('/pytket-service/api/v1.0/transpile', json=request)
+
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response.get_json()['Location'], '/pytket-service/api/v1.0/transpiled-circuits/job-1')
+        self.assertEqual(enqueue.call_args.args[0], 'app.tasks.transpile')
+
+        response = self.client.get('/pytket-service/api/v1.0/transpiled-circuits/job-1')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json(), {'id': "job-1", 'complete': False})
+
+    @mock.patch.object(tasks, 'get_current_job')
+    def test_transpile_job(self, get_current_job):
+        get_current_job.return_value.get_id.return_value = "job-1"
+        db.session.add(Transpiled_Circuit(id="job-1", backend='aer_simulator', provider='ibmq'))
+        db.session.commit()
+
+        tasks.transpile(None, IMPLEMENTATION, 'pytket', {'token': "token"}, 'ibmq', 'aer_simulator')
+
+        response = self.client.get('/pytket-service/api/v1.0/transpiled-circuits/job-1')
+        json_data = response.get_json()
+        self.assertTrue(json_data['complete'])
+        self.assertEqual(json_data['backend'], 'aer_simulator')
+        self.assertIn("transpiled-qasm", json_data)
+        self.assertEqual(json_data['width'], 1)
+
+    @mock.patch.object(tasks.transpile_handler, 'transpile', side_effect=RuntimeError("conversion failed"))
+    @mock.patch.object(tasks, 'get_current_job')
+    def test_failed_transpile_job_completes(self, get_current_job, transpile):
+        get_current_job.return_value.get_id.return_value = "job-1"
+        db.session.add(Transpiled_Circuit(id="job-1", backend='aer_simulator', provider='ibmq'))
+        db.session.commit()
+
+        tasks.transpile(None, "", 'Qiskit', {}, 'ibmq', 'aer_simulator')
+
+        transpiled_circuit = Transpiled_Circuit.query.get("job-1")
+        self.assertTrue(transpiled_circuit.complete)
+        self.assertEqual(json.loads(transpiled_circuit.response), {'error': "conversion failed"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+# ******************************************************************************
+#  Copyright (c) 2026 University of Stuttgart
+#
+#  See the NOTICE file(s) distributed with this work for additional
+#  information regarding copyright ownership.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# ******************************************************************************
+
+import random
+import sys
+import unittest
+from collections import Counter
+from unittest import mock
+
+import rq
+
+from app import app, execute_queues, worker
+from app.worker import InProcessWorker, WeightedWorker
+
+
+class WorkerTestCase(unittest.TestCase):
+
+    def test_in_process_worker_does_not_fork(self):
+        self.assertIs(InProcessWorker.execute_job, rq.SimpleWorker.execute_job)
+        self.assertIs(WeightedWorker.execute_job, rq.Worker.execute_job)
+        self.assertIs(InProcessWorker.reorder_queues, WeightedWorker.reorder_queues)
+
+    def test_queues_come_first_proportional_to_their_weight(self):
+        # the queues are only reordered, so the worker does not need a connection
+        weighted_worker = WeightedWorker.__new__(WeightedWorker)
+        weighted_worker.queues = execute_queues.get_execute_queues()
+        random.seed(0)
+        with mock.patch.dict(app.config, {'EXECUTE_QUEUE_WEIGHTS': 'local-simulator=6,remote-simulator=3,qpu=1',
+                                          'EXECUTE_PRIORITY_WEIGHTS': 'high=4,normal=1'}):
+            weights = execute_queues.get_queue_weights()
+            first_queues = Counter()
+            for _ in range(20000):
+                weighted_worker.reorder_queues(None)
+                first_queues[weighted_worker._ordered_queues[0].name] += 1
+
+        self.assertEqual(sorted(queue.name for queue in weighted_worker._ordered_queues),
+                         sorted(queue.name for queue in weighted_worker.queues))
+        for name, weight in weights.items():
+            with self.subTest(queue=name):
+                self.assertAlmostEqual(first_queues[name] / 20000, weight / sum(weights.values()), delta=0.02)
+
+    def run_main(self, *arguments):
+        with mock.patch.object(sys, 'argv', ['app.worker', *arguments]), \
+                mock.patch.object(worker, 'preload') as preload, \
+                mock.patch.object(worker, 'WeightedWorker') as weighted_worker, \
+                mock.patch.object(worker, 'InProcessWorker') as in_process_worker:
+            worker.main()
+        return preload, weighted_worker, in_process_worker
+
+    def test_main(self):
+        preload, weighted_worker, in_process_worker = self.run_main('--with-scheduler')
+
+        preload.assert_called_once()
+        in_process_worker.assert_not_called()
+        queues = weighted_worker.call_args.args[0]
+        self.assertEqual([queue.name for queue in queues],
+                         [queue.name for queue in execute_queues.get_service_queues()])
+        weighted_worker.return_value.work.assert_called_once_with(burst=False, with_scheduler=True, max_jobs=None)
+
+    def test_main_in_process(self):
+        preload, weighted_worker, in_process_worker = self.run_main('--in-process', '--no-preload', '--max-jobs',
+                                                                    '50', 'pytket-service_transpile')
+
+        preload.assert_not_called()
+        weighted_worker.assert_not_called()
+        self.assertEqual([queue.name for queue in in_process_worker.call_args.args[0]], ['pytket-service_transpile'])
+        in_process_worker.return_value.work.assert_called_once_with(burst=False, with_scheduler=False, max_jobs=50)
+
+    def test_preload_does_not_simulate(self):
+        with mock.patch('pytket.extensions.qiskit.AerBackend.process_circuits') as process_circuits:
+            worker.preload()
+
+        process_circuits.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()